@@ -0,0 +1,327 @@
+"""
+타임테이블 화면 성능 측정 (벤치마크)
+SQLite 백엔드에 가상 데이터(업체+법인 K개, 특수 시간 D일)를 만들고 주요 화면 작업의 시간을 측정
+
+- refresh_timetable: 날짜 이동 (그리드 구조 재사용) / 전체 다시 그리기
+- 셀 드래그: 특수 행 N칸 토글 + 드래그 종료 저장 (사유 입력 창 제외)
+- update_total_extra_time: 합계 레이블 갱신
+- show_period_summary: 통계 창 열기 + N일 기간 조회
+작업마다 실행 시간(ms), DB 쿼리 수(execute/executemany), 위젯/Canvas 항목 생성 수를 JSON으로 출력
+
+사용법: python benchmark.py [--corps 12] [--days 31] [--drag-cells 20] [--repeat 5] [--output result.json]
+화면 없이 실행: xvfb-run python benchmark.py (메인 창은 숨긴 상태로 측정)
+"""
+
+import sys
+sys.path.append('.')
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+import tkinter as tk
+
+import database
+import local_replica
+from sqlite_database import SQLiteDatabase
+from version import VERSION
+
+COMPANIES = ["롯데마트", "롯데슈퍼", "지에스", "이마트", "홈플러스", "코스트코"]
+
+# 기본 업무 시간 (시작 시간대 후보, 길이 - 30분 칸 수)
+START_SLOTS = ["08:30", "09:00", "10:00", "13:00", "15:30", "18:00"]
+SHIFT_SLOTS = 16
+
+
+class Counters:
+    """측정 중 DB 쿼리 / 위젯 / Canvas 항목 생성 수 (작업 스레드에서도 증가)"""
+
+    NAMES = ("queries", "replica_queries", "widgets", "canvas_items")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = dict.fromkeys(self.NAMES, 0)
+
+    def add(self, name, count=1):
+        with self.lock:
+            self.values[name] += count
+
+    def reset(self):
+        with self.lock:
+            self.values = dict.fromkeys(self.NAMES, 0)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.values)
+
+
+class _CountingCursor:
+    """execute / executemany 호출 수를 세는 커서 (나머지는 원래 커서 그대로)"""
+
+    def __init__(self, cursor, counters, name):
+        self._cursor = cursor
+        self._counters = counters
+        self._name = name
+
+    def execute(self, *args):
+        self._counters.add(self._name)
+        return self._cursor.execute(*args)
+
+    def executemany(self, *args):
+        self._counters.add(self._name)
+        return self._cursor.executemany(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def install_counters(counters):
+    """SQLite 커서와 Tk 위젯/Canvas 항목 생성에 계수기 연결"""
+    cursor_property = SQLiteDatabase.cursor
+
+    def counting_cursor(db):
+        cursor = cursor_property.fget(db)
+        if cursor is None:
+            return None
+        name = "replica_queries" if isinstance(db, local_replica.LocalReplica) else "queries"
+        return _CountingCursor(cursor, counters, name)
+    SQLiteDatabase.cursor = property(counting_cursor)
+
+    widget_setup = tk.BaseWidget._setup
+
+    def counting_setup(widget, master, cnf):
+        counters.add("widgets")
+        return widget_setup(widget, master, cnf)
+    tk.BaseWidget._setup = counting_setup
+
+    canvas_create = tk.Canvas._create
+
+    def counting_create(canvas, item_type, args, kw):
+        counters.add("canvas_items")
+        return canvas_create(canvas, item_type, args, kw)
+    tk.Canvas._create = counting_create
+
+
+def seed_database(corps, days, seed):
+    """가상 기본 업무 템플릿 + 오늘까지 days일의 특수 시간 생성 - (사용자, 시작일)"""
+    from timetable_manager import TimeTableManager
+
+    manager = TimeTableManager()
+    try:
+        for i in range(corps):
+            start_slot = START_SLOTS[i % len(START_SLOTS)]
+            start_idx = manager.time_slots.index(start_slot)
+            end_idx = min(start_idx + SHIFT_SLOTS, len(manager.time_slots) - 1)
+            manager.add_default_task(start_slot, f"법인{i + 1:02d}", "벤치마크",
+                                     COMPANIES[i % len(COMPANIES)], manager.time_slots[end_idx], i + 1)
+
+        template = manager.get_template_index()
+        rng = random.Random(seed)
+        start_date = date.today() - timedelta(days=days - 1)
+        for offset in range(days):
+            work_date = start_date + timedelta(days=offset)
+            items = []
+            for company, corp_name in template.corps:
+                # 기본 업무 시간대 중 일부를 끄고 범위 밖 몇 칸을 켬
+                for time_slot in template.covered_slots((company, corp_name)):
+                    items.append((company, corp_name, time_slot, rng.random() > 0.1))
+                for time_slot in rng.sample(manager.time_slots, 2):
+                    items.append((company, corp_name, time_slot, True))
+            outcomes = manager.db.save_special_times_bulk(work_date, items, None, template.base_minutes)
+            if "failed" in outcomes:
+                raise RuntimeError(f"특수 시간 생성 실패: {work_date}")
+
+        return manager.db.get_user_by_username('admin'), start_date
+    finally:
+        manager.close()
+
+
+def wait_for_worker(app, timeout=30):
+    """DB 작업 스레드의 결과가 모두 화면에 전달될 때까지 이벤트 처리"""
+    deadline = time.perf_counter() + timeout
+    while app.db_worker.pending:
+        if time.perf_counter() > deadline:
+            raise TimeoutError("DB 작업이 끝나지 않았습니다.")
+        app.root.update()
+        time.sleep(0.001)
+    app.root.update_idletasks()
+
+
+def measure(counters, run, repeat, setup=None):
+    """run()을 repeat번 실행 - 실행 시간(ms)과 회당 평균 카운터"""
+    durations = []
+    totals = dict.fromkeys(Counters.NAMES, 0)
+    for _ in range(repeat):
+        if setup:
+            setup()
+        counters.reset()
+        started = time.perf_counter()
+        run()
+        durations.append((time.perf_counter() - started) * 1000)
+        for name, value in counters.snapshot().items():
+            totals[name] += value
+    result = {
+        "runs": repeat,
+        "ms": {
+            "min": round(min(durations), 2),
+            "median": round(statistics.median(durations), 2),
+            "max": round(max(durations), 2),
+        },
+    }
+    result.update({name: round(total / repeat, 1) for name, total in totals.items()})
+    return result
+
+
+def find_widgets(parent, widget_type):
+    """parent 아래의 widget_type 위젯 (생성 순)"""
+    found = []
+    for child in parent.winfo_children():
+        if isinstance(child, widget_type):
+            found.append(child)
+        found.extend(find_widgets(child, widget_type))
+    return found
+
+
+def run_benchmarks(app, counters, start_date, args):
+    root = app.root
+    results = {}
+
+    # 1. 날짜 이동 - 같은 템플릿이므로 그리드 구조를 재사용하고 특수 행만 갱신
+    def refresh():
+        app.refresh_timetable()
+        wait_for_worker(app)  # 조회는 작업 스레드에서 - 결과로 다시 그릴 때까지
+    results["refresh_timetable"] = measure(counters, refresh, args.repeat)
+
+    # 2. 전체 다시 그리기 (템플릿 변경 / 창 크기 변경 시)
+    def force_full_layout():
+        app.grid_layout_key = None
+    results["refresh_timetable_full"] = measure(counters, refresh, args.repeat, setup=force_full_layout)
+
+    # 3. 셀 드래그 - 첫 업체+법인 특수 행을 N칸 토글 후 드래그 종료 (쓰기 버퍼 저장까지)
+    special_row = min(row for (row, col) in app.grid.cell_info if app.grid.is_special_cell(row, col))
+    cols = sorted(col for (row, col) in app.grid.cell_info
+                  if row == special_row and app.grid.is_special_cell(row, col))[:args.drag_cells]
+    app.show_reason_dialog = lambda company, corp_name: None  # 사유 입력 창은 사용자 입력 대기이므로 제외
+
+    def drag():
+        app.on_cell_drag_start(special_row, cols[0])
+        for col in cols[1:]:
+            app.on_cell_drag_motion(special_row, col)
+        app.on_cell_drag_end()
+        wait_for_worker(app)
+    results["cell_drag"] = measure(counters, drag, args.repeat)
+    results["cell_drag"]["cells"] = len(cols)
+
+    # 4. 합계 레이블 갱신
+    results["update_total_extra_time"] = measure(counters, app.update_total_extra_time, args.repeat)
+
+    # 5. 기간별 통계 - 창 열기 + 기간 조회 (작업 스레드 결과 표시까지)
+    from tkcalendar import DateEntry
+    from main import RoundedButton
+
+    windows = []
+
+    def open_summary():
+        before = set(root.winfo_children())
+        app.show_period_summary()
+        root.update_idletasks()
+        windows.extend(child for child in root.winfo_children()
+                       if child not in before and isinstance(child, tk.Toplevel))
+
+    def close_summaries():
+        while windows:
+            windows.pop().destroy()
+    results["show_period_summary_open"] = measure(counters, open_summary, args.repeat, setup=close_summaries)
+
+    summary_window = windows[-1]
+    start_entry, end_entry = find_widgets(summary_window, DateEntry)[:2]
+    query_button = next(button for button in find_widgets(summary_window, RoundedButton) if button.text == "조회")
+    start_entry.set_date(start_date)
+    end_entry.set_date(start_date + timedelta(days=args.days - 1))
+
+    def query_period():
+        query_button.command()
+        wait_for_worker(app)
+    results["show_period_summary_query"] = measure(counters, query_period, args.repeat)
+    results["show_period_summary_query"]["days"] = args.days
+    close_summaries()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타임테이블 화면 성능 측정 (SQLite 가상 데이터)")
+    parser.add_argument("--corps", type=int, default=12, help="업체+법인 수 (기본 12)")
+    parser.add_argument("--days", type=int, default=31, help="특수 시간 데이터 일수 / 기간 통계 일수 (기본 31)")
+    parser.add_argument("--drag-cells", type=int, default=20, help="드래그할 셀 수 (기본 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="작업별 반복 횟수 (기본 5)")
+    parser.add_argument("--seed", type=int, default=1, help="가상 데이터 난수 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 (없으면 화면 출력)")
+    parser.add_argument("--keep", action="store_true", help="측정용 DB 폴더를 지우지 않음")
+    args = parser.parse_args()
+
+    # 측정용 임시 DB (운영 서버 / data 폴더의 복제본은 건드리지 않음)
+    work_dir = tempfile.mkdtemp(prefix="timetable_benchmark_")
+    database.DB_CONFIG['backend'] = 'sqlite'
+    database.DB_CONFIG['sqlite_path'] = os.path.join(work_dir, 'timetable.db')
+    local_replica.get_replica_path = lambda: os.path.join(work_dir, 'replica.db')
+
+    try:
+        user, start_date = seed_database(args.corps, args.days, args.seed)
+
+        from main import TimeTableGUI
+
+        counters = Counters()
+        install_counters(counters)
+
+        root = tk.Tk()
+        root.withdraw()
+        counters.reset()
+        started = time.perf_counter()
+        app = TimeTableGUI(root, user)
+        wait_for_worker(app)
+        startup_ms = (time.perf_counter() - started) * 1000
+        startup = {"runs": 1, "ms": {"min": round(startup_ms, 2)}, **counters.snapshot()}
+
+        try:
+            results = {"startup": startup, **run_benchmarks(app, counters, start_date, args)}
+        finally:
+            app.on_closing()
+
+        report = {
+            "version": VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {
+                "corps": args.corps,
+                "days": args.days,
+                "drag_cells": args.drag_cells,
+                "repeat": args.repeat,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+            print(f"결과 저장: {args.output}")
+        else:
+            print(text)
+    finally:
+        if args.keep:
+            print(f"측정용 DB: {work_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,25 @@
-import pyodbc
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, ExitStack
+from datetime import timedelta
+from db_backend import DatabaseBackend, TransactionScope, TransactionConnection, changed_logs, day_start
+import query_stats
+
+# pyodbc는 MSSQL 백엔드에서만 필요 (SQLite 백엔드로 테스트/벤치마크할 때는 없어도 됨)
+try:
+    import pyodbc
+    PYODBC_AVAILABLE = True
+except ImportError:
+    pyodbc = None
+    PYODBC_AVAILABLE = False
+
 
 def get_odbc_driver():
     """설치된 ODBC 드라이버 자동 감지"""
+    if not PYODBC_AVAILABLE:
+        return '{SQL Server}'
     drivers = [x for x in pyodbc.drivers() if 'SQL Server' in x]
     # 우선순위: ODBC Driver 18 > 17 > 13 > SQL Server
     for preferred in ['ODBC Driver 18 for SQL Server', 'ODBC Driver 17 for SQL Server',
@@ -19,20 +37,332 @@ DB_CONFIG = {
     'database': 'LogisticsDB',
     'username': 'gwai',
     'password': '20260101!',
-    'driver': get_odbc_driver()
+    'driver': get_odbc_driver(),
+    'backend': 'mssql',  # 'mssql' 또는 'sqlite' (테스트/벤치마크용 로컬 DB)
+    'sqlite_path': None,  # sqlite 백엔드 DB 파일 (없으면 data/timetable.db)
 }
 
 
-class Database:
-    """MSSQL 데이터베이스 연결 및 관리 클래스"""
+def create_database():
+    """DB_CONFIG['backend']에 맞는 Database 생성 (연결은 호출 측에서 connect())"""
+    backend = DB_CONFIG.get('backend', 'mssql')
+    if backend == 'sqlite':
+        from sqlite_database import SQLiteDatabase
+        return SQLiteDatabase(DB_CONFIG.get('sqlite_path'))
+    if backend != 'mssql':
+        raise ValueError(f"알 수 없는 DB 백엔드: {backend}")
+    return Database()
+
+# 자주 조회하는 테이블의 인덱스 (이름, 테이블, 키 컬럼, INCLUDE 컬럼, UNIQUE 여부)
+# ensure_indexes()가 없는 것만 생성 (여러 번 실행해도 안전)
+INDEX_DEFINITIONS = [
+    # SpecialTimes (날짜+업체+법인+시간대) UNIQUE 인덱스는 UNIQUE 제약조건을 대신하므로 migrations.py v11에서 생성
+    # 변동 사유 MERGE (날짜+업체+법인) 및 기간별 조회
+    ("UX_SpecialTimeReasons_date_company_corp", "SpecialTimeReasons",
+     "work_date, company, corp_name", "added_time, reason, username, updated_at", True),
+    # 변경 로그 최신순 페이지 조회 (created_at, id 키셋) + 업체/사용자 필터
+    ("IX_ChangeLogs_created_at", "ChangeLogs", "created_at DESC, id DESC", None, False),
+    ("IX_ChangeLogs_company_created_at", "ChangeLogs", "company, created_at DESC, id DESC", None, False),
+    ("IX_ChangeLogs_username_created_at", "ChangeLogs", "username, created_at DESC, id DESC", None, False),
+]
+
+
+class ConnectionPool:
+    """pyodbc 연결 풀
+
+    - 빌려줄 때 일정 시간 이상 쉬던 연결은 SELECT 1로 확인 후 끊겼으면 다시 연결
+    - 연결 실패 시 간격을 늘려가며 재시도
+    - 작업 스레드와 화면 스레드가 서로 다른 연결을 사용하도록 최대 max_size개까지 생성
+    """
+
+    VALIDATE_TIMEOUT = 5  # 연결 확인 쿼리 제한 시간 (초)
+    VALIDATE_AFTER_IDLE = 5  # 이 시간(초) 이상 쉬던 연결만 확인
+    LOGIN_TIMEOUT = 10  # 연결 제한 시간 (초)
+    RECONNECT_DELAYS = (0.5, 1, 2)  # 재연결 간격 (초)
+
+    def __init__(self, conn_str, max_size=4):
+        self.conn_str = conn_str
+        self.max_size = max_size
+        self.idle = deque()  # (연결, 반납 시각)
+        self.size = 0  # 생성된 연결 수 (사용 중 + 대기)
+        self.lock = threading.Condition()
+        self.stats_counter = {"checkouts": 0, "waits": 0, "reconnects": 0, "failures": 0}
+
+    def acquire(self, timeout=30):
+        """연결 빌리기 (모두 사용 중이면 반납될 때까지 대기)"""
+        with self.lock:
+            self.stats_counter["checkouts"] += 1
+            deadline = time.monotonic() + timeout
+            while not self.idle and self.size >= self.max_size:
+                self.stats_counter["waits"] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.lock.wait(remaining):
+                    raise TimeoutError("DB 연결 풀 대기 시간 초과")
+            if self.idle:
+                conn, released_at = self.idle.pop()
+            else:
+                conn, released_at = None, None
+                self.size += 1
+
+        try:
+            if conn is None:
+                return self._open()
+            if time.monotonic() - released_at >= self.VALIDATE_AFTER_IDLE and not self._is_alive(conn):
+                self._close(conn)
+                self._count("reconnects")
+                return self._open()
+            return conn
+        except Exception:
+            with self.lock:
+                self.size -= 1
+                self.lock.notify()
+            raise
+
+    def release(self, conn, broken=False):
+        """연결 반납 (broken=True면 닫고 버림)"""
+        with self.lock:
+            if broken:
+                self.size -= 1
+                self._close(conn)
+            else:
+                self.idle.append((conn, time.monotonic()))
+            self.lock.notify()
+
+    def close_all(self):
+        """대기 중인 연결 모두 닫기"""
+        with self.lock:
+            while self.idle:
+                conn, _ = self.idle.pop()
+                self._close(conn)
+                self.size -= 1
+
+    def stats(self):
+        """풀 상태 (크기, 대기 연결 수, 대기 횟수, 재연결 횟수 등)"""
+        with self.lock:
+            return dict(self.stats_counter, size=self.size, idle=len(self.idle),
+                        in_use=self.size - len(self.idle), max_size=self.max_size)
+
+    def _open(self):
+        """새 연결 생성 (실패 시 간격을 늘려가며 재시도)"""
+        last_error = None
+        for delay in (0,) + self.RECONNECT_DELAYS:
+            if delay:
+                time.sleep(delay)
+            try:
+                return pyodbc.connect(self.conn_str, timeout=self.LOGIN_TIMEOUT)
+            except Exception as e:
+                last_error = e
+                self._count("failures")
+        raise last_error
+
+    def _count(self, name):
+        with self.lock:
+            self.stats_counter[name] += 1
+
+    def _is_alive(self, conn):
+        try:
+            conn.timeout = self.VALIDATE_TIMEOUT
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+        finally:
+            try:
+                conn.timeout = 0
+            except Exception:
+                pass
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# 연결 문자열별 공유 풀
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(conn_str):
+    with _pools_lock:
+        if conn_str not in _pools:
+            _pools[conn_str] = ConnectionPool(conn_str)
+        return _pools[conn_str]
+
+
+def pooled(method):
+    """DB 작업 단위 - 풀에서 연결을 빌려 작업 동안 self.connection / self.cursor로 사용"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # 이미 작업 중이면 (다른 작업 안에서 호출) 같은 연결 사용
+        if getattr(self._local, "connection", None) is not None:
+            return method(self, *args, **kwargs)
+        with self._operation():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class Database(DatabaseBackend):
+    """MSSQL 데이터베이스 연결 및 관리 클래스
+
+    각 작업(메서드)마다 연결 풀에서 연결을 빌려 새 커서로 실행하므로
+    여러 스레드가 같은 연결/커서를 공유하지 않음
+    """
+
+    backend = 'mssql'
 
     def __init__(self):
-        self.connection = None
-        self.cursor = None
+        self.pool = None
         self.db_config = DB_CONFIG
+        self._local = threading.local()  # 현재 스레드의 작업 연결/커서
+        self._session_connection = None  # 작업 밖에서 connection/cursor 사용 시 (스크립트용)
+        self._session_cursor = None
+
+    @property
+    def connection(self):
+        """현재 작업의 연결 (작업 밖에서는 세션 연결을 빌려서 유지)"""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            scopes = getattr(self._local, "scopes", None)
+            return TransactionConnection(conn, scopes) if scopes else conn
+        if self._session_connection is None and self.pool is not None:
+            self._session_connection = self.pool.acquire()
+        return self._session_connection
+
+    @property
+    def cursor(self):
+        """현재 작업의 커서 (작업 밖에서는 세션 커서)"""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is not None:
+            return cursor
+        if self._session_cursor is None and self.connection is not None:
+            self._session_cursor = query_stats.InstrumentedCursor(self.connection.cursor())
+        return self._session_cursor
+
+    @contextmanager
+    def _operation(self):
+        """풀에서 연결을 빌려 새 커서로 작업 (끝나면 반납)"""
+        if self.pool is None:
+            raise RuntimeError("데이터베이스에 연결되지 않았습니다")
+        conn = self.pool.acquire()
+        cursor = query_stats.InstrumentedCursor(conn.cursor())
+        self._local.connection = conn
+        self._local.cursor = cursor
+        self._local.broken = False
+        broken = False
+        try:
+            yield cursor
+        except pyodbc.OperationalError:
+            broken = True
+            raise
+        finally:
+            broken = broken or self._local.broken
+            self._local.connection = None
+            self._local.cursor = None
+            self._local.broken = False
+            try:
+                cursor.close()
+            except Exception:
+                broken = True
+            self.pool.release(conn, broken=broken)
+
+    def _mark_broken(self, error):
+        """연결 오류면 작업이 끝날 때 연결을 버리도록 표시 (메서드가 예외를 잡고 반환해도 적용)"""
+        if getattr(self._local, "connection", None) is not None and \
+                isinstance(error, (pyodbc.OperationalError, pyodbc.InterfaceError)):
+            self._local.broken = True
+
+    @contextmanager
+    def transaction(self):
+        """여러 메서드를 하나의 트랜잭션으로 묶기 (안의 메서드는 커밋하지 않고 끝에서 한 번 커밋)
+
+        with db.transaction() as tx:
+            db.add_change_log(...)
+            db.save_special_time(...)
+        if not tx.ok: ...
+
+        - 안의 메서드가 실패(rollback)하거나 예외가 나면 전체를 되돌림 (예외는 그대로 전달)
+        - 중첩하면 SAVE TRANSACTION 저장점 - 안쪽 범위만 실패하면 저장점까지만 되돌림
+        """
+        scopes = getattr(self._local, "scopes", None)
+        if scopes:
+            scope = TransactionScope(f"sp{len(scopes)}")
+            self.cursor.execute(f"SAVE TRANSACTION {scope.savepoint}")
+            scopes.append(scope)
+            try:
+                yield scope
+            except Exception:
+                scope.failed = True
+                raise
+            finally:
+                scopes.pop()
+                if scope.failed:
+                    try:
+                        self.cursor.execute(f"ROLLBACK TRANSACTION {scope.savepoint}")
+                    except Exception as e:
+                        self._mark_broken(e)
+                        # 트랜잭션 전체가 이미 되돌려졌으면 (심각한 오류) 바깥도 실패
+                        print(f"저장점 되돌리기 오류: {e}")
+                        scopes[-1].failed = True
+                scope.ok = not scope.failed
+            return
+
+        with ExitStack() as stack:
+            if getattr(self._local, "connection", None) is None:
+                stack.enter_context(self._operation())
+            conn = self._local.connection
+            cursor = self._local.cursor
+
+            # 드라이버의 암시적 트랜잭션 대신 BEGIN/COMMIT을 직접 실행 (저장점 사용을 위해)
+            conn.autocommit = True
+            scope = TransactionScope()
+            try:
+                cursor.execute("BEGIN TRANSACTION")
+                self._local.scopes = [scope]
+                try:
+                    yield scope
+                except Exception:
+                    scope.failed = True
+                    raise
+                finally:
+                    self._local.scopes = None
+                    scope.ok = self._end_transaction(cursor, scope.failed)
+            finally:
+                conn.autocommit = False
+
+    def _end_transaction(self, cursor, failed):
+        """transaction() 종료 - 커밋 또는 되돌리기, 커밋 성공 여부 반환"""
+        try:
+            if not failed:
+                cursor.execute("COMMIT TRANSACTION")
+                return True
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"트랜잭션 커밋 오류: {e}")
+        try:
+            cursor.execute("IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION")
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"트랜잭션 되돌리기 오류: {e}")
+        return False
+
+    def pool_stats(self):
+        """연결 풀 상태"""
+        return self.pool.stats() if self.pool else {}
+
+    def is_connected(self):
+        return self.pool is not None
 
     def connect(self):
         """데이터베이스 연결"""
+        if not PYODBC_AVAILABLE:
+            print("데이터베이스 연결 오류: pyodbc가 설치되지 않았습니다")
+            return False
         try:
             # 연결 문자열 생성
             if 'username' in self.db_config:
@@ -57,43 +387,28 @@ class Database:
                     f"Encrypt=no;"
                 )
 
-            self.connection = pyodbc.connect(conn_str)
-            self.cursor = self.connection.cursor()
+            # 연결 풀 준비 후 연결 1개를 빌려 접속 확인
+            pool = get_pool(conn_str)
+            pool.release(pool.acquire())
+            self.pool = pool
             return True
         except Exception as e:
             print(f"데이터베이스 연결 오류: {e}")
             return False
 
     def disconnect(self):
-        """데이터베이스 연결 해제"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
-
-    def create_table(self):
-        """타임테이블 테이블 생성"""
-        try:
-            create_table_query = """
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='TimeTable' AND xtype='U')
-            CREATE TABLE TimeTable (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                work_date DATE NOT NULL,
-                time_slot VARCHAR(10) NOT NULL,
-                task_name NVARCHAR(200),
-                description NVARCHAR(MAX),
-                created_at DATETIME DEFAULT GETDATE(),
-                updated_at DATETIME DEFAULT GETDATE(),
-                CONSTRAINT UQ_TimeTable_Date_Time UNIQUE(work_date, time_slot)
-            )
-            """
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
-            return True
-        except Exception as e:
-            print(f"테이블 생성 오류: {e}")
-            return False
-
+        """데이터베이스 연결 해제 (빌린 세션 연결 반납)"""
+        if self._session_cursor:
+            try:
+                self._session_cursor.close()
+            except Exception:
+                pass
+            self._session_cursor = None
+        if self._session_connection:
+            self.pool.release(self._session_connection)
+            self._session_connection = None
+
+    @pooled
     def insert_or_update_task(self, work_date, time_slot, task_name, description, special_note='', company='', end_time=''):
         """업무 추가 또는 수정 (특수상황, 업체명, 종료시간 포함)"""
         try:
@@ -116,10 +431,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"업무 저장 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def delete_task(self, work_date, time_slot):
         """업무 삭제"""
         try:
@@ -131,10 +448,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"업무 삭제 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def get_tasks_by_date(self, work_date):
         """특정 날짜의 모든 업무 조회 (특수상황, 업체명, 종료시간 포함)"""
         try:
@@ -159,9 +478,11 @@ class Database:
                 }
             return tasks
         except Exception as e:
+            self._mark_broken(e)
             print(f"업무 조회 오류: {e}")
             return {}
 
+    @pooled
     def get_task(self, work_date, time_slot):
         """특정 날짜의 특정 시간 업무 조회 (특수상황, 업체명, 종료시간 포함)"""
         try:
@@ -183,9 +504,11 @@ class Database:
                 }
             return None
         except Exception as e:
+            self._mark_broken(e)
             print(f"업무 조회 오류: {e}")
             return None
 
+    @pooled
     def get_all_dates(self):
         """업무가 등록된 모든 날짜 조회"""
         try:
@@ -198,9 +521,11 @@ class Database:
             rows = self.cursor.fetchall()
             return [row.work_date for row in rows]
         except Exception as e:
+            self._mark_broken(e)
             print(f"날짜 조회 오류: {e}")
             return []
 
+    @pooled
     def copy_tasks_to_date(self, source_date, target_date):
         """특정 날짜의 업무를 다른 날짜로 복사"""
         try:
@@ -218,12 +543,14 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"업무 복사 오류: {e}")
             self.connection.rollback()
             return False
 
     # === 기본 업무 템플릿 관련 메서드 ===
 
+    @pooled
     def get_default_tasks(self):
         """기본 업무 템플릿 전체 조회 (업체명, 종료시간, 표시순서, 색상 포함)"""
         try:
@@ -251,9 +578,33 @@ class Database:
                 }
             return tasks
         except Exception as e:
+            self._mark_broken(e)
             print(f"기본 업무 조회 오류: {e}")
             return {}
 
+    @pooled
+    def get_default_tasks_version(self):
+        """기본 업무 템플릿 변경 확인용 토큰 (행 수, 최종 수정 시각, 내용 체크섬)
+
+        실패 시 None (호출 측에서 다시 조회하도록)
+        """
+        try:
+            query = """
+            SELECT COUNT(*) AS cnt, MAX(updated_at) AS last_updated,
+                   CHECKSUM_AGG(CHECKSUM(time_slot, task_name, description, company,
+                                         end_time, display_order, color)) AS checksum
+            FROM DefaultTasks
+            WHERE is_active = 1
+            """
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            return (row.cnt, row.last_updated, row.checksum)
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"기본 업무 변경 확인 오류: {e}")
+            return None
+
+    @pooled
     def insert_or_update_default_task(self, time_slot, task_name, description, company='', end_time='', display_order=None, color=''):
         """기본 업무 템플릿 추가 또는 수정 (업체명, 종료시간, 표시순서, 색상 포함)"""
         try:
@@ -282,10 +633,50 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"기본 업무 저장 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
+    def shift_display_order(self, from_order, delta=1):
+        """from_order 이상인 기본 업무의 표시 순서를 delta만큼 이동 (UPDATE 1회)
+
+        UPDATE 문 하나로 처리하므로 표시 순서에 UNIQUE 제약조건이 있어도 중간 상태에서 겹치지 않음
+        (delta가 음수면 from_order + delta 이상 from_order 미만 순서가 비어 있어야 함)
+        반환: 이동한 행 수 (실패 시 -1)
+        """
+        try:
+            query = """
+            UPDATE DefaultTasks
+            SET display_order = display_order + ?, updated_at = GETDATE()
+            WHERE display_order >= ?
+            """
+            self.cursor.execute(query, (delta, from_order))
+            shifted = self.cursor.rowcount
+            self.connection.commit()
+            return shifted
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"기본 업무 표시 순서 이동 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    @pooled
+    def insert_default_task_at(self, display_order, time_slot, task_name, description, company='', end_time='', color=''):
+        """기본 업무 템플릿을 지정한 표시 순서에 삽입 (기존 항목은 1씩 뒤로 밀림)
+
+        순서 이동 UPDATE 1회 + 삽입 1회를 하나의 트랜잭션으로 처리 (항목 수와 무관)
+        """
+        with self.transaction() as tx:
+            if self.shift_display_order(display_order, 1) < 0:
+                tx.failed = True  # 순서 이동 실패 - 삽입하지 않고 되돌림
+            else:
+                self.insert_or_update_default_task(time_slot, task_name, description, company, end_time,
+                                                   display_order, color)
+        return tx.ok
+
+    @pooled
     def delete_default_task(self, display_order):
         """기본 업무 템플릿 삭제 (표시순서 기준)"""
         try:
@@ -297,10 +688,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"기본 업무 삭제 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def apply_default_tasks_to_date(self, target_date):
         """기본 업무 템플릿을 특정 날짜에 적용 (업체명, 종료시간 포함)"""
         try:
@@ -318,10 +711,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"기본 업무 적용 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def update_display_order(self, time_slot, display_order):
         """기본 업무 템플릿의 표시 순서 업데이트"""
         try:
@@ -334,14 +729,19 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"표시 순서 업데이트 오류: {e}")
             self.connection.rollback()
             return False
 
     # === 특수 시간 관련 메서드 ===
 
-    def save_special_time(self, work_date, company, corp_name, time_slot, is_colored):
-        """특수 시간 저장 또는 업데이트 (업체명, 법인명 조합)"""
+    @pooled
+    def save_special_time(self, work_date, company, corp_name, time_slot, is_colored, base_minutes=None):
+        """특수 시간 저장 또는 업데이트 (업체명, 법인명 조합)
+
+        base_minutes: 기본 업무 시간(분) - 주어지면 일별 추가 시간 집계도 함께 갱신
+        """
         try:
             query = """
             MERGE SpecialTimes AS target
@@ -359,13 +759,146 @@ class Database:
                 is_colored,
                 work_date, company, corp_name, time_slot, is_colored
             ))
+            if base_minutes is not None:
+                self._update_daily_extra_time(work_date, {(company, corp_name): base_minutes})
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 저장 오류: {e}")
             self.connection.rollback()
             return False
 
+    def _stage_special_times(self, rows):
+        """특수 시간 행을 임시 테이블(#SpecialTimesStage)에 한 번에 적재 (커밋은 호출 측에서)
+
+        rows: [(row_no, company, corp_name, time_slot, is_colored), ...]
+        연결 풀에서 재사용되는 연결이므로 임시 테이블이 남아 있으면 비우고 다시 사용
+        """
+        self.cursor.execute("""
+        IF OBJECT_ID('tempdb..#SpecialTimesStage') IS NULL
+            CREATE TABLE #SpecialTimesStage (
+                row_no INT NOT NULL PRIMARY KEY,
+                company NVARCHAR(50) NOT NULL,
+                corp_name NVARCHAR(50) NULL,
+                time_slot VARCHAR(10) NOT NULL,
+                is_colored BIT NOT NULL
+            )
+        ELSE
+            TRUNCATE TABLE #SpecialTimesStage
+        """)
+        self._fast_executemany("""
+        INSERT INTO #SpecialTimesStage (row_no, company, corp_name, time_slot, is_colored)
+        VALUES (?, ?, ?, ?, ?)
+        """, rows)
+
+    def _fast_executemany(self, query, rows):
+        """executemany를 fast_executemany로 실행 (파라미터 배열을 한 번에 전송)"""
+        self.cursor.fast_executemany = True
+        try:
+            self.cursor.executemany(query, rows)
+        finally:
+            self.cursor.fast_executemany = False
+
+    @pooled
+    def save_special_times_bulk(self, work_date, changes, logs=None, base_minutes=None):
+        """특수 시간 여러 건을 MERGE 1회로 저장 + 변경 로그를 하나의 트랜잭션으로 처리
+
+        changes: [(company, corp_name, time_slot, is_colored), ...]
+        logs: [(log_type, company, corp_name, time_slot, action, old_value, new_value,
+                user_id, username, display_name), ...]
+        base_minutes: {(company, corp_name): 기본 업무 시간(분)} - 일별 추가 시간 집계 갱신용
+        반환: changes 순서대로 결과 목록
+              "inserted" / "updated" / "unchanged"(이미 같은 값) / "duplicate"(뒤의 같은 셀 값으로 저장)
+              / "failed"(트랜잭션 실패 - 모든 행)
+        """
+        if not changes:
+            return []
+
+        # 같은 셀이 여러 번 있으면 마지막 값만 저장 (MERGE 원본에 같은 키가 두 번 있으면 오류)
+        last_row = {}
+        for row_no, (company, corp_name, time_slot, is_colored) in enumerate(changes):
+            last_row[(company, corp_name, time_slot)] = row_no
+        outcomes = ["duplicate"] * len(changes)
+        rows = []
+        for row_no in sorted(last_row.values()):
+            company, corp_name, time_slot, is_colored = changes[row_no]
+            rows.append((row_no, company, corp_name, time_slot, bool(is_colored)))
+            outcomes[row_no] = "unchanged"
+
+        try:
+            self._stage_special_times(rows)
+            self.cursor.execute("""
+            MERGE SpecialTimes AS target
+            USING (SELECT row_no, company, corp_name, time_slot, is_colored FROM #SpecialTimesStage) AS source
+            ON (target.work_date = ? AND target.company = source.company
+                AND target.corp_name = source.corp_name AND target.time_slot = source.time_slot)
+            WHEN MATCHED AND ISNULL(target.is_colored, 0) <> source.is_colored THEN
+                UPDATE SET is_colored = source.is_colored, updated_at = GETDATE()
+            WHEN NOT MATCHED THEN
+                INSERT (work_date, company, corp_name, time_slot, is_colored)
+                VALUES (?, source.company, source.corp_name, source.time_slot, source.is_colored)
+            OUTPUT source.row_no, $action AS merge_action;
+            """, (work_date, work_date))
+            for row in self.cursor.fetchall():
+                outcomes[row.row_no] = "inserted" if row.merge_action == "INSERT" else "updated"
+
+            # 이미 같은 값이었거나 뒤의 같은 셀로 대체된 변경은 로그에 남기지 않음
+            logs = changed_logs(changes, outcomes, logs)
+            if logs:
+                self._fast_executemany("""
+                INSERT INTO ChangeLogs (log_type, work_date, company, corp_name, time_slot,
+                                       action, old_value, new_value, user_id, username, display_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(log[0], work_date) + tuple(log[1:]) for log in logs])
+
+            if base_minutes:
+                self._update_daily_extra_time(work_date, base_minutes)
+
+            self.connection.commit()
+            return outcomes
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"특수 시간 일괄 저장 오류: {e}")
+            self.connection.rollback()
+            return ["failed"] * len(changes)
+
+    @pooled
+    def materialize_special_times(self, work_date, slots, base_minutes=None):
+        """기본 특수 시간 일괄 생성 (행이 없는 업체+법인명+시간대만 ON으로 INSERT)
+
+        slots: [(company, corp_name, time_slot), ...]
+        base_minutes: {(company, corp_name): 기본 업무 시간(분)} - 일별 추가 시간 집계 갱신용
+        하나의 트랜잭션으로 처리하며 실제로 추가된 행 수를 반환 (실패 시 -1)
+        """
+        if not slots:
+            return 0
+        try:
+            rows = [(row_no, company, corp_name, time_slot, True)
+                    for row_no, (company, corp_name, time_slot) in enumerate(dict.fromkeys(slots))]
+            self._stage_special_times(rows)
+            self.cursor.execute("""
+            INSERT INTO SpecialTimes (work_date, company, corp_name, time_slot, is_colored)
+            SELECT ?, v.company, v.corp_name, v.time_slot, v.is_colored
+            FROM #SpecialTimesStage v
+            WHERE NOT EXISTS (
+                SELECT 1 FROM SpecialTimes s
+                WHERE s.work_date = ? AND s.company = v.company
+                  AND s.corp_name = v.corp_name AND s.time_slot = v.time_slot
+            )
+            """, (work_date, work_date))
+            inserted = max(self.cursor.rowcount, 0)
+            if base_minutes:
+                self._update_daily_extra_time(work_date, base_minutes)
+            self.connection.commit()
+            return inserted
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"기본 특수 시간 일괄 생성 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    @pooled
     def get_special_times(self, work_date, company, corp_name):
         """특정 날짜의 특정 업체+법인명 특수 시간 조회"""
         try:
@@ -384,9 +917,63 @@ class Database:
                     special_times[row.time_slot] = True
             return special_times
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 조회 오류: {e}")
             return {}
 
+    @pooled
+    def get_special_times_for_date(self, work_date):
+        """특정 날짜의 모든 업체+법인명 특수 시간 한 번에 조회
+
+        반환: {(company, corp_name): {time_slot: is_colored}}
+        행이 하나라도 있는 업체+법인명만 키로 포함됨 (키가 없으면 해당 날짜 데이터 없음)
+        """
+        try:
+            query = """
+            SELECT company, corp_name, time_slot, is_colored
+            FROM SpecialTimes
+            WHERE work_date = ?
+            """
+            self.cursor.execute(query, (work_date,))
+            rows = self.cursor.fetchall()
+
+            day_special_times = {}
+            for row in rows:
+                key = (row.company, row.corp_name)
+                day_special_times.setdefault(key, {})[row.time_slot] = bool(row.is_colored)
+            return day_special_times
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"일자별 특수 시간 조회 오류: {e}")
+            return {}
+
+    @pooled
+    def get_day_version(self, work_date):
+        """날짜별 변경 확인용 토큰 (업무/특수 시간의 행 수, 내용 체크섬)
+
+        날짜 이동 캐시가 서버 데이터와 같은지 확인할 때 사용
+        실패 시 None (호출 측에서 다시 조회하도록)
+        """
+        try:
+            query = """
+            SELECT
+                (SELECT COUNT(*) FROM TimeTable WHERE work_date = ?) AS task_count,
+                (SELECT CHECKSUM_AGG(CHECKSUM(time_slot, task_name, description, special_note,
+                                              company, end_time))
+                 FROM TimeTable WHERE work_date = ?) AS task_checksum,
+                (SELECT COUNT(*) FROM SpecialTimes WHERE work_date = ?) AS special_count,
+                (SELECT CHECKSUM_AGG(CHECKSUM(company, corp_name, time_slot, is_colored))
+                 FROM SpecialTimes WHERE work_date = ?) AS special_checksum
+            """
+            self.cursor.execute(query, (work_date,) * 4)
+            row = self.cursor.fetchone()
+            return (row.task_count, row.task_checksum, row.special_count, row.special_checksum)
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"날짜별 변경 확인 오류: {e}")
+            return None
+
+    @pooled
     def delete_special_times_by_date(self, work_date, company, corp_name):
         """특정 날짜의 특정 업체+법인명 특수 시간 삭제"""
         try:
@@ -395,67 +982,21 @@ class Database:
             WHERE work_date = ? AND company = ? AND corp_name = ?
             """
             self.cursor.execute(query, (work_date, company, corp_name))
+            self.cursor.execute("""
+            DELETE FROM DailyExtraTime
+            WHERE work_date = ? AND company = ? AND corp_name = ?
+            """, (work_date, company, corp_name))
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 삭제 오류: {e}")
             self.connection.rollback()
             return False
 
     # === 사용자 인증 관련 메서드 ===
 
-    def create_users_table(self):
-        """사용자 테이블 생성"""
-        try:
-            create_table_query = """
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='Users' AND xtype='U')
-            CREATE TABLE Users (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                username NVARCHAR(50) NOT NULL UNIQUE,
-                password NVARCHAR(255) NOT NULL,
-                display_name NVARCHAR(100),
-                is_active BIT DEFAULT 1,
-                is_admin BIT DEFAULT 0,
-                created_at DATETIME DEFAULT GETDATE(),
-                last_login DATETIME,
-                CONSTRAINT UQ_Users_Username UNIQUE(username)
-            )
-            """
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
-
-            # 기본 관리자 계정이 없으면 생성
-            self.create_default_admin()
-            return True
-        except Exception as e:
-            print(f"사용자 테이블 생성 오류: {e}")
-            return False
-
-    def create_default_admin(self):
-        """기본 관리자 계정 생성"""
-        try:
-            # 관리자 계정이 있는지 확인
-            check_query = "SELECT COUNT(*) as cnt FROM Users WHERE username = 'admin'"
-            self.cursor.execute(check_query)
-            result = self.cursor.fetchone()
-
-            if result.cnt == 0:
-                # 기본 관리자 계정 생성 (비밀번호: admin123)
-                import hashlib
-                password_hash = hashlib.sha256('admin123'.encode()).hexdigest()
-
-                insert_query = """
-                INSERT INTO Users (username, password, display_name, is_active, is_admin)
-                VALUES ('admin', ?, N'관리자', 1, 1)
-                """
-                self.cursor.execute(insert_query, (password_hash,))
-                self.connection.commit()
-                print("기본 관리자 계정이 생성되었습니다. (ID: admin, PW: admin123)")
-            return True
-        except Exception as e:
-            print(f"기본 관리자 계정 생성 오류: {e}")
-            return False
-
+    @pooled
     def authenticate_user(self, username, password):
         """사용자 인증"""
         try:
@@ -484,9 +1025,11 @@ class Database:
                 }
             return None
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 인증 오류: {e}")
             return None
 
+    @pooled
     def get_user_by_username(self, username):
         """사용자명으로 사용자 정보 조회 (자동 로그인용 - 비밀번호 확인 없음)"""
         try:
@@ -512,9 +1055,11 @@ class Database:
                 }
             return None
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 조회 오류: {e}")
             return None
 
+    @pooled
     def get_all_users(self):
         """모든 사용자 조회"""
         try:
@@ -539,9 +1084,11 @@ class Database:
                 })
             return users
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 조회 오류: {e}")
             return []
 
+    @pooled
     def add_user(self, username, password, display_name='', is_admin=False):
         """사용자 추가"""
         try:
@@ -556,10 +1103,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 추가 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def update_user(self, user_id, display_name=None, is_active=None, is_admin=None):
         """사용자 정보 수정"""
         try:
@@ -585,10 +1134,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 수정 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def change_password(self, user_id, new_password):
         """비밀번호 변경"""
         try:
@@ -600,10 +1151,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"비밀번호 변경 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def delete_user(self, user_id):
         """사용자 삭제"""
         try:
@@ -612,41 +1165,14 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"사용자 삭제 오류: {e}")
             self.connection.rollback()
             return False
 
     # === 변경 로그 관련 메서드 ===
 
-    def create_change_log_table(self):
-        """변경 로그 테이블 생성"""
-        try:
-            create_table_query = """
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='ChangeLogs' AND xtype='U')
-            CREATE TABLE ChangeLogs (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                log_type NVARCHAR(50) NOT NULL,
-                work_date DATE,
-                company NVARCHAR(100),
-                corp_name NVARCHAR(100),
-                time_slot VARCHAR(10),
-                action NVARCHAR(50),
-                old_value NVARCHAR(MAX),
-                new_value NVARCHAR(MAX),
-                user_id INT,
-                username NVARCHAR(50),
-                display_name NVARCHAR(100),
-                created_at DATETIME DEFAULT GETDATE(),
-                ip_address NVARCHAR(50)
-            )
-            """
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
-            return True
-        except Exception as e:
-            print(f"변경 로그 테이블 생성 오류: {e}")
-            return False
-
+    @pooled
     def add_change_log(self, log_type, work_date, company, corp_name, time_slot, action,
                        old_value, new_value, user_id, username, display_name):
         """변경 로그 추가"""
@@ -663,24 +1189,29 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"변경 로그 추가 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def get_change_logs(self, start_date=None, end_date=None, log_type=None,
-                        company=None, username=None, limit=500):
-        """변경 로그 조회"""
+                        company=None, username=None, limit=500, before=None):
+        """변경 로그 조회 (최신순)
+
+        before: 이전 페이지 마지막 행의 (created_at, id) - 주어지면 그보다 오래된 로그만 조회 (키셋 페이지)
+        """
         try:
             conditions = []
             params = []
 
-            # created_at 기준으로 날짜 필터 (로그 생성 시간)
+            # created_at 기준으로 날짜 필터 (로그 생성 시간) - 인덱스를 타도록 범위 조건으로
             if start_date:
-                conditions.append("CAST(created_at AS DATE) >= ?")
-                params.append(start_date)
+                conditions.append("created_at >= ?")
+                params.append(day_start(start_date))
             if end_date:
-                conditions.append("CAST(created_at AS DATE) <= ?")
-                params.append(end_date)
+                conditions.append("created_at < ?")
+                params.append(day_start(end_date) + timedelta(days=1))
             if log_type:
                 conditions.append("log_type = ?")
                 params.append(log_type)
@@ -688,8 +1219,13 @@ class Database:
                 conditions.append("company = ?")
                 params.append(company)
             if username:
-                conditions.append("username LIKE ?")
-                params.append(f"%{username}%")
+                conditions.append("username = ?")
+                params.append(username)
+            if before:
+                before_created_at, before_id = before
+                # DATETIME 정밀도(1/300초)로 맞춰 비교해야 같은 시각의 행을 건너뛰거나 중복하지 않음
+                conditions.append("(created_at < CAST(? AS DATETIME) OR (created_at = CAST(? AS DATETIME) AND id < ?))")
+                params.extend([before_created_at, before_created_at, before_id])
 
             where_clause = ""
             if conditions:
@@ -700,7 +1236,7 @@ class Database:
                    action, old_value, new_value, user_id, username, display_name, created_at
             FROM ChangeLogs
             {where_clause}
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, id DESC
             """
             self.cursor.execute(query, params)
             rows = self.cursor.fetchall()
@@ -724,17 +1260,21 @@ class Database:
                 })
             return logs
         except Exception as e:
+            self._mark_broken(e)
             print(f"변경 로그 조회 오류: {e}")
             return []
 
+    @pooled
     def get_logs_by_date_range(self, start_date, end_date, limit=1000):
         """날짜 범위로 로그 조회"""
         return self.get_change_logs(start_date=start_date, end_date=end_date, limit=limit)
 
+    @pooled
     def get_logs_by_user(self, username, limit=500):
         """사용자별 로그 조회"""
         return self.get_change_logs(username=username, limit=limit)
 
+    @pooled
     def delete_old_logs(self, days_to_keep=90):
         """오래된 로그 삭제"""
         try:
@@ -747,37 +1287,14 @@ class Database:
             self.connection.commit()
             return deleted_count
         except Exception as e:
+            self._mark_broken(e)
             print(f"로그 삭제 오류: {e}")
             self.connection.rollback()
             return 0
 
     # === 특수 시간 변동 사유 관련 메서드 ===
 
-    def create_special_time_reasons_table(self):
-        """특수 시간 변동 사유 테이블 생성"""
-        try:
-            create_table_query = """
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='SpecialTimeReasons' AND xtype='U')
-            CREATE TABLE SpecialTimeReasons (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                work_date DATE NOT NULL,
-                company NVARCHAR(100) NOT NULL,
-                corp_name NVARCHAR(100) NOT NULL,
-                added_time INT DEFAULT 0,
-                reason NVARCHAR(500),
-                user_id INT,
-                username NVARCHAR(50),
-                created_at DATETIME DEFAULT GETDATE(),
-                updated_at DATETIME DEFAULT GETDATE()
-            )
-            """
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
-            return True
-        except Exception as e:
-            print(f"특수 시간 변동 사유 테이블 생성 오류: {e}")
-            return False
-
+    @pooled
     def save_special_time_reason(self, work_date, company, corp_name, added_time, reason, user_id=None, username=None):
         """특수 시간 변동 사유 저장 또는 업데이트"""
         try:
@@ -800,10 +1317,12 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 변동 사유 저장 오류: {e}")
             self.connection.rollback()
             return False
 
+    @pooled
     def get_special_time_reason(self, work_date, company, corp_name):
         """특정 업체+법인의 특수 시간 변동 사유 조회"""
         try:
@@ -824,9 +1343,11 @@ class Database:
                 }
             return None
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 변동 사유 조회 오류: {e}")
             return None
 
+    @pooled
     def get_all_special_time_reasons(self, work_date):
         """특정 날짜의 모든 특수 시간 변동 사유 조회"""
         try:
@@ -851,9 +1372,11 @@ class Database:
                 })
             return reasons
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 변동 사유 전체 조회 오류: {e}")
             return []
 
+    @pooled
     def get_special_time_reasons_by_period(self, start_date, end_date):
         """기간별 특수 시간 변동 사유 조회"""
         try:
@@ -879,9 +1402,11 @@ class Database:
                 })
             return reasons
         except Exception as e:
+            self._mark_broken(e)
             print(f"기간별 특수 시간 변동 사유 조회 오류: {e}")
             return []
 
+    @pooled
     def delete_special_time_reason(self, work_date, company, corp_name):
         """특수 시간 변동 사유 삭제"""
         try:
@@ -893,6 +1418,270 @@ class Database:
             self.connection.commit()
             return True
         except Exception as e:
+            self._mark_broken(e)
             print(f"특수 시간 변동 사유 삭제 오류: {e}")
             self.connection.rollback()
             return False
+
+    # === 로컬 복제본 동기화 관련 메서드 ===
+
+    @pooled
+    def get_rows_changed_since(self, table, columns, since=None, from_date=None):
+        """로컬 복제본 갱신용 - from_date 이후 작업일 중 updated_at이 since 이후인 행
+
+        since가 없으면 from_date 이후 전체 (경계 시각의 행은 다시 받아도 덮어쓰기라 안전)
+        실패 시 None
+        """
+        try:
+            query = f"SELECT {', '.join(columns)} FROM {table} WHERE work_date >= ?"
+            params = [from_date]
+            if since is not None:
+                query += " AND updated_at >= CAST(? AS DATETIME)"
+                params.append(since)
+            self.cursor.execute(query, params)
+            return [tuple(row) for row in self.cursor.fetchall()]
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"{table} 변경분 조회 오류: {e}")
+            return None
+
+    @pooled
+    def get_special_time_stamps(self, work_date):
+        """특정 날짜 특수 시간의 updated_at - {(company, corp_name, time_slot): updated_at} (실패 시 None)"""
+        try:
+            query = """
+            SELECT company, corp_name, time_slot, updated_at
+            FROM SpecialTimes
+            WHERE work_date = ?
+            """
+            self.cursor.execute(query, (work_date,))
+            return {(row.company, row.corp_name or '', row.time_slot): row.updated_at
+                    for row in self.cursor.fetchall()}
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"특수 시간 수정 시각 조회 오류: {e}")
+            return None
+
+    # === 일별 추가 시간 집계 (DailyExtraTime) 관련 메서드 ===
+
+    def _update_daily_extra_time(self, work_date, base_minutes):
+        """일별 추가 시간 집계 갱신 (SpecialTimes에서 다시 계산, 커밋은 호출 측에서)
+
+        base_minutes: {(company, corp_name): 기본 업무 시간(분)}
+        """
+        query = """
+        MERGE DailyExtraTime AS target
+        USING (
+            SELECT ? AS work_date, ? AS company, ? AS corp_name, ? AS base_minutes,
+                   (SELECT COUNT(*) FROM SpecialTimes
+                    WHERE work_date = ? AND company = ? AND corp_name = ? AND is_colored = 1) * 30 AS special_minutes
+        ) AS source
+        ON (target.work_date = source.work_date AND target.company = source.company
+            AND target.corp_name = source.corp_name)
+        WHEN MATCHED THEN
+            UPDATE SET special_minutes = source.special_minutes, base_minutes = source.base_minutes,
+                       updated_at = GETDATE()
+        WHEN NOT MATCHED THEN
+            INSERT (work_date, company, corp_name, special_minutes, base_minutes)
+            VALUES (source.work_date, source.company, source.corp_name, source.special_minutes, source.base_minutes);
+        """
+        for (company, corp_name), minutes in base_minutes.items():
+            self.cursor.execute(query, (work_date, company, corp_name, minutes,
+                                        work_date, company, corp_name))
+
+    @pooled
+    def get_daily_extra_by_period(self, start_date, end_date):
+        """기간 일별 추가 시간 집계 조회
+
+        반환: {(work_date, company, corp_name): extra_minutes}
+        집계 행이 없는 날짜/업체는 포함되지 않음 (호출 측에서 -기본 시간으로 처리)
+        """
+        try:
+            query = """
+            SELECT work_date, company, corp_name, extra_minutes
+            FROM DailyExtraTime
+            WHERE work_date >= ? AND work_date <= ?
+            """
+            self.cursor.execute(query, (start_date, end_date))
+            rows = self.cursor.fetchall()
+            return {(row.work_date, row.company, row.corp_name): row.extra_minutes for row in rows}
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"일별 추가 시간 집계 조회 오류: {e}")
+            return {}
+
+    @pooled
+    def rebuild_daily_extra_time(self, base_minutes, start_date=None, end_date=None):
+        """일별 추가 시간 집계 재생성 (SpecialTimes 전체 또는 기간 기준)
+
+        base_minutes: {(company, corp_name): 기본 업무 시간(분)} - 템플릿에 없는 업체는 0
+        반환: 생성된 행 수 (실패 시 -1)
+        """
+        try:
+            conditions = []
+            params = []
+            if start_date:
+                conditions.append("work_date >= ?")
+                params.append(start_date)
+            if end_date:
+                conditions.append("work_date <= ?")
+                params.append(end_date)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            self.cursor.execute(f"DELETE FROM DailyExtraTime {where_clause}", params)
+
+            # 기본 시간 목록 (비어 있으면 VALUES 구문이 안 되므로 빈 행 1개)
+            base_rows = list(base_minutes.items()) or [(("", ""), 0)]
+            values = ", ".join(["(?, ?, ?)"] * len(base_rows))
+            base_params = []
+            for (company, corp_name), minutes in base_rows:
+                base_params.extend((company, corp_name, minutes))
+
+            s_conditions = [c.replace("work_date", "s.work_date") for c in conditions]
+            s_where_clause = f"WHERE {' AND '.join(s_conditions)}" if s_conditions else ""
+            query = f"""
+            INSERT INTO DailyExtraTime (work_date, company, corp_name, special_minutes, base_minutes)
+            SELECT s.work_date, s.company, s.corp_name,
+                   SUM(CASE WHEN s.is_colored = 1 THEN 30 ELSE 0 END),
+                   ISNULL(MAX(b.base_minutes), 0)
+            FROM SpecialTimes s
+            LEFT JOIN (VALUES {values}) AS b(company, corp_name, base_minutes)
+                ON b.company = s.company AND b.corp_name = s.corp_name
+            {s_where_clause}
+            GROUP BY s.work_date, s.company, s.corp_name
+            """
+            self.cursor.execute(query, base_params + params)
+            inserted = self.cursor.rowcount
+            self.connection.commit()
+            return inserted
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"일별 추가 시간 집계 재생성 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    # === 스키마 버전 (마이그레이션) 관련 메서드 ===
+
+    @pooled
+    def get_schema_version(self):
+        """적용된 스키마 버전 (SchemaVersion 테이블이 없으면 0, 조회 실패 시 None)"""
+        try:
+            self.cursor.execute("""
+            IF OBJECT_ID('SchemaVersion', 'U') IS NULL
+                SELECT 0 AS version
+            ELSE
+                SELECT ISNULL(MAX(version), 0) AS version FROM SchemaVersion
+            """)
+            return self.cursor.fetchone().version
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"스키마 버전 조회 오류: {e}")
+            self.connection.rollback()
+            return None
+
+    @pooled
+    def apply_migration(self, version, description, statements):
+        """마이그레이션 1개를 하나의 트랜잭션으로 적용 + SchemaVersion 기록
+
+        여러 PC에서 동시에 실행해도 한 번만 적용되도록 앱 잠금을 잡고 버전을 다시 확인
+        statements: [SQL 또는 (SQL, 파라미터), ...]
+        """
+        try:
+            self.cursor.execute("""
+            DECLARE @result INT;
+            EXEC @result = sp_getapplock @Resource = 'SchemaMigration', @LockMode = 'Exclusive',
+                                         @LockOwner = 'Session', @LockTimeout = 60000;
+            SELECT @result AS result
+            """)
+            # 앞의 행 수 결과는 건너뜀 (SET NOCOUNT ON은 풀에 반환된 연결에 남아 rowcount가 -1이 됨)
+            while self.cursor.description is None and self.cursor.nextset():
+                pass
+            if self.cursor.fetchone().result < 0:
+                print(f"마이그레이션 잠금 대기 시간 초과 (v{version})")
+                return False
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"마이그레이션 잠금 오류: {e}")
+            return False
+
+        try:
+            self.cursor.execute("""
+            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='SchemaVersion' AND xtype='U')
+            CREATE TABLE SchemaVersion (
+                version INT PRIMARY KEY,
+                description NVARCHAR(200),
+                applied_at DATETIME DEFAULT GETDATE()
+            )
+            """)
+            self.cursor.execute("SELECT COUNT(*) AS cnt FROM SchemaVersion WHERE version = ?", (version,))
+            if self.cursor.fetchone().cnt == 0:
+                for statement in statements:
+                    if isinstance(statement, tuple):
+                        self.cursor.execute(*statement)
+                    else:
+                        self.cursor.execute(statement)
+                self.cursor.execute("INSERT INTO SchemaVersion (version, description) VALUES (?, ?)",
+                                    (version, description))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"마이그레이션 적용 오류 (v{version}): {e}")
+            self.connection.rollback()
+            return False
+        finally:
+            try:
+                self.cursor.execute("EXEC sp_releaseapplock @Resource = 'SchemaMigration', @LockOwner = 'Session'")
+            except Exception:
+                pass
+
+    # === 인덱스 관련 메서드 ===
+
+    @pooled
+    def get_missing_indexes(self):
+        """INDEX_DEFINITIONS 중 아직 없는 인덱스 이름 목록 (테이블이 없으면 제외)"""
+        try:
+            self.cursor.execute("""
+            SELECT t.name AS table_name, i.name AS index_name
+            FROM sys.tables t
+            LEFT JOIN sys.indexes i ON i.object_id = t.object_id AND i.name IS NOT NULL
+            """)
+            existing = {}
+            for row in self.cursor.fetchall():
+                existing.setdefault(row.table_name, set())
+                if row.index_name:
+                    existing[row.table_name].add(row.index_name)
+
+            return [name for name, table, _, _, _ in INDEX_DEFINITIONS
+                    if table in existing and name not in existing[table]]
+        except Exception as e:
+            self._mark_broken(e)
+            print(f"인덱스 확인 오류: {e}")
+            return []
+
+    @pooled
+    def ensure_indexes(self):
+        """없는 인덱스 생성 (인덱스마다 따로 커밋 - 하나가 실패해도 나머지는 생성)
+
+        반환: (생성된 인덱스 목록, [(실패한 인덱스, 오류 메시지), ...])
+        """
+        missing = set(self.get_missing_indexes())
+        created = []
+        failed = []
+        for name, table, columns, include, unique in INDEX_DEFINITIONS:
+            if name not in missing:
+                continue
+            query = f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({columns})"
+            if include:
+                query += f" INCLUDE ({include})"
+            try:
+                self.cursor.execute(query)
+                self.connection.commit()
+                created.append(name)
+            except Exception as e:
+                self._mark_broken(e)
+                # UNIQUE 인덱스는 기존 중복 데이터가 있으면 실패함
+                print(f"인덱스 생성 오류 ({name}): {e}")
+                self.connection.rollback()
+                failed.append((name, str(e)))
+        return created, failed
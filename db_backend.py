@@ -0,0 +1,284 @@
+"""
+DB 백엔드 인터페이스
+TimeTableManager / GUI / 작업 스레드가 사용하는 Database 메서드 목록
+
+- Database (database.py): MSSQL (pyodbc) - 운영용
+- SQLiteDatabase (sqlite_database.py): SQLite - 테스트/벤치마크/로컬 복제본용
+- 사용할 백엔드는 database.DB_CONFIG['backend']로 선택 (database.create_database())
+
+반환 형식과 실패 시 반환값(False / {} / [] / -1 / None)은 두 백엔드가 같아야 함
+빠진 메서드가 있으면 인스턴스를 만들 때 TypeError
+"""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+
+def day_start(value):
+    """date/datetime/문자열 → 그 날 00:00 datetime (created_at 범위 조건용)"""
+    if isinstance(value, datetime):
+        return datetime.combine(value.date(), datetime.min.time())
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+
+
+def changed_logs(changes, outcomes, logs):
+    """save_special_times_bulk 변경 로그 중 실제로 저장된 셀(inserted/updated)의 로그만 남김
+
+    로그의 (업체명, 법인명, 시간대)로 셀을 찾고, 같은 셀 로그가 여러 개면 마지막 것만 남김
+    """
+    changed = {(company, corp_name, time_slot)
+               for outcome, (company, corp_name, time_slot, _) in zip(outcomes, changes)
+               if outcome in ("inserted", "updated")}
+    last_log = {}
+    for log in logs or []:
+        key = tuple(log[1:4])
+        if key in changed:
+            last_log[key] = log
+    return list(last_log.values())
+
+
+class TransactionScope:
+    """transaction() 범위 - ok: 끝난 후 커밋(저장점 유지) 여부"""
+
+    def __init__(self, savepoint=None):
+        self.savepoint = savepoint  # 중첩 범위의 저장점 이름 (가장 바깥은 None)
+        self.failed = False
+        self.ok = False
+
+
+class TransactionConnection:
+    """transaction() 안의 메서드에 주는 연결 - commit은 미루고, rollback은 현재 범위를 실패로 표시"""
+
+    def __init__(self, conn, scopes):
+        self._conn = conn
+        self._scopes = scopes
+
+    def commit(self):
+        pass  # 가장 바깥 transaction()이 끝날 때 한 번만 커밋
+
+    def rollback(self):
+        self._scopes[-1].failed = True
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class DatabaseBackend(ABC):
+    """DB 백엔드 공통 인터페이스 (백엔드마다 SQL만 다르고 의미는 같음)"""
+
+    backend = None  # 'mssql' / 'sqlite'
+
+    # === 연결 ===
+
+    @abstractmethod
+    def connect(self):
+        pass
+
+    @abstractmethod
+    def disconnect(self):
+        pass
+
+    @abstractmethod
+    def is_connected(self):
+        """connect() 성공 여부 (작업 스레드가 다시 연결할지 판단)"""
+
+    @abstractmethod
+    def transaction(self):
+        """여러 메서드를 하나의 트랜잭션으로 묶기 - with db.transaction() as tx: ... / tx.ok (contextmanager)"""
+
+    @abstractmethod
+    def pool_stats(self):
+        """연결 풀 상태 (풀이 없으면 {})"""
+
+    # === 업무 (TimeTable) ===
+
+    @abstractmethod
+    def insert_or_update_task(self, work_date, time_slot, task_name, description, special_note='', company='', end_time=''):
+        pass
+
+    @abstractmethod
+    def delete_task(self, work_date, time_slot):
+        pass
+
+    @abstractmethod
+    def get_tasks_by_date(self, work_date):
+        pass
+
+    @abstractmethod
+    def get_task(self, work_date, time_slot):
+        pass
+
+    @abstractmethod
+    def get_all_dates(self):
+        pass
+
+    @abstractmethod
+    def copy_tasks_to_date(self, source_date, target_date):
+        pass
+
+    # === 기본 업무 템플릿 ===
+
+    @abstractmethod
+    def get_default_tasks(self):
+        pass
+
+    @abstractmethod
+    def get_default_tasks_version(self):
+        """변경 확인용 토큰 (값끼리 == 비교만 함, 실패 시 None)"""
+
+    @abstractmethod
+    def insert_or_update_default_task(self, time_slot, task_name, description, company='', end_time='', display_order=None, color=''):
+        pass
+
+    @abstractmethod
+    def shift_display_order(self, from_order, delta=1):
+        pass
+
+    @abstractmethod
+    def delete_default_task(self, display_order):
+        pass
+
+    @abstractmethod
+    def apply_default_tasks_to_date(self, target_date):
+        pass
+
+    @abstractmethod
+    def update_display_order(self, time_slot, display_order):
+        pass
+
+    # === 특수 시간 ===
+
+    @abstractmethod
+    def save_special_time(self, work_date, company, corp_name, time_slot, is_colored, base_minutes=None):
+        pass
+
+    @abstractmethod
+    def save_special_times_bulk(self, work_date, changes, logs=None, base_minutes=None):
+        """changes 순서대로 "inserted" / "updated" / "unchanged" / "duplicate" / "failed" 반환"""
+
+    @abstractmethod
+    def materialize_special_times(self, work_date, slots, base_minutes=None):
+        pass
+
+    @abstractmethod
+    def get_special_times(self, work_date, company, corp_name):
+        pass
+
+    @abstractmethod
+    def get_special_times_for_date(self, work_date):
+        pass
+
+    @abstractmethod
+    def get_day_version(self, work_date):
+        pass
+
+    @abstractmethod
+    def delete_special_times_by_date(self, work_date, company, corp_name):
+        pass
+
+    # === 사용자 ===
+
+    @abstractmethod
+    def authenticate_user(self, username, password):
+        pass
+
+    @abstractmethod
+    def get_user_by_username(self, username):
+        pass
+
+    @abstractmethod
+    def get_all_users(self):
+        pass
+
+    @abstractmethod
+    def add_user(self, username, password, display_name='', is_admin=False):
+        pass
+
+    @abstractmethod
+    def update_user(self, user_id, display_name=None, is_active=None, is_admin=None):
+        pass
+
+    @abstractmethod
+    def change_password(self, user_id, new_password):
+        pass
+
+    @abstractmethod
+    def delete_user(self, user_id):
+        pass
+
+    # === 변경 로그 ===
+
+    @abstractmethod
+    def add_change_log(self, log_type, work_date, company, corp_name, time_slot, action,
+                       old_value, new_value, user_id, username, display_name):
+        pass
+
+    @abstractmethod
+    def get_change_logs(self, start_date=None, end_date=None, log_type=None,
+                        company=None, username=None, limit=500, before=None):
+        pass
+
+    @abstractmethod
+    def delete_old_logs(self, days_to_keep=90):
+        pass
+
+    # === 특수 시간 변동 사유 ===
+
+    @abstractmethod
+    def save_special_time_reason(self, work_date, company, corp_name, added_time, reason, user_id=None, username=None):
+        pass
+
+    @abstractmethod
+    def get_special_time_reason(self, work_date, company, corp_name):
+        pass
+
+    @abstractmethod
+    def get_all_special_time_reasons(self, work_date):
+        pass
+
+    @abstractmethod
+    def get_special_time_reasons_by_period(self, start_date, end_date):
+        pass
+
+    @abstractmethod
+    def delete_special_time_reason(self, work_date, company, corp_name):
+        pass
+
+    # === 로컬 복제본 동기화 ===
+
+    @abstractmethod
+    def get_rows_changed_since(self, table, columns, since=None, from_date=None):
+        pass
+
+    @abstractmethod
+    def get_special_time_stamps(self, work_date):
+        pass
+
+    # === 일별 추가 시간 집계 ===
+
+    @abstractmethod
+    def get_daily_extra_by_period(self, start_date, end_date):
+        pass
+
+    @abstractmethod
+    def rebuild_daily_extra_time(self, base_minutes, start_date=None, end_date=None):
+        pass
+
+    # === 스키마 / 인덱스 ===
+
+    @abstractmethod
+    def get_schema_version(self):
+        pass
+
+    @abstractmethod
+    def apply_migration(self, version, description, statements):
+        pass
+
+    @abstractmethod
+    def get_missing_indexes(self):
+        pass
+
+    @abstractmethod
+    def ensure_indexes(self):
+        pass
@@ -0,0 +1,141 @@
+"""
+DB 작업 스레드
+pyodbc 호출을 별도 스레드에서 실행해 Tk 메인 루프가 멈추지 않도록 함
+"""
+import queue
+import threading
+from concurrent.futures import Future
+from database import create_database
+import query_stats
+
+# 결과 확인 주기 (ms)
+POLL_MS = 30
+
+
+class DBWorker:
+    """DB 전용 작업 스레드 (연결 풀에서 화면 스레드와 다른 연결을 빌려 사용)
+
+    - submit()은 Tk 스레드에서만 호출
+    - 작업은 제출 순서대로 하나씩 실행됨 (저장 후 조회 순서 보장)
+    - 작업 함수는 첫 번째 인자로 작업 스레드의 Database를 받음
+    - callback / errback은 root.after를 통해 Tk 스레드에서 호출됨
+    - background=True 작업(미리 조회 등)은 작업 중 표시에 포함하지 않음
+    """
+
+    def __init__(self, root, on_busy_changed=None):
+        self.root = root
+        self.on_busy_changed = on_busy_changed  # 작업 중 여부 변경 시 호출: on_busy_changed(busy)
+
+        self.db = create_database()
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0  # 결과가 아직 전달되지 않은 작업 수 (Tk 스레드에서만 변경)
+        self.busy = 0  # 그중 작업 중 표시 대상 작업 수 (background 제외)
+        self.poll_id = None
+
+        self.thread = threading.Thread(target=self._run, name="DBWorker", daemon=True)
+        self.thread.start()
+
+    # === Tk 스레드 ===
+
+    def submit(self, func, *args, callback=None, errback=None, background=False) -> Future:
+        """작업 제출 - func(db, *args)를 작업 스레드에서 실행"""
+        future = Future()
+        action = query_stats.current_action()  # 작업 스레드의 쿼리와 콜백도 제출한 화면 작업으로 집계
+        future.add_done_callback(lambda f: self.results.put((f, callback, errback, background, action)))
+        self.jobs.put((future, func, args, action))
+
+        self.pending += 1
+        if not background:
+            self.busy += 1
+            if self.busy == 1:
+                self._notify_busy(True)
+        self._schedule_poll()
+        return future
+
+    def shutdown(self, timeout=10):
+        """남은 작업을 모두 처리한 후 스레드 종료 (결과 콜백은 호출하지 않음)"""
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.jobs.put(None)
+        self.thread.join(timeout)
+
+    def _schedule_poll(self):
+        if self.poll_id is None:
+            self.poll_id = self.root.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        """완료된 작업의 콜백을 Tk 스레드에서 호출"""
+        self.poll_id = None
+        was_busy = self.busy > 0
+        while True:
+            try:
+                future, callback, errback, background, action = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            self.pending -= 1
+            if not background:
+                self.busy -= 1
+            error = future.exception()
+            try:
+                with query_stats.action(action, resume=True):
+                    if error is not None:
+                        if errback:
+                            errback(error)
+                        else:
+                            print(f"DB 작업 오류: {error}")
+                    elif callback:
+                        callback(future.result())
+            except Exception as e:
+                print(f"DB 작업 콜백 오류: {e}")
+
+        if self.pending > 0:
+            self._schedule_poll()
+        if was_busy and self.busy == 0:
+            self._notify_busy(False)
+
+    def _notify_busy(self, busy):
+        if self.on_busy_changed:
+            self.on_busy_changed(busy)
+
+    # === 작업 스레드 ===
+
+    def _run(self):
+        self.db.connect()
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            future, func, args, action = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                # 처음 연결에 실패했으면 다시 시도 (이후 재연결은 연결 풀이 처리)
+                if not self.db.is_connected():
+                    self.db.connect()
+                with query_stats.action(action, resume=True):
+                    result = func(self.db, *args)
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+        self.db.disconnect()
+
+    # === 자주 쓰는 조회 (비동기) ===
+
+    def load_day_async(self, work_date, callback=None, errback=None, background=False) -> Future:
+        """날짜 이동용 - (변경 확인 토큰, 업무, 특수 시간) 을 한 번의 작업으로 조회
+
+        토큰을 먼저 읽으므로 조회 도중 바뀐 내용은 다음 토큰 비교에서 걸러짐
+        """
+        return self.submit(lambda db: (db.get_day_version(work_date), db.get_tasks_by_date(work_date),
+                                       db.get_special_times_for_date(work_date)),
+                           callback=callback, errback=errback, background=background)
+
+    def get_day_version_async(self, work_date, callback=None, errback=None, background=False) -> Future:
+        return self.submit(lambda db: db.get_day_version(work_date),
+                           callback=callback, errback=errback, background=background)
+
+    def get_change_logs_async(self, callback=None, errback=None, **filters) -> Future:
+        return self.submit(lambda db: db.get_change_logs(**filters), callback=callback, errback=errback)
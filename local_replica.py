@@ -0,0 +1,544 @@
+"""
+로컬 복제본 (SQLite)
+서버(MSSQL)에 연결할 수 없어도 타임테이블을 볼 수 있도록 data/replica.db에 최근 데이터를 보관
+
+- 온라인: 날짜 조회 결과와 서버 변경분(updated_at 기준)을 주기적으로 내려받아 갱신
+- 오프라인: 복제본에서 조회, 특수 시간/변동 사유 저장은 대기열(Outbox)에 보관 (나머지는 읽기 전용)
+- 재연결: 대기열을 서버에 반영 - 서버 행의 updated_at이 오프라인 변경의 기준 시각보다 늦으면
+  덮어쓰지 않고 충돌(Conflicts)로 남김
+
+테이블/조회는 SQLiteDatabase와 같고, 복제본의 updated_at은 서버 행의 값 (모르면 NULL)
+복제본은 Tk 스레드에서만 사용 (서버 조회/반영은 작업 스레드의 fetch_changes / push_outbox)
+"""
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from db_backend import changed_logs
+from sqlite_database import SQLiteDatabase, SCHEMA as DATABASE_SCHEMA, NOW
+
+# 복제할 작업일 범위 (오늘 기준 이전 일수 - 이후 날짜는 모두)
+REPLICA_DAYS = 62
+
+# 서버 변경분을 내려받는 테이블 (work_date + updated_at 컬럼이 있는 테이블)
+REPLICATED_TABLES = {
+    "TimeTable": ("work_date", "time_slot", "task_name", "description", "special_note",
+                  "company", "end_time", "updated_at"),
+    "SpecialTimes": ("work_date", "company", "corp_name", "time_slot", "is_colored", "updated_at"),
+    "SpecialTimeReasons": ("work_date", "company", "corp_name", "added_time", "reason",
+                           "user_id", "username", "updated_at"),
+}
+
+# updated_at은 서버 값만 보관 (로컬 시각 기본값 없음 - 복제본에서 새로 만든 행은 NULL)
+SCHEMA = [statement.replace(f"updated_at DATETIME DEFAULT ({NOW})", "updated_at DATETIME")
+          for statement in DATABASE_SCHEMA] + [
+    # 동기화 상태 (테이블별 마지막 updated_at, 기본 업무 버전 등)
+    """
+    CREATE TABLE IF NOT EXISTS SyncState (
+        name TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+    # 오프라인 저장 대기열 - base_updated_at: 변경 기준이 된 서버 행의 updated_at
+    """
+    CREATE TABLE IF NOT EXISTS Outbox (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        work_date TEXT NOT NULL,
+        item_key TEXT,
+        payload TEXT NOT NULL,
+        base_updated_at TEXT,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Conflicts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        work_date TEXT NOT NULL,
+        item_key TEXT,
+        payload TEXT NOT NULL,
+        base_updated_at TEXT,
+        server_updated_at TEXT,
+        detected_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS IX_Outbox_kind_date_key ON Outbox (kind, work_date, item_key)",
+]
+
+
+def get_replica_path():
+    """복제본 파일 경로 (실행 파일 또는 소스 폴더의 data/replica.db)"""
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, 'data', 'replica.db')
+
+
+def _day(value):
+    """date/datetime/문자열 → 'YYYY-MM-DD'"""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+def _stamp(value):
+    """datetime → 문자열 (없으면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return str(value)
+
+
+def _parse_stamp(text):
+    return datetime.fromisoformat(text) if text else None
+
+
+def _offline_only(name):
+    """오프라인에서 막는 쓰기 메서드 (대기열에 넣지 않는 변경은 재연결 때 사라지므로)"""
+    def method(self, *args, **kwargs):
+        print(f"오프라인 모드에서는 사용할 수 없습니다: {name}")
+        return False
+    method.__name__ = name
+    return method
+
+
+class LocalReplica(SQLiteDatabase):
+    """SQLite 로컬 복제본 - 오프라인일 때 Database 대신 사용 (같은 메서드 이름/반환 형식)"""
+
+    SCHEMA = SCHEMA
+    DEFAULT_ADMIN = False  # 오프라인 로그인은 이 PC에서 로그인한 적 있는 사용자만
+    UPDATED_AT = "updated_at"  # 오프라인 수정은 서버 updated_at을 그대로 둠 (재연결 때 충돌 확인 기준)
+
+    def __init__(self, path=None):
+        super().__init__(path or get_replica_path())
+
+    def has_data(self):
+        """오프라인으로 시작할 만한 데이터가 있는지 (기본 업무 템플릿 기준)"""
+        try:
+            self.cursor.execute("SELECT COUNT(*) AS cnt FROM DefaultTasks")
+            return self.cursor.fetchone().cnt > 0
+        except Exception as e:
+            print(f"로컬 복제본 확인 오류: {e}")
+            return False
+
+    # === 오프라인 읽기 전용 ===
+
+    insert_or_update_task = _offline_only("insert_or_update_task")
+    delete_task = _offline_only("delete_task")
+    copy_tasks_to_date = _offline_only("copy_tasks_to_date")
+    insert_or_update_default_task = _offline_only("insert_or_update_default_task")
+    shift_display_order = _offline_only("shift_display_order")
+    insert_default_task_at = _offline_only("insert_default_task_at")
+    delete_default_task = _offline_only("delete_default_task")
+    apply_default_tasks_to_date = _offline_only("apply_default_tasks_to_date")
+    update_display_order = _offline_only("update_display_order")
+    delete_special_times_by_date = _offline_only("delete_special_times_by_date")
+    add_user = _offline_only("add_user")
+    update_user = _offline_only("update_user")
+    change_password = _offline_only("change_password")
+    delete_user = _offline_only("delete_user")
+    delete_old_logs = _offline_only("delete_old_logs")
+    rebuild_daily_extra_time = _offline_only("rebuild_daily_extra_time")
+
+    def get_default_tasks_version(self):
+        """마지막으로 내려받은 템플릿의 서버 버전 토큰"""
+        return self._get_state("DefaultTasks")
+
+    def get_day_version(self, work_date):
+        return None  # 오프라인에서는 날짜 이동 캐시를 사용하지 않음
+
+    # === 특수 시간 저장 (대기열 등록) ===
+
+    def save_special_time(self, work_date, company, corp_name, time_slot, is_colored, base_minutes=None):
+        outcomes = self.save_special_times_bulk(
+            work_date, [(company, corp_name, time_slot, is_colored)],
+            base_minutes={(company, corp_name): base_minutes} if base_minutes is not None else None)
+        return outcomes[0] != "failed"
+
+    def save_special_times_bulk(self, work_date, changes, logs=None, base_minutes=None):
+        """특수 시간 여러 건 저장 + 대기열 등록 (일별 추가 시간 집계는 서버에서 반영할 때 갱신)"""
+        if not changes:
+            return []
+        day = _day(work_date)
+        try:
+            stamps = self.get_special_time_stamps(work_date)
+            if stamps is None:
+                return ["failed"] * len(changes)
+            with self.transaction() as tx:
+                outcomes = super().save_special_times_bulk(work_date, changes)
+                for outcome, (company, corp_name, time_slot, is_colored) in zip(outcomes, changes):
+                    if outcome not in ("inserted", "updated"):
+                        continue
+                    key = (company, corp_name or '', time_slot)
+                    # 기준 시각: 복제본 행의 서버 updated_at (모르면 마지막으로 내려받은 서버 시각)
+                    base = stamps.get(key) or self._get_state("SpecialTimes")
+                    self._enqueue("special_time", day, list(key), {
+                        'is_colored': bool(is_colored),
+                        'base_minutes': (base_minutes or {}).get((company, corp_name)),
+                    }, base)
+                for log in changed_logs(changes, outcomes, logs):
+                    self._enqueue_log(day, *log)
+            return outcomes if tx.ok else ["failed"] * len(changes)
+        except Exception as e:
+            print(f"로컬 특수 시간 저장 오류: {e}")
+            return ["failed"] * len(changes)
+
+    def materialize_special_times(self, work_date, slots, base_minutes=None):
+        """기본 특수 시간 일괄 생성 (없는 행만) - 서버에도 없는 행만 생성하도록 대기열 등록"""
+        if not slots:
+            return 0
+        day = _day(work_date)
+        try:
+            stamps = self.get_special_time_stamps(work_date)
+            if stamps is None:
+                return -1
+            new_slots = [(company, corp_name or '', time_slot) for company, corp_name, time_slot in dict.fromkeys(slots)
+                         if (company, corp_name or '', time_slot) not in stamps]
+            with self.transaction() as tx:
+                inserted = super().materialize_special_times(work_date, new_slots)
+                for company, corp_name, time_slot in new_slots:
+                    self._enqueue("seed", day, [company, corp_name, time_slot], {
+                        'base_minutes': (base_minutes or {}).get((company, corp_name)),
+                    }, None)
+            return inserted if tx.ok else -1
+        except Exception as e:
+            print(f"로컬 기본 특수 시간 생성 오류: {e}")
+            return -1
+
+    # === 변경 로그 ===
+
+    def add_change_log(self, log_type, work_date, company, corp_name, time_slot, action,
+                       old_value, new_value, user_id, username, display_name):
+        """변경 로그는 서버에만 기록 - 재연결 시 반영되도록 대기열 등록"""
+        try:
+            self._enqueue_log(_day(work_date), log_type, company, corp_name, time_slot, action,
+                              old_value, new_value, user_id, username, display_name)
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"로컬 변경 로그 추가 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 특수 시간 변동 사유 (대기열 등록) ===
+
+    def save_special_time_reason(self, work_date, company, corp_name, added_time, reason, user_id=None, username=None):
+        day = _day(work_date)
+        try:
+            current = self.get_special_time_reason(work_date, company, corp_name)
+            with self.transaction() as tx:
+                super().save_special_time_reason(work_date, company, corp_name, added_time, reason,
+                                                 user_id, username)
+                self._enqueue("reason", day, [company, corp_name], {
+                    'added_time': added_time, 'reason': reason, 'user_id': user_id, 'username': username,
+                }, (current['updated_at'] if current else None) or self._get_state("SpecialTimeReasons"))
+            return tx.ok
+        except Exception as e:
+            print(f"로컬 변동 사유 저장 오류: {e}")
+            return False
+
+    def delete_special_time_reason(self, work_date, company, corp_name):
+        day = _day(work_date)
+        try:
+            current = self.get_special_time_reason(work_date, company, corp_name)
+            if current is None:
+                return True
+            with self.transaction() as tx:
+                super().delete_special_time_reason(work_date, company, corp_name)
+                self._enqueue("reason", day, [company, corp_name], {'delete': True},
+                              current['updated_at'] or self._get_state("SpecialTimeReasons"))
+            return tx.ok
+        except Exception as e:
+            print(f"로컬 변동 사유 삭제 오류: {e}")
+            return False
+
+    # === 오프라인 로그인 ===
+
+    def remember_user(self, user, password=None):
+        """온라인 로그인 성공 시 사용자 정보 보관 (비밀번호는 서버와 같은 해시, 없으면 기존 값 유지)"""
+        try:
+            import hashlib
+            password_hash = hashlib.sha256(password.encode()).hexdigest() if password else None
+            self.cursor.execute("SELECT password FROM Users WHERE username = ?", (user['username'],))
+            row = self.cursor.fetchone()
+            if password_hash is None:
+                password_hash = row.password if row is not None else ''  # 빈 값은 어떤 비밀번호와도 다름
+            self.cursor.execute("""
+                INSERT OR REPLACE INTO Users (id, username, password, display_name, is_active, is_admin)
+                VALUES (?, ?, ?, ?, 1, ?)
+            """, (user['id'], user['username'], password_hash, user['display_name'],
+                  1 if user['is_admin'] else 0))
+            self.connection.commit()
+        except Exception as e:
+            print(f"로컬 사용자 저장 오류: {e}")
+
+    # === 온라인 갱신 (서버 → 복제본) ===
+
+    def store_day(self, work_date, tasks, day_special_times):
+        """온라인에서 조회한 날짜 데이터로 복제본 교체 (서버에서 삭제된 행도 반영)
+
+        조회 결과에는 updated_at이 없으므로 기존 행의 updated_at은 유지 (새 행은 NULL)
+        """
+        day = _day(work_date)
+        try:
+            self.cursor.execute("DELETE FROM TimeTable WHERE work_date = ?", (day,))
+            self.cursor.executemany("""
+                INSERT INTO TimeTable (work_date, time_slot, task_name, description, special_note, company, end_time, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, NULL)
+            """, [(day, time_slot, task['task'], task['description'], task['special_note'],
+                   task['company'], task['end_time']) for time_slot, task in tasks.items()])
+
+            self.cursor.execute("SELECT company, corp_name, time_slot FROM SpecialTimes WHERE work_date = ?", (day,))
+            stale = {tuple(row) for row in self.cursor.fetchall()}
+            rows = []
+            for (company, corp_name), special_times in day_special_times.items():
+                for time_slot, is_colored in special_times.items():
+                    stale.discard((company, corp_name or '', time_slot))
+                    rows.append((day, company, corp_name or '', time_slot, 1 if is_colored else 0))
+            self.cursor.executemany("""
+                DELETE FROM SpecialTimes WHERE work_date = ? AND company = ? AND corp_name = ? AND time_slot = ?
+            """, [(day,) + key for key in stale])
+            self.cursor.executemany("""
+                INSERT INTO SpecialTimes (work_date, company, corp_name, time_slot, is_colored, updated_at)
+                VALUES (?, ?, ?, ?, ?, NULL)
+                ON CONFLICT (work_date, company, corp_name, time_slot) DO UPDATE SET is_colored = excluded.is_colored
+            """, rows)
+            self.connection.commit()
+        except Exception as e:
+            print(f"로컬 복제본 날짜 저장 오류: {e}")
+            self.connection.rollback()
+
+    def store_default_tasks(self, default_tasks, version):
+        """서버 기본 업무 템플릿 전체 교체 (버전 토큰이 바뀌었을 때만)"""
+        token = json.dumps(version, default=str)
+        if self._get_state("DefaultTasks") == token:
+            return
+        try:
+            self.cursor.execute("DELETE FROM DefaultTasks")
+            self.cursor.executemany("""
+                INSERT INTO DefaultTasks (display_order, time_slot, task_name, description, company, end_time, color, is_active)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+            """, [(display_order, info['time_slot'], info['task'], info['description'], info['company'],
+                   info['end_time'], info['color']) for display_order, info in default_tasks.items()])
+            self._set_state("DefaultTasks", token)
+            self.connection.commit()
+        except Exception as e:
+            print(f"로컬 기본 업무 저장 오류: {e}")
+            self.connection.rollback()
+
+    def get_sync_marks(self):
+        """서버 변경분 조회 기준 {테이블: 마지막 updated_at} + 복제 시작일"""
+        marks = {table: self._get_state(table) for table in REPLICATED_TABLES}
+        return marks, _day(date.today() - timedelta(days=REPLICA_DAYS))
+
+    def apply_changes(self, changes):
+        """fetch_changes 결과 반영 (대기열에 있는 행은 재연결 때 충돌 확인하므로 덮어쓰지 않음)"""
+        if not changes:
+            return
+        try:
+            pending = {tuple(row) for row
+                       in self.cursor.execute("SELECT kind, work_date, item_key FROM Outbox").fetchall()}
+            for table, rows in changes.items():
+                columns = REPLICATED_TABLES[table]
+                latest = _parse_stamp(self._get_state(table))
+                values = []
+                for row in rows:
+                    row = dict(zip(columns, row))
+                    row['work_date'] = _day(row['work_date'])
+                    if 'corp_name' in row:
+                        row['corp_name'] = row['corp_name'] or ''
+                    if table == "SpecialTimes":
+                        key = json.dumps([row['company'], row['corp_name'], row['time_slot']], ensure_ascii=False)
+                        if ("special_time", row['work_date'], key) in pending:
+                            continue
+                    elif table == "SpecialTimeReasons":
+                        key = json.dumps([row['company'], row['corp_name']], ensure_ascii=False)
+                        if ("reason", row['work_date'], key) in pending:
+                            continue
+                    values.append(tuple(row[column] for column in columns))
+                    if row['updated_at'] and (latest is None or row['updated_at'] > latest):
+                        latest = row['updated_at']
+
+                self.cursor.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})", values)
+                if latest is not None:
+                    self._set_state(table, _stamp(latest))
+
+            # 복제 범위를 벗어난 날짜 정리
+            _, from_date = self.get_sync_marks()
+            for table in REPLICATED_TABLES:
+                self.cursor.execute(f"DELETE FROM {table} WHERE work_date < ?", (from_date,))
+            self.connection.commit()
+        except Exception as e:
+            print(f"로컬 복제본 갱신 오류: {e}")
+            self.connection.rollback()
+
+    # === 대기열 (복제본 → 서버) ===
+
+    def _enqueue(self, kind, work_date, item_key, payload, base_updated_at):
+        """대기열 등록 - 같은 항목이 이미 있으면 내용만 갱신 (처음 기준 시각 유지)"""
+        now = datetime.now().isoformat(sep=' ')
+        payload = json.dumps(payload, ensure_ascii=False, default=str)
+        if item_key is not None:
+            item_key = json.dumps(item_key, ensure_ascii=False)
+            self.cursor.execute("""
+                UPDATE Outbox SET payload = ? WHERE kind = ? AND work_date = ? AND item_key = ?
+            """, (payload, kind, work_date, item_key))
+            if self.cursor.rowcount > 0:
+                return
+        self.cursor.execute("""
+            INSERT INTO Outbox (kind, work_date, item_key, payload, base_updated_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (kind, work_date, item_key, payload, _stamp(base_updated_at), now))
+
+    def _enqueue_log(self, work_date, log_type, company, corp_name, time_slot, action,
+                     old_value, new_value, user_id, username, display_name):
+        self._enqueue("change_log", work_date, None, {
+            'log_type': log_type, 'company': company, 'corp_name': corp_name,
+            'time_slot': time_slot, 'action': action, 'old_value': old_value,
+            'new_value': new_value, 'user_id': user_id, 'username': username,
+            'display_name': display_name,
+        }, None)
+
+    def get_outbox(self):
+        """대기열 전체 [(id, kind, work_date, item_key, payload, base_updated_at), ...] (등록 순)"""
+        try:
+            self.cursor.execute("""
+                SELECT id, kind, work_date, item_key, payload, base_updated_at FROM Outbox ORDER BY id
+            """)
+            return [(row.id, row.kind, date.fromisoformat(row.work_date),
+                     json.loads(row.item_key) if row.item_key else None,
+                     json.loads(row.payload), _parse_stamp(row.base_updated_at))
+                    for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"대기열 조회 오류: {e}")
+            return []
+
+    def count_outbox(self):
+        try:
+            self.cursor.execute("SELECT COUNT(*) AS cnt FROM Outbox")
+            return self.cursor.fetchone().cnt
+        except Exception as e:
+            print(f"대기열 조회 오류: {e}")
+            return 0
+
+    def finish_push(self, done_ids, conflicts):
+        """push_outbox 결과 반영 - 반영/충돌 항목을 대기열에서 제거하고 충돌은 기록"""
+        try:
+            now = datetime.now().isoformat(sep=' ')
+            for entry_id, server_updated_at in conflicts:
+                self.cursor.execute("""
+                    INSERT INTO Conflicts (kind, work_date, item_key, payload, base_updated_at, server_updated_at, detected_at)
+                    SELECT kind, work_date, item_key, payload, base_updated_at, ?, ? FROM Outbox WHERE id = ?
+                """, (_stamp(server_updated_at), now, entry_id))
+            self.cursor.executemany("DELETE FROM Outbox WHERE id = ?",
+                                    [(entry_id,) for entry_id in list(done_ids) + [c[0] for c in conflicts]])
+            self.connection.commit()
+        except Exception as e:
+            print(f"대기열 정리 오류: {e}")
+            self.connection.rollback()
+
+    def _get_state(self, name):
+        self.cursor.execute("SELECT value FROM SyncState WHERE name = ?", (name,))
+        row = self.cursor.fetchone()
+        return row.value if row else None
+
+    def _set_state(self, name, value):
+        self.cursor.execute("INSERT OR REPLACE INTO SyncState (name, value) VALUES (?, ?)", (name, value))
+
+
+# === 작업 스레드에서 실행 (서버 연결만 사용) ===
+
+def fetch_changes(db, marks):
+    """서버 변경분 조회 - {테이블: [행, ...]} (조회 실패한 테이블은 제외)"""
+    since_by_table, from_date = marks
+    changes = {}
+    for table, columns in REPLICATED_TABLES.items():
+        rows = db.get_rows_changed_since(table, columns, _parse_stamp(since_by_table.get(table)), from_date)
+        if rows is not None:
+            changes[table] = rows
+    return changes
+
+
+def push_outbox(db, entries):
+    """대기열을 서버에 반영 - (반영된 id 목록, 충돌 [(id, 서버 updated_at)], 전부 처리 여부)
+
+    - seed: 서버에 없는 행만 생성 (서버 데이터를 덮어쓰지 않음)
+    - special_time / reason: 서버 행의 updated_at이 기준 시각보다 늦으면 충돌
+      (이번 seed로 서버에 새로 만든 행은 확인하지 않음 - 방금 받은 updated_at이 기준 시각보다 늦으므로)
+    - change_log: 그대로 추가
+    """
+    if not db.is_connected():
+        raise ConnectionError("서버에 연결할 수 없습니다.")
+
+    done, conflicts = [], []
+
+    def changed_on_server(server_updated_at, base_updated_at):
+        if server_updated_at is None:
+            return False
+        return base_updated_at is None or server_updated_at > base_updated_at
+
+    seeds, specials = {}, {}
+    for entry in entries:
+        if entry[1] == "seed":
+            seeds.setdefault(entry[2], []).append(entry)
+        elif entry[1] == "special_time":
+            specials.setdefault(entry[2], []).append(entry)
+
+    seeded = set()  # (날짜, 업체명, 법인명, 시간대)
+    for work_date, day_entries in seeds.items():
+        slots = [tuple(item_key) for _, _, _, item_key, _, _ in day_entries]
+        base_minutes = {(c, n): payload['base_minutes'] for _, _, _, (c, n, _), payload, _ in day_entries
+                        if payload.get('base_minutes') is not None}
+        stamps = db.get_special_time_stamps(work_date)
+        if stamps is None or db.materialize_special_times(work_date, slots, base_minutes or None) < 0:
+            return done, conflicts, False
+        seeded.update((work_date,) + slot for slot in slots if slot not in stamps)
+        done.extend(entry[0] for entry in day_entries)
+
+    for work_date, day_entries in specials.items():
+        stamps = db.get_special_time_stamps(work_date)
+        if stamps is None:
+            return done, conflicts, False
+        items, base_minutes, applied = [], {}, []
+        for entry_id, _, _, (company, corp_name, time_slot), payload, base_updated_at in day_entries:
+            server_updated_at = stamps.get((company, corp_name, time_slot))
+            if ((work_date, company, corp_name, time_slot) not in seeded
+                    and changed_on_server(server_updated_at, base_updated_at)):
+                conflicts.append((entry_id, server_updated_at))
+                continue
+            items.append((company, corp_name, time_slot, payload['is_colored']))
+            if payload.get('base_minutes') is not None:
+                base_minutes[(company, corp_name)] = payload['base_minutes']
+            applied.append(entry_id)
+        if items and "failed" in db.save_special_times_bulk(work_date, items, None, base_minutes or None):
+            return done, conflicts, False
+        done.extend(applied)
+
+    for entry_id, kind, work_date, item_key, payload, base_updated_at in entries:
+        if kind == "reason":
+            company, corp_name = item_key
+            server = db.get_special_time_reason(work_date, company, corp_name)
+            server_updated_at = server['updated_at'] if server else None
+            if changed_on_server(server_updated_at, base_updated_at):
+                conflicts.append((entry_id, server_updated_at))
+                continue
+            if payload.get('delete'):
+                ok = db.delete_special_time_reason(work_date, company, corp_name)
+            else:
+                ok = db.save_special_time_reason(work_date, company, corp_name, payload['added_time'],
+                                                 payload['reason'], payload['user_id'], payload['username'])
+        elif kind == "change_log":
+            ok = db.add_change_log(work_date=work_date, **payload)
+        else:
+            continue
+        if not ok:
+            return done, conflicts, False
+        done.append(entry_id)
+
+    return done, conflicts, True
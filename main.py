@@ -1,11 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-from timetable_manager import TimeTableManager
+from timetable_manager import TimeTableManager, seed_default_special_times
+from timetable_grid import TimeTableGrid
+from template_index import format_extra_minutes
+from special_time_buffer import SpecialTimeWriteBuffer
+from db_worker import DBWorker
 from tkcalendar import DateEntry
 from datetime import date, datetime, timedelta
 from version import VERSION, get_latest_changes
 from updater import check_for_updates_on_startup, manual_update_check
-from database import Database
+from database import create_database
+from local_replica import LocalReplica, fetch_changes, push_outbox
+from migrations import ensure_schema
+import query_stats
 import ctypes
 import sys
 import os
@@ -168,6 +175,7 @@ class LoginWindow:
         self.root = root
         self.on_login_success = on_login_success
         self.db = None
+        self.offline = False  # 서버에 연결할 수 없어 로컬 복제본으로 로그인하는 중
         self.login_window = None
         self.current_user = None
 
@@ -207,16 +215,16 @@ class LoginWindow:
         # 로그인 창 닫으면 프로그램 종료
         self.login_window.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        # 데이터베이스 연결
+        # 데이터베이스 연결 (서버에 연결할 수 없으면 로컬 복제본으로 오프라인 로그인)
         try:
-            self.db = Database()
-            if not self.db.connect():
+            self.db = create_database()
+            if self.db.connect():
+                # 스키마 확인 (사용자 테이블 / 기본 관리자 계정 포함)
+                ensure_schema(self.db)
+            elif not self.open_offline():
                 messagebox.showerror("연결 오류", "데이터베이스 연결에 실패했습니다.\ndb_config.py 파일을 확인해주세요.")
                 self.root.destroy()
                 return
-
-            # 사용자 테이블 생성
-            self.db.create_users_table()
         except Exception as e:
             messagebox.showerror("연결 오류", f"데이터베이스 연결 오류:\n{str(e)}")
             self.root.destroy()
@@ -231,6 +239,28 @@ class LoginWindow:
 
         self.create_login_ui()
 
+    def open_offline(self):
+        """로컬 복제본으로 오프라인 로그인 준비 (이 PC에서 로그인한 적이 있어야 함)"""
+        replica = LocalReplica()
+        if not (replica.connect() and replica.has_data()):
+            replica.disconnect()
+            return False
+        self.db = replica
+        self.offline = True
+        messagebox.showwarning("오프라인 모드",
+                               "서버에 연결할 수 없어 오프라인 모드로 시작합니다.\n"
+                               "이 PC에 저장된 데이터로 조회하며, 특수 시간 변경은 서버에 연결되면 반영됩니다.")
+        return True
+
+    def remember_user(self, user, password=None):
+        """온라인 로그인 성공 시 오프라인 로그인용으로 로컬 복제본에 보관"""
+        if self.offline:
+            return
+        replica = LocalReplica()
+        if replica.connect():
+            replica.remember_user(user, password)
+            replica.disconnect()
+
     def try_auto_login(self):
         """MAC 주소 기반 자동 로그인 시도"""
         try:
@@ -238,6 +268,7 @@ class LoginWindow:
             user = self.db.get_user_by_username("admin")
             if user:
                 self.current_user = user
+                self.remember_user(user)
                 # 로그인 창 숨기고 메인 창 표시 후 로그인 창 삭제
                 self.login_window.withdraw()
                 self.on_login_success(user)
@@ -516,6 +547,7 @@ class LoginWindow:
 
         if user:
             self.current_user = user
+            self.remember_user(user, password)
             self.login_window.destroy()
             self.db.disconnect()
             self.on_login_success(user)
@@ -546,6 +578,13 @@ class TimeTableGUI:
 
     COMPANIES = ["롯데마트", "롯데슈퍼", "지에스", "이마트", "홈플러스", "코스트코"]
 
+    # 날짜 표시 후 이전/다음 날을 미리 조회하기까지 대기 시간 (ms) - 연속 이동 중에는 미루기
+    PREFETCH_DELAY_MS = 300
+
+    # 로컬 복제본 갱신 주기 (온라인) / 서버 재연결 시도 주기 (오프라인) (ms)
+    REPLICA_SYNC_MS = 60000
+    RECONNECT_MS = 30000
+
     def __init__(self, root, current_user=None):
         self.root = root
         self.current_user = current_user
@@ -599,8 +638,8 @@ class TimeTableGUI:
         self.drag_end_time = None
         self.is_dragging = False
         self.drag_start_company = None  # 드래그 시작한 업체
-        self.header_cells = {}  # 시간 헤더 셀 저장
-        self.grid_cells = {}  # 그리드 셀 저장 (row, col) -> widget
+        self.grid_layout_key = None  # 현재 그려진 그리드 레이아웃 (템플릿 지문 + 크기)
+        self.template = None  # 현재 화면의 기본 업무 템플릿 인덱스 (TemplateIndex)
 
         # 셀 드래그를 위한 변수
         self.is_cell_dragging = False
@@ -620,9 +659,22 @@ class TimeTableGUI:
             self.root.destroy()
             return
 
+        # DB 작업 스레드 (날짜 이동/저장/로그 조회 시 화면이 멈추지 않도록)
+        self.db_worker = DBWorker(self.root, on_busy_changed=self.set_loading)
+        self.loading_date = None  # 불러오는 중인 날짜 (늦게 도착한 이전 결과 무시용)
+        self.prefetch_id = None  # 이전/다음 날 미리 조회 예약 ID
+        self.replica_sync_id = None  # 복제본 갱신 / 재연결 예약 ID
+
+        # 특수 시간 토글 쓰기 버퍼 (드래그 종료 또는 잠시 후 한 번에 저장)
+        self.special_time_buffer = SpecialTimeWriteBuffer(
+            self.root, self.manager, lambda: self.current_user,
+            on_error=self.on_special_time_save_failed, worker=self.db_worker)
+
         self.setup_ui()
 
+        self.update_connection_status()
         self.refresh_timetable()
+        self.schedule_replica_sync()
 
         # 프로그램 종료 시 DB 연결 해제
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -730,6 +782,16 @@ class TimeTableGUI:
         user_frame = tk.Frame(header_frame, bg="#2c3e50")
         user_frame.pack(side=tk.RIGHT, padx=15, pady=5)
 
+        # DB 작업 중 표시
+        self.loading_label = tk.Label(
+            header_frame,
+            text="",
+            font=("굴림체", 10, "bold"),
+            bg="#2c3e50",
+            fg="#f1c40f"
+        )
+        self.loading_label.pack(side=tk.RIGHT, padx=10)
+
         if self.current_user:
             user_label = tk.Label(
                 user_frame,
@@ -774,6 +836,11 @@ class TimeTableGUI:
             admin_menu.add_command(label="사용자 관리", command=self.show_user_management)
             admin_menu.add_command(label="변경 로그 조회", command=self.show_change_logs)
             admin_menu.add_separator()
+            self.query_stats_var = tk.BooleanVar(value=query_stats.is_enabled())
+            admin_menu.add_checkbutton(label="쿼리 계측", variable=self.query_stats_var,
+                                       command=lambda: query_stats.set_enabled(self.query_stats_var.get()))
+            admin_menu.add_command(label="쿼리 통계 보기", command=self.show_query_stats)
+            admin_menu.add_separator()
             admin_menu.add_command(label="비밀번호 변경", command=self.show_change_password)
         else:
             # 일반 사용자 메뉴
@@ -825,15 +892,14 @@ class TimeTableGUI:
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Frame을 Canvas 안에 배치
-        self.canvas_frame = tk.Frame(canvas, bg="white")
-        canvas_window = canvas.create_window((0, 0), window=self.canvas_frame, anchor="nw")
+        # 그리드는 Canvas 아이템으로 직접 그림 (셀별 위젯 없음)
+        self.grid = TimeTableGrid(canvas, self.manager.time_slots)
 
-        # Canvas 스크롤 영역 업데이트
-        def update_scroll_region(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        self.canvas_frame.bind("<Configure>", update_scroll_region)
+        # 클릭/드래그는 좌표 계산으로 셀을 찾아 처리
+        canvas.bind("<Button-1>", self.on_grid_press)
+        canvas.bind("<B1-Motion>", self.on_grid_motion)
+        canvas.bind("<ButtonRelease-1>", self.on_grid_release)
+        canvas.bind("<Motion>", self.on_grid_hover)
 
         # 마우스 휠 스크롤 지원 (세로)
         def on_mousewheel_vertical(event):
@@ -849,13 +915,117 @@ class TimeTableGUI:
         # 캔버스 참조 저장
         self.main_canvas = canvas
 
-        # 클릭 이벤트를 위한 딕셔너리 (시간 -> 위젯)
-        self.time_slot_widgets = {}
+    def set_loading(self, busy):
+        """DB 작업 중 표시 (DBWorker에서 호출)"""
+        if hasattr(self, 'loading_label'):
+            self.loading_label.config(text="⏳ 불러오는 중..." if busy else "")
+
+    # === 로컬 복제본 / 오프라인 ===
+
+    def update_connection_status(self):
+        """창 제목에 오프라인 여부 표시, 오프라인이면 특수 시간은 작업 스레드 대신 복제본에 바로 저장"""
+        user_display = self.current_user['display_name'] if self.current_user else ''
+        title = f"견우물류 업무 타임테이블 - {user_display}"
+        if self.manager.offline:
+            title += f" [오프라인 - 서버 반영 대기 {self.manager.replica.count_outbox()}건]"
+        self.root.title(title)
+        self.special_time_buffer.worker = None if self.manager.offline else self.db_worker
+
+    def schedule_replica_sync(self, delay_ms=None):
+        if self.replica_sync_id is not None:
+            self.root.after_cancel(self.replica_sync_id)
+        if delay_ms is None:
+            delay_ms = self.RECONNECT_MS if self.manager.offline else self.REPLICA_SYNC_MS
+        self.replica_sync_id = self.root.after(delay_ms, self.sync_replica)
+
+    @query_stats.ui_action("복제본 동기화")
+    def sync_replica(self):
+        """온라인: 서버 변경분을 복제본에 반영 / 오프라인: 재연결 시도 후 대기열 반영"""
+        self.replica_sync_id = None
+        replica = self.manager.replica
+        if replica.connection is None:
+            return
 
+        if not self.manager.offline:
+            self.db_worker.submit(fetch_changes, replica.get_sync_marks(),
+                                  callback=replica.apply_changes, background=True)
+            self.schedule_replica_sync()
+            return
+
+        # 화면에 모아 둔 토글을 먼저 대기열에 넣은 후 반영
+        self.special_time_buffer.flush()
+        self.db_worker.submit(push_outbox, replica.get_outbox(), callback=self.on_outbox_pushed,
+                              errback=lambda e: (self.update_connection_status(), self.schedule_replica_sync()),
+                              background=True)
+
+    def on_outbox_pushed(self, result):
+        """대기열 반영 결과 처리 - 모두 반영되면 온라인으로 전환하고 서버 데이터로 다시 표시"""
+        done, conflicts, complete = result
+        replica = self.manager.replica
+        replica.finish_push(done, conflicts)
+
+        if conflicts:
+            messagebox.showwarning(
+                "동기화 충돌",
+                f"오프라인 중 변경한 {len(conflicts)}건은 서버에서 먼저 수정되어 반영하지 않았습니다.\n"
+                "(data/replica.db의 Conflicts 테이블에 보관)")
+
+        if not complete:
+            self.update_connection_status()
+            self.schedule_replica_sync()
+            return
+        if replica.count_outbox() > 0:
+            # 반영하는 동안 새로 저장된 변경이 있으면 이어서 반영
+            self.update_connection_status()
+            self.schedule_replica_sync(0)
+            return
+        if not self.manager.go_online():
+            self.schedule_replica_sync()
+            return
+
+        self.update_connection_status()
+        self.on_date_changed()
+        self.schedule_replica_sync()
+
+    def on_grid_press(self, event):
+        """그리드 클릭 - 헤더는 시간 범위 드래그, 특수 행 셀은 토글 드래그 시작"""
+        cell = self.grid.locate_event(event)
+        if cell is None:
+            return
+        row, col = cell
+        if self.grid.is_header(row, col):
+            self.on_drag_start(self.manager.time_slots[col - 2])
+        elif self.grid.is_special_cell(row, col):
+            self.on_cell_drag_start(row, col)
+
+    def on_grid_motion(self, event):
+        """그리드 드래그 중"""
+        if self.is_dragging:
+            self.on_drag_motion(self.grid.time_slot_at_x(self.main_canvas.canvasx(event.x)))
+        elif self.is_cell_dragging:
+            cell = self.grid.locate_event(event)
+            if cell is not None:
+                self.on_cell_drag_motion(*cell)
+
+    def on_grid_release(self, event):
+        """그리드 드래그 종료"""
+        if self.is_dragging:
+            self.on_drag_end()
+        if self.is_cell_dragging:
+            self.on_cell_drag_end()
+
+    def on_grid_hover(self, event):
+        """클릭 가능한 셀(헤더, 특수 행) 위에서만 손 모양 커서 표시"""
+        cell = self.grid.locate_event(event)
+        clickable = cell is not None and (self.grid.is_header(*cell) or self.grid.is_special_cell(*cell))
+        cursor = "hand2" if clickable else ""
+        if self.main_canvas.cget("cursor") != cursor:
+            self.main_canvas.configure(cursor=cursor)
+
+    @query_stats.ui_action("날짜 이동")
     def on_date_changed(self, event=None):
-        """날짜 변경 시 호출"""
+        """날짜 변경 시 호출 (업무/특수 시간은 작업 스레드에서 조회)"""
         selected_date = self.date_entry.get_date()
-        self.manager.set_current_date(selected_date)
 
         # 변동 내역 날짜도 동기화
         if hasattr(self, 'reason_start_date'):
@@ -867,7 +1037,109 @@ class TimeTableGUI:
         self.reason_period_mode = False
         self.reason_period_data = None
 
-        self.refresh_timetable()
+        # 저장 대기 중인 토글을 먼저 작업 스레드에 넘긴 후 조회 (작업 순서대로 실행됨)
+        self.special_time_buffer.flush()
+        self.loading_date = selected_date
+
+        if self.manager.offline:
+            # 오프라인: 로컬 복제본에서 바로 조회
+            self.manager.set_current_date(selected_date)
+            self.refresh_timetable()
+            return
+
+        def show_day(tasks, day_special_times):
+            self.manager.set_current_date(selected_date, tasks)
+            self.refresh_timetable(day_special_times)
+            self.schedule_prefetch(selected_date)
+
+        def on_loaded(snapshot):
+            # 그 사이 다른 날짜를 선택했으면 무시
+            if self.loading_date == selected_date:
+                show_day(*snapshot)
+
+        def on_failed(error):
+            if self.loading_date == selected_date:
+                messagebox.showerror("조회 오류", f"데이터를 불러오지 못했습니다.\n{error}")
+
+        cached = self.manager.get_cached_day(selected_date)
+        if cached is None:
+            self.load_day(selected_date, callback=on_loaded, errback=on_failed)
+            return
+
+        # 캐시로 바로 표시 후 서버 변경 확인 토큰이 다르면 다시 조회
+        token, tasks, day_special_times = cached
+        show_day(tasks, day_special_times)
+
+        def on_checked(server_token):
+            if self.loading_date == selected_date and server_token != token:
+                self.load_day(selected_date, callback=on_loaded, errback=on_failed)
+
+        self.db_worker.get_day_version_async(selected_date, callback=on_checked, background=True)
+
+    def reload_current_day(self):
+        """현재 날짜의 업무/특수 시간을 작업 스레드에서 다시 조회한 후 그리기"""
+        work_date = self.manager.current_date
+        self.loading_date = work_date
+
+        def on_loaded(snapshot):
+            # 그 사이 다른 날짜를 선택했으면 무시
+            if self.loading_date == work_date:
+                tasks, day_special_times = snapshot
+                self.manager.set_current_date(work_date, tasks)
+                self.refresh_timetable(day_special_times)
+
+        def on_failed(error):
+            if self.loading_date == work_date:
+                messagebox.showerror("조회 오류", f"데이터를 불러오지 못했습니다.\n{error}")
+
+        self.load_day(work_date, callback=on_loaded, errback=on_failed)
+
+    def seed_default_special_times(self, slots):
+        """기본 특수 시간 일괄 생성 - 작업 스레드에서 저장 후 DB 상태로 다시 그림
+
+        화면은 이미 기본 업무 시간으로 그려져 있음 (다른 PC가 먼저 만든 행이 있으면 다시 그릴 때 반영)
+        """
+        if self.manager.offline:
+            # 오프라인: 로컬 복제본에 바로 저장 (대기열 등록)
+            self.manager.materialize_default_special_times(slots, self.current_user)
+            return
+
+        work_date = self.manager.current_date
+        self.manager.invalidate_day(work_date)
+
+        def on_seeded(ok):
+            if ok and self.loading_date == work_date:
+                self.refresh_timetable()
+
+        self.db_worker.submit(seed_default_special_times, work_date, slots,
+                              self.manager.base_minutes_for_slots(slots), self.current_user, callback=on_seeded)
+
+    def load_day(self, work_date, callback=None, errback=None, background=False):
+        """날짜 데이터 조회 후 날짜 이동 캐시에 저장 - callback((업무, 특수 시간))"""
+        generation = self.manager.day_generation(work_date)
+
+        def on_loaded(result):
+            token, tasks, day_special_times = result
+            self.manager.cache_day(work_date, token, tasks, day_special_times, generation)
+            if generation == self.manager.day_generation(work_date) and self.manager.replica.connection:
+                self.manager.replica.store_day(work_date, tasks, day_special_times)
+            if callback:
+                callback((tasks, day_special_times))
+
+        self.db_worker.load_day_async(work_date, callback=on_loaded, errback=errback, background=background)
+
+    def schedule_prefetch(self, work_date):
+        """날짜 표시 후 잠시 뒤 이전/다음 날 미리 조회 (다시 이동하면 이전 예약 취소)"""
+        if self.prefetch_id is not None:
+            self.root.after_cancel(self.prefetch_id)
+        self.prefetch_id = self.root.after(self.PREFETCH_DELAY_MS, lambda: self.prefetch_adjacent_days(work_date))
+
+    def prefetch_adjacent_days(self, work_date):
+        """캐시에 없는 이전/다음 날을 작업 스레드에서 조회 (작업 중 표시 없음)"""
+        self.prefetch_id = None
+        for day in (work_date - timedelta(days=1), work_date + timedelta(days=1)):
+            if not self.manager.has_cached_day(day):
+                self.load_day(day, background=True)
 
     def prev_date(self):
         """이전 날짜로 이동"""
@@ -890,49 +1162,29 @@ class TimeTableGUI:
         self.date_entry.set_date(date.today())
         self.on_date_changed()
 
-    def create_lunch_cell(self, parent, row, column, width=50, height=30, base_color="white"):
-        """점심시간 셀 생성 (빗금 패턴)"""
-        # Canvas로 빗금 패턴 그리기
-        cell_canvas = tk.Canvas(
-            parent,
-            width=width,
-            height=height,
-            bg=base_color,
-            highlightthickness=1,
-            highlightbackground="#999999"
-        )
-        cell_canvas.grid(row=row, column=column, sticky="nsew")
-
-        # 빗금 그리기 (대각선 패턴)
-        stripe_color = "#cccccc"  # 빗금 색상 (회색)
-        stripe_spacing = 8  # 빗금 간격
-
-        # 왼쪽 위에서 오른쪽 아래로 대각선
-        for i in range(-height, width + height, stripe_spacing):
-            cell_canvas.create_line(
-                i, 0, i + height, height,
-                fill=stripe_color, width=1
-            )
-
-        return cell_canvas
-
-    def refresh_timetable(self):
-        """타임테이블 새로고침 (시간 가로, 업무 세로 배치)"""
-        # 기존 위젯 삭제
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
-
-        self.time_slot_widgets = {}
-        self.header_cells = {}
-        self.grid_cells = {}  # 그리드 셀 초기화
+    @query_stats.ui_action("타임테이블 새로고침")
+    def refresh_timetable(self, day_special_times=None):
+        """타임테이블 새로고침 (시간 가로, 업무 세로 배치)
+
+        기본 업무 템플릿과 화면 크기가 이전과 같으면 그리드 구조를 그대로 두고
+        특수 행 색상과 추가 시간 텍스트만 갱신함 (날짜 이동 시)
+        day_special_times: 작업 스레드에서 미리 조회한 특수 시간 (없으면 조회 후 다시 호출)
+        """
+        if day_special_times is None:
+            # 저장 대기 중인 특수 시간을 먼저 작업 스레드에 넘긴 후 조회 (작업 순서대로 실행됨)
+            self.special_time_buffer.flush()
+            if not self.manager.offline:
+                self.reload_current_day()
+                return
+            day_special_times = self.manager.get_day_special_times()  # 오프라인: 로컬 복제본에서 바로 조회
 
         # 화면 크기 가져오기
         self.root.update_idletasks()
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
 
-        frame_width = self.canvas_frame.winfo_width()
-        frame_height = self.canvas_frame.winfo_height()
+        frame_width = self.main_canvas.winfo_width()
+        frame_height = self.main_canvas.winfo_height()
 
         if frame_width < 100:
             frame_width = int(screen_width * 0.95)  # 화면 너비의 95% 사용
@@ -947,110 +1199,18 @@ class TimeTableGUI:
         remaining_width = frame_width - col_label_width - corp_name_width - extra_time_width - 20
         time_col_width = max(40, int(remaining_width / len(time_slots)))  # 각 시간 컬럼 너비
 
-        # 기본 업무 템플릿 로드
-        default_tasks = self.manager.get_default_tasks()
-
-        # 기본 업무를 (업체명, 법인명) 조합으로 그룹화하고 최소 display_order 추출
-        tasks_by_company_corp = {}  # key: (업체명, 법인명), value: {time_slot: task_info}
-        company_corp_display_order = {}  # key: (업체명, 법인명), value: 최소 display_order
-        self.company_corp_colors = {}  # key: (업체명, 법인명), value: 색상코드
+        # 기본 업무 템플릿 인덱스 ((업체명, 법인명)별 시간 범위/기본 시간 - 템플릿이 바뀔 때만 다시 생성)
+        template = self.manager.get_template_index()
+        self.template = template
 
-        for display_order, task_info in default_tasks.items():
-            company = task_info.get("company", "")
-            corp_name = task_info.get("task", "")  # task_name이 법인명
-            time_slot = task_info.get("time_slot", "")
-            color = task_info.get("color", "")  # DB에서 색상 가져오기
-
-            if company and time_slot:
-                key = (company, corp_name)
-                if key not in tasks_by_company_corp:
-                    tasks_by_company_corp[key] = {}
-                    company_corp_display_order[key] = display_order
-                    # 첫 번째 색상 설정 (없으면 COMPANY_COLORS 기본값 사용)
-                    if color:
-                        self.company_corp_colors[key] = color
-                    else:
-                        self.company_corp_colors[key] = self.COMPANY_COLORS.get(company, "#d5f4e6")
-                else:
-                    # 해당 조합의 최소 display_order 유지
-                    if display_order < company_corp_display_order[key]:
-                        company_corp_display_order[key] = display_order
-                    # 색상이 있으면 업데이트 (더 작은 display_order의 색상 우선)
-                    if color and display_order <= company_corp_display_order[key]:
-                        self.company_corp_colors[key] = color
-                tasks_by_company_corp[key][time_slot] = task_info
+        # 업체+법인명별 색상 (DB에 저장된 색상, 없으면 COMPANY_COLORS 기본값)
+        self.company_corp_colors = {
+            key: color or self.COMPANY_COLORS.get(key[0], "#d5f4e6")
+            for key, color in template.colors.items()
+        }
 
         # display_order 순서대로 (업체명, 법인명) 정렬
-        all_company_corps = sorted(tasks_by_company_corp.keys(), key=lambda c: company_corp_display_order.get(c, 999))
-
-        # 헤더 행 (시간대)
-        tk.Label(
-            self.canvas_frame,
-            text="업체/시간",
-            font=("굴림체", 11, "bold"),
-            bg="#2c3e50",
-            fg="white",
-            relief=tk.RIDGE,
-            borderwidth=1
-        ).grid(row=0, column=0, sticky="nsew")
-
-        # 법인명 헤더
-        tk.Label(
-            self.canvas_frame,
-            text="법인명",
-            font=("굴림체", 11, "bold"),
-            bg="#2c3e50",
-            fg="white",
-            relief=tk.RIDGE,
-            borderwidth=1
-        ).grid(row=0, column=1, sticky="nsew")
-
-        for col_idx, time_slot in enumerate(time_slots):
-            # 점심시간(12:30~13:00) 헤더는 다른 색상으로 표시
-            is_lunch_time = time_slot in ["12:30", "13:00"]
-            header_bg = "#8B4513" if is_lunch_time else "#2c3e50"  # 점심시간은 갈색 배경
-            header_text = f"🍴{time_slot}" if is_lunch_time else time_slot  # 점심시간 아이콘 추가
-
-            header_label = tk.Label(
-                self.canvas_frame,
-                text=header_text,
-                font=("굴림체", 10, "bold"),
-                bg=header_bg,
-                fg="white",
-                relief=tk.RIDGE,
-                borderwidth=1,
-                cursor="hand2"
-            )
-            header_label.grid(row=0, column=col_idx + 2, sticky="nsew")  # +2로 변경 (법인명 열 추가)
-
-            # 마우스 드래그 이벤트 바인딩
-            header_label.bind("<Button-1>", lambda e, t=time_slot: self.on_drag_start(t))
-            header_label.bind("<B1-Motion>", lambda e, t=time_slot: self.on_drag_motion(t))
-            header_label.bind("<ButtonRelease-1>", lambda e: self.on_drag_end())
-            header_label.bind("<Enter>", lambda e, t=time_slot: self.on_drag_enter(t))
-
-            # 헤더 셀 저장
-            self.header_cells[time_slot] = header_label
-
-            self.canvas_frame.grid_columnconfigure(col_idx + 2, minsize=time_col_width, weight=1)  # +2로 변경
-
-        # 추가 시간 컬럼 헤더
-        tk.Label(
-            self.canvas_frame,
-            text="추가 시간",
-            font=("굴림체", 10, "bold"),
-            bg="#2c3e50",
-            fg="white",
-            relief=tk.RIDGE,
-            borderwidth=1
-        ).grid(row=0, column=len(time_slots) + 2, sticky="nsew")  # +2로 변경
-
-        self.canvas_frame.grid_columnconfigure(0, minsize=col_label_width)
-        self.canvas_frame.grid_columnconfigure(1, minsize=corp_name_width)  # 법인명 열 너비 (반응형)
-        self.canvas_frame.grid_columnconfigure(len(time_slots) + 2, minsize=extra_time_width)  # 추가시간 열 너비 (반응형)
-
-        # 헤더 행(row=0) 높이 1.5배로 설정
-        self.canvas_frame.grid_rowconfigure(0, minsize=30)  # 헤더 행 높이 (일반 행의 1.5배)
+        all_company_corps = template.corps
 
         # 행 높이 설정 (업체 수에 따라 자동 조정) - 90% (원본 대비)
         # 각 업체당: 기본업무 행(1) + 특수상황 행(1) + 구분선(0.3) = 약 2.3행
@@ -1060,245 +1220,70 @@ class TimeTableGUI:
         available_height = frame_height - 50  # 스크롤바/여백 제외
         row_height = max(19, min(38, int(available_height / total_rows)))  # 최소 19px, 최대 38px (90%)
 
-        # (업체명, 법인명) 조합별로 행 생성 (기본업무 행 + 특수상황 행, 한 줄 띄우기)
-        row_num = 1
-        for company_corp in all_company_corps:
-            company, corp_name = company_corp
-            company_tasks = tasks_by_company_corp.get(company_corp, {})
-            # DB에 저장된 색상 사용 (없으면 COMPANY_COLORS 기본값)
-            bg_color = self.company_corp_colors.get(company_corp, self.COMPANY_COLORS.get(company, "#d5f4e6"))
-
-            # 기본업무 행
-            tk.Label(
-                self.canvas_frame,
-                text=company,
-                font=("굴림체", 11, "bold"),
-                bg=bg_color,
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=0, sticky="nsew")
-            self.canvas_frame.grid_rowconfigure(row_num, minsize=row_height)
-
-            # 법인명 셀 (기본업무 행)
-            tk.Label(
-                self.canvas_frame,
-                text=corp_name,
-                font=("굴림체", 10),
-                bg=bg_color,
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=1, sticky="nsew")
-
-            # 각 시간대별 셀 - 시작시간부터 종료시간까지 색상 칠하기
-            for col_idx, time_slot in enumerate(time_slots):
-                # 해당 시간이 어떤 업무의 범위에 포함되는지 확인
-                cell_bg_color = "white"
-                cell_task_slot = None
-
-                for task_time_slot, task_info in company_tasks.items():
-                    start_time = task_time_slot
-                    end_time = task_info.get("end_time", task_time_slot)
-
-                    # 시작과 종료 인덱스 확인
-                    try:
-                        start_idx = time_slots.index(start_time)
-                        end_idx = time_slots.index(end_time)
-                        current_idx = time_slots.index(time_slot)
-
-                        # 현재 시간이 범위 내에 있으면 색상 적용
-                        if start_idx <= current_idx <= end_idx:
-                            cell_bg_color = bg_color
-                            cell_task_slot = task_time_slot
-                            break
-                    except ValueError:
-                        continue
-
-                # 점심시간(12:30~13:00) 여부 확인
-                is_lunch_time = time_slot in ["12:30", "13:00"]
-
-                # 셀 생성 (기본 업무 행은 클릭 불가)
-                if is_lunch_time:
-                    # 점심시간 셀 - 빗금 패턴 적용
-                    task_cell = self.create_lunch_cell(
-                        self.canvas_frame,
-                        row_num,
-                        col_idx + 2,
-                        width=time_col_width,
-                        height=row_height,
-                        base_color=cell_bg_color
-                    )
-                else:
-                    task_cell = tk.Label(
-                        self.canvas_frame,
-                        text="",
-                        font=("굴림체", 10),
-                        bg=cell_bg_color,
-                        relief=tk.RIDGE,
-                        borderwidth=1
-                    )
-                    task_cell.grid(row=row_num, column=col_idx + 2, sticky="nsew")  # +2로 변경
-
-                # 그리드 셀 저장 (기본 업무 행은 이벤트 바인딩 없음)
-                # (widget, company, corp_name, time_slot, is_special)
-                self.grid_cells[(row_num, col_idx + 2)] = (task_cell, company, corp_name, time_slot, False)  # +2로 변경
-
-            # 기본업무 행의 추가 시간 셀 (빈 셀)
-            tk.Label(
-                self.canvas_frame,
-                text="",
-                font=("굴림체", 10),
-                bg="white",
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=len(time_slots) + 2, sticky="nsew")  # +2로 변경
-
-            row_num += 1
-
-            # 특수상황 행
-            tk.Label(
-                self.canvas_frame,
-                text=f"{company} 특수",
-                font=("굴림체", 10),
-                bg="#f0f0f0",
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=0, sticky="nsew")
-            self.canvas_frame.grid_rowconfigure(row_num, minsize=row_height)
-
-            # 법인명 셀 (특수상황 행) - 동일한 법인명 표시
-            tk.Label(
-                self.canvas_frame,
-                text=corp_name,
-                font=("굴림체", 10),
-                bg="#f0f0f0",
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=1, sticky="nsew")
+        # 레이아웃 재사용 여부 (템플릿 지문 + 열 너비/행 높이가 같으면 재사용)
+        layout_key = (template.fingerprint, col_label_width, corp_name_width,
+                      time_col_width, extra_time_width, row_height)
+        reuse_layout = layout_key == self.grid_layout_key
 
-            # DB에서 특수 시간 정보 로드 (업체명, 법인명 조합)
-            special_times = self.manager.get_special_times(company, corp_name)
+        # 특수 시간 모델 구성 (DB 데이터가 없는 업체+법인명은 기본 업무 시간으로)
+        self.manager.load_special_masks(day_special_times, template)
 
-            # 각 시간대별 특수상황 셀
-            for col_idx, time_slot in enumerate(time_slots):
-                cell_bg_color = "white"
-
-                # 1. DB에 특수 시간 데이터가 있으면 그것을 사용
-                if special_times:
-                    if time_slot in special_times and special_times[time_slot]:
-                        cell_bg_color = bg_color
-                else:
-                    # 2. DB에 특수 시간 데이터가 없으면, 기본 업무 시간과 동일하게 초기화
-                    for task_time_slot, task_info in company_tasks.items():
-                        start_time = task_time_slot
-                        end_time = task_info.get("end_time", task_time_slot)
-
-                        # 시작과 종료 인덱스 확인
-                        try:
-                            start_idx = time_slots.index(start_time)
-                            end_idx = time_slots.index(end_time)
-                            current_idx = time_slots.index(time_slot)
-
-                            # 현재 시간이 범위 내에 있으면 색상 적용 및 DB 저장
-                            if start_idx <= current_idx <= end_idx:
-                                cell_bg_color = bg_color
-                                # DB에 특수 시간 저장 (기본 업무 시간으로 초기화) - 업체명, 법인명 포함
-                                self.manager.save_special_time(company, corp_name, time_slot, True, self.current_user)
-                                break
-                        except ValueError:
-                            continue
-
-                # 점심시간(12:30~13:00) 여부 확인
-                is_lunch_time = time_slot in ["12:30", "13:00"]
-
-                # 특수상황 셀 생성
-                if is_lunch_time:
-                    # 점심시간 셀 - 빗금 패턴 적용
-                    special_cell = self.create_lunch_cell(
-                        self.canvas_frame,
-                        row_num,
-                        col_idx + 2,
-                        width=time_col_width,
-                        height=row_height,
-                        base_color=cell_bg_color
-                    )
-                    special_cell.config(cursor="hand2")
-                else:
-                    special_cell = tk.Label(
-                        self.canvas_frame,
-                        text="",
-                        font=("굴림체", 10),
-                        bg=cell_bg_color,
-                        relief=tk.RIDGE,
-                        borderwidth=1,
-                        cursor="hand2"
-                    )
-                    special_cell.grid(row=row_num, column=col_idx + 2, sticky="nsew")  # +2로 변경
-
-                # 클릭 및 드래그 이벤트 바인딩 - 법인명도 전달
-                special_cell.bind("<Button-1>", lambda e, t=time_slot, c=company, cn=corp_name, r=row_num: self.on_cell_drag_start(e, t, c, cn, r))
-                special_cell.bind("<B1-Motion>", lambda e, t=time_slot, c=company, cn=corp_name, r=row_num: self.on_cell_drag_motion(e, t, c, cn, r))
-                special_cell.bind("<ButtonRelease-1>", lambda e: self.on_cell_drag_end(e))
-
-                # 그리드 셀 저장 (특수 행 플래그 추가) - 법인명도 저장
-                # (widget, company, corp_name, time_slot, is_special)
-                self.grid_cells[(row_num, col_idx + 2)] = (special_cell, company, corp_name, time_slot, True)  # +2로 변경
-
-            # 특수상황 행의 추가 시간 셀 - 시간 차이 계산
-            extra_time_text = self.calculate_extra_time(company, corp_name, company_tasks)
-            tk.Label(
-                self.canvas_frame,
-                text=extra_time_text,
-                font=("굴림체", 10, "bold"),
-                bg="#FFF9C4",
-                fg="#E65100",
-                relief=tk.RIDGE,
-                borderwidth=1
-            ).grid(row=row_num, column=len(time_slots) + 2, sticky="nsew")  # +2로 변경
-
-            row_num += 1
-
-            # 한 줄 띄우기
-            separator_height = max(5, int(row_height * 0.3))  # 행 높이의 30%
-            separator_label = tk.Label(
-                self.canvas_frame,
-                text="",
-                font=("굴림체", 10),
-                bg="#e0e0e0"
-            )
-            separator_label.grid(row=row_num, column=0, columnspan=len(time_slots) + 3, sticky="ew")  # +3으로 변경 (법인명 열 추가)
-            self.canvas_frame.grid_rowconfigure(row_num, minsize=separator_height)
-            row_num += 1
-
-        # 법인별 추가 시간 합계 계산
-        corp_name_totals = {}  # key: 법인명, value: 추가 시간(분)
-        total_extra_minutes = 0
+        # (업체명, 법인명) 조합별 행 데이터 구성 (기본업무 행 색상 + 특수상황 행 색상)
+        row_specs = []
+        seed_slots = []  # DB에 일괄 생성할 기본 특수 시간 (업체명, 법인명, 시간대)
+        for company_corp in all_company_corps:
+            company, corp_name = company_corp
+            bg_color = self.company_corp_colors[company_corp]
+
+            # 기본업무 행 - 시작시간부터 종료시간까지 색상 칠하기 (레이아웃 재사용 시 생략)
+            base_colors = [] if reuse_layout else template.row_colors(company_corp, bg_color)
+
+            # 특수상황 행 - 특수 시간 모델 기준으로 색칠
+            special_colors = template.mask_colors(self.manager.special_masks[company_corp], bg_color)
+
+            # DB에 특수 시간 데이터가 없으면 기본 업무 시간과 동일하게 초기화 (일괄 저장 대상에 추가)
+            if company_corp not in day_special_times:
+                seed_slots.extend((company, corp_name, time_slot)
+                                  for time_slot in template.covered_slots(company_corp))
+
+            row_specs.append({
+                "company": company,
+                "corp_name": corp_name,
+                "color": bg_color,
+                "base_colors": base_colors,
+                "special_colors": special_colors,
+            })
+
+        # DB에 특수 시간 데이터가 없던 업체+법인명은 기본 업무 시간으로 한 번에 초기화
+        if seed_slots:
+            self.seed_default_special_times(seed_slots)
+
+        if reuse_layout:
+            # 그리드 구조 유지 - 특수 행 색상만 변경된 셀 위주로 다시 칠함
+            for spec in row_specs:
+                self.grid.update_special_row(spec["company"], spec["corp_name"], spec["special_colors"])
+        else:
+            # Canvas에 그리드 그리기 (헤더 행 높이는 일반 행의 1.5배)
+            self.grid.build(row_specs, col_label_width, corp_name_width, time_col_width,
+                            extra_time_width, header_height=30, row_height=row_height)
+            self.grid_layout_key = layout_key
 
+        # 특수상황 행의 추가 시간 셀 - 시간 차이 계산
         for company_corp in all_company_corps:
             company, corp_name = company_corp
-            company_tasks = tasks_by_company_corp.get(company_corp, {})
-            extra_time_text = self.calculate_extra_time(company, corp_name, company_tasks)
-
-            # 시간 문자열 파싱 (+2h 30m, -1h, +45m 등)
-            extra_minutes = 0
-            if extra_time_text:
-                sign = 1 if extra_time_text.startswith("+") else -1
-                parts = extra_time_text[1:].split()  # + 또는 - 제거
-
-                for part in parts:
-                    if 'h' in part:
-                        hours = int(part.replace('h', ''))
-                        extra_minutes += sign * hours * 60
-                    elif 'm' in part:
-                        minutes = int(part.replace('m', ''))
-                        extra_minutes += sign * minutes
+            self.grid.set_extra_text(company, corp_name, self.calculate_extra_time(company, corp_name))
 
-            # 법인별 합계 누적
-            if corp_name:
-                if corp_name not in corp_name_totals:
-                    corp_name_totals[corp_name] = 0
-                corp_name_totals[corp_name] += extra_minutes
+        if reuse_layout and hasattr(self, 'summary_frame'):
+            # 하단 영역도 구조 유지 - 합계 레이블과 변동 내역만 갱신
+            self.update_total_extra_time()
+            if getattr(self, 'reason_period_mode', False):
+                self.refresh_reason_grid_with_data(self.reason_period_data, is_period=True)
+            else:
+                self.refresh_reason_grid()
+            return
 
-            total_extra_minutes += extra_minutes
+        # 법인별 추가 시간 합계 계산 (특수 시간 모델 기준, 분 단위 정수)
+        corp_name_totals, total_extra_minutes = self.calculate_extra_totals()
 
         # 하단 영역 초기화 (bottom_summary_frame 사용)
         for widget in self.bottom_summary_frame.winfo_children():
@@ -1317,6 +1302,7 @@ class TimeTableGUI:
         left_frame = tk.Frame(bottom_container, bg="white")
         left_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
         self.summary_frame = left_frame  # 나중에 업데이트할 수 있도록 참조 저장
+        self.corp_total_labels = {}  # 법인명 -> 합계 레이블
 
         # 법인별 합계 표시
         if corp_name_totals:
@@ -1335,56 +1321,23 @@ class TimeTableGUI:
 
             # 각 법인별 합계 표시
             for corp_name, minutes in sorted(corp_name_totals.items()):
-                if minutes != 0:
-                    abs_minutes = abs(minutes)
-                    hours = abs_minutes // 60
-                    mins = abs_minutes % 60
-                    sign_text = "+" if minutes > 0 else "-"
-
-                    if hours > 0 and mins > 0:
-                        time_text = f"{sign_text}{hours}h {mins}m"
-                    elif hours > 0:
-                        time_text = f"{sign_text}{hours}h"
-                    elif mins > 0:
-                        time_text = f"{sign_text}{mins}m"
-                    else:
-                        time_text = "0"
-                else:
-                    time_text = "0"
-
-                tk.Label(
+                corp_label = tk.Label(
                     left_frame,
-                    text=f"{corp_name}: {time_text}",
+                    text=f"{corp_name}: {format_extra_minutes(minutes)}",
                     font=("굴림체", 12),
                     bg="#E8F5E9",
                     fg="#2E7D32",
                     relief=tk.RIDGE,
                     borderwidth=1,
                     pady=3
-                ).pack(fill=tk.X)
-
-        # 총합을 시간 형식으로 변환
-        if total_extra_minutes != 0:
-            abs_minutes = abs(total_extra_minutes)
-            total_hours = abs_minutes // 60
-            total_mins = abs_minutes % 60
-            sign_text = "+" if total_extra_minutes > 0 else "-"
-
-            if total_hours > 0 and total_mins > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_hours}h {total_mins}m"
-            elif total_hours > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_hours}h"
-            elif total_mins > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_mins}m"
-            else:
-                total_text = "총 추가 시간: 0"
-        else:
-            total_text = "총 추가 시간: 0"
+                )
+                corp_label.pack(fill=tk.X)
+                self.corp_total_labels[corp_name] = corp_label
 
         # 총합 레이블 표시
         total_label = tk.Label(
             left_frame,
-            text=total_text,
+            text=f"총 추가 시간: {format_extra_minutes(total_extra_minutes)}",
             font=("굴림체", 16, "bold"),
             bg="#FFF9C4",
             fg="#E65100",
@@ -1394,6 +1347,7 @@ class TimeTableGUI:
             pady=5
         )
         total_label.pack(fill=tk.X, pady=(10, 0))
+        self.total_extra_label = total_label
 
         # 오른쪽 프레임 (변동 내역 그리드) - 화면의 50%
         right_frame = tk.Frame(bottom_container, bg="#f5f5f5", relief=tk.RIDGE, borderwidth=1)
@@ -1555,20 +1509,7 @@ class TimeTableGUI:
             username = reason_data.get('username', '')
 
             # 시간 포맷
-            if added_time != 0:
-                abs_min = abs(added_time)
-                hours = abs_min // 60
-                mins = abs_min % 60
-                sign = "+" if added_time > 0 else "-"
-
-                if hours > 0 and mins > 0:
-                    time_text = f"{sign}{hours}h {mins}m"
-                elif hours > 0:
-                    time_text = f"{sign}{hours}h"
-                else:
-                    time_text = f"{sign}{mins}m"
-            else:
-                time_text = "0"
+            time_text = format_extra_minutes(added_time)
 
             # 색상
             time_fg = "#e74c3c" if added_time > 0 else "#27ae60"
@@ -1672,20 +1613,7 @@ class TimeTableGUI:
             username = reason_data.get('username', '')
 
             # 시간 포맷
-            if added_time != 0:
-                abs_min = abs(added_time)
-                hours = abs_min // 60
-                mins = abs_min % 60
-                sign = "+" if added_time > 0 else "-"
-
-                if hours > 0 and mins > 0:
-                    time_text = f"{sign}{hours}h {mins}m"
-                elif hours > 0:
-                    time_text = f"{sign}{hours}h"
-                else:
-                    time_text = f"{sign}{mins}m"
-            else:
-                time_text = "0"
+            time_text = format_extra_minutes(added_time)
 
             # 색상
             time_fg = "#e74c3c" if added_time > 0 else "#27ae60"
@@ -1809,20 +1737,7 @@ class TimeTableGUI:
                 username = reason_data.get('username', '')
 
                 # 시간 포맷
-                if added_time != 0:
-                    abs_min = abs(added_time)
-                    hours = abs_min // 60
-                    mins = abs_min % 60
-                    sign = "+" if added_time > 0 else "-"
-
-                    if hours > 0 and mins > 0:
-                        time_text = f"{sign}{hours}h {mins}m"
-                    elif hours > 0:
-                        time_text = f"{sign}{hours}h"
-                    else:
-                        time_text = f"{sign}{mins}m"
-                else:
-                    time_text = "0"
+                time_text = format_extra_minutes(added_time)
 
                 col_offset = 0
                 if is_period:
@@ -1878,71 +1793,27 @@ class TimeTableGUI:
         except Exception as e:
             messagebox.showerror("오류", f"엑셀 파일 저장 중 오류가 발생했습니다.\n\n{str(e)}")
 
-    def calculate_extra_time(self, company, corp_name, company_tasks):
-        """기본 시간과 특수 시간의 차이 계산 (업체명+법인명 기준)"""
-        # 1. 기본 업무 시간 계산 (DB에서 가져온 데이터)
-        basic_minutes = 0
-        for time_slot, task_info in company_tasks.items():
-            start_time = time_slot
-            end_time = task_info.get("end_time", time_slot)
-
-            try:
-                start_parts = start_time.split(":")
-                start_minutes = int(start_parts[0]) * 60 + int(start_parts[1])
+    def calculate_extra_minutes(self, company, corp_name):
+        """기본 시간과 특수 시간의 차이 (분) - 특수 시간 모델 기준 (업체명+법인명)"""
+        if not self.template:
+            return 0
+        return self.manager.get_extra_minutes((company, corp_name), self.template)
 
-                end_parts = end_time.split(":")
-                end_minutes = int(end_parts[0]) * 60 + int(end_parts[1])
+    def calculate_extra_time(self, company, corp_name):
+        """기본 시간과 특수 시간의 차이 표시 문자열 (차이가 없으면 빈 문자열)"""
+        return format_extra_minutes(self.calculate_extra_minutes(company, corp_name), zero_text="")
 
-                # 시간 차이 (분)
-                duration = end_minutes - start_minutes + 30  # 30분 단위이므로 +30
-                basic_minutes += duration
-            except (ValueError, IndexError):
-                continue
-
-        # 2. 특수 시간 계산 (특수 행의 색칠된 셀)
-        special_minutes = 0
-        # DB에 저장된 업체 색상 사용 (없으면 기본값)
-        company_corp_key = (company, corp_name)
-        company_color = self.company_corp_colors.get(company_corp_key, self.COMPANY_COLORS.get(company, "#d5f4e6"))
-
-        # 특수 행의 셀들만 확인 (업체명+법인명 모두 일치해야 함)
-        for (row, col), value in self.grid_cells.items():
-            cell_widget = value[0]
-            cell_company = value[1]
-            cell_corp_name = value[2]
-            is_special = value[4] if len(value) >= 5 else False
-
-            if cell_company == company and cell_corp_name == corp_name and is_special:  # 특수 행
-                try:
-                    bg_color = cell_widget.cget("bg")
-                    # 색상이 업체 색상이면 30분 추가
-                    if bg_color.lower() == company_color.lower():
-                        special_minutes += 30
-                except:
-                    pass
-
-        # 3. 차이 계산
-        diff_minutes = special_minutes - basic_minutes
-
-        if diff_minutes == 0:
-            return ""
-
-        # 절대값으로 시간 계산
-        abs_minutes = abs(diff_minutes)
-        hours = abs_minutes // 60
-        minutes = abs_minutes % 60
-
-        # 부호 표시
-        sign = "+" if diff_minutes > 0 else "-"
-
-        if hours > 0 and minutes > 0:
-            return f"{sign}{hours}h {minutes}m"
-        elif hours > 0:
-            return f"{sign}{hours}h"
-        elif minutes > 0:
-            return f"{sign}{minutes}m"
-        else:
-            return ""
+    def calculate_extra_totals(self):
+        """법인별 추가 시간 합계와 전체 합계 (분)"""
+        corp_name_totals = {}  # key: 법인명, value: 추가 시간(분)
+        total_extra_minutes = 0
+        for company, corp_name in (self.template.corps if self.template else []):
+            extra_minutes = self.calculate_extra_minutes(company, corp_name)
+            # 법인별 합계 누적
+            if corp_name:
+                corp_name_totals[corp_name] = corp_name_totals.get(corp_name, 0) + extra_minutes
+            total_extra_minutes += extra_minutes
+        return corp_name_totals, total_extra_minutes
 
     def on_drag_start(self, time_slot):
         """드래그 시작 - 시작 시간 설정"""
@@ -1974,204 +1845,87 @@ class TimeTableGUI:
         self.reset_time_range_highlight()
 
     def highlight_time_range(self):
-        """선택된 시간 범위 하이라이트 (헤더 + 그리드 셀)"""
-        if not self.drag_start_time or not self.drag_end_time:
+        """선택된 시간 범위 하이라이트 (헤더 + 기본업무 행 셀, 달라진 열만 다시 칠함)"""
+        if not self.drag_start_time or not self.drag_end_time or not self.template:
             return
 
-        time_slots = self.manager.time_slots
-
-        try:
-            start_idx = time_slots.index(self.drag_start_time)
-            end_idx = time_slots.index(self.drag_end_time)
-
-            # 시작이 끝보다 나중이면 교환
-            if start_idx > end_idx:
-                start_idx, end_idx = end_idx, start_idx
-
-            # 모든 헤더 셀의 배경색 변경
-            for time_slot, header_cell in self.header_cells.items():
-                idx = time_slots.index(time_slot)
-                if start_idx <= idx <= end_idx:
-                    header_cell.config(bg="#f39c12")  # 주황색으로 하이라이트
-                else:
-                    header_cell.config(bg="#2c3e50")  # 원래 색상
+        slot_index = self.template.slot_index
+        start_idx = slot_index.get(self.drag_start_time)
+        end_idx = slot_index.get(self.drag_end_time)
+        if start_idx is None or end_idx is None:
+            return
 
-            # 그리드 셀의 배경색도 변경
-            for (row, col), (cell_widget, company, time_slot) in self.grid_cells.items():
-                try:
-                    idx = time_slots.index(time_slot)
-                    if start_idx <= idx <= end_idx:
-                        # 업체 색상으로 하이라이트
-                        bg_color = self.COMPANY_COLORS.get(company, "#d5f4e6")
-                        cell_widget.config(bg=bg_color)
-                    else:
-                        # 원래 색상 복원 (업무의 시작~종료 시간 범위 확인)
-                        all_tasks = self.manager.get_all_tasks()
-                        cell_bg_color = "white"
-
-                        for task_time_slot, task_info in all_tasks.items():
-                            if task_info.get("company", "") == company:
-                                start_time = task_time_slot
-                                end_time = task_info.get("end_time", task_time_slot)
-
-                                try:
-                                    task_start_idx = time_slots.index(start_time)
-                                    task_end_idx = time_slots.index(end_time)
-                                    current_idx = time_slots.index(time_slot)
-
-                                    if task_start_idx <= current_idx <= task_end_idx:
-                                        cell_bg_color = self.COMPANY_COLORS.get(company, "#d5f4e6")
-                                        break
-                                except ValueError:
-                                    continue
-
-                        cell_widget.config(bg=cell_bg_color)
-                except (ValueError, KeyError):
-                    pass
+        # 시작이 끝보다 나중이면 교환
+        if start_idx > end_idx:
+            start_idx, end_idx = end_idx, start_idx
 
-        except ValueError:
-            pass
+        # 범위 안 기본업무 행은 업체 색상 (특수 행은 사용자 입력이므로 그대로 둠)
+        self.grid.highlight_columns(start_idx, end_idx)
 
     def reset_time_range_highlight(self):
         """시간 범위 하이라이트 초기화"""
-        # 헤더 셀 초기화
-        for header_cell in self.header_cells.values():
-            header_cell.config(bg="#2c3e50")  # 원래 색상으로 복원
-
-        # 그리드 셀 초기화
-        time_slots = self.manager.time_slots
-        all_tasks = self.manager.get_all_tasks()
-
-        for (row, col), (cell_widget, company, time_slot) in self.grid_cells.items():
-            # 원래 색상 복원 (업무의 시작~종료 시간 범위 확인)
-            cell_bg_color = "white"
-
-            for task_time_slot, task_info in all_tasks.items():
-                if task_info.get("company", "") == company:
-                    start_time = task_time_slot
-                    end_time = task_info.get("end_time", task_time_slot)
-
-                    try:
-                        task_start_idx = time_slots.index(start_time)
-                        task_end_idx = time_slots.index(end_time)
-                        current_idx = time_slots.index(time_slot)
-
-                        if task_start_idx <= current_idx <= task_end_idx:
-                            cell_bg_color = self.COMPANY_COLORS.get(company, "#d5f4e6")
-                            break
-                    except ValueError:
-                        continue
-
-            cell_widget.config(bg=cell_bg_color)
+        self.grid.clear_highlight()
 
-    def on_cell_drag_start(self, event, time_slot, company, corp_name, row_num):
+    def on_cell_drag_start(self, row, col):
         """셀 드래그 시작 - 특수 행만 토글 가능"""
-        # 셀이 특수 행인지 확인
-        cell_key = None
-        is_special_row = False
-        for key, value in self.grid_cells.items():
-            if len(value) >= 5 and value[0] == event.widget:
-                cell_key = key
-                is_special_row = value[4]  # is_special 플래그
-                break
-
         # 기본 업무 행이면 아무것도 하지 않음
-        if not is_special_row:
+        if not self.grid.is_special_cell(row, col):
             return
 
+        company, corp_name, time_slot, _ = self.grid.cell_info[(row, col)]
+
         self.is_cell_dragging = True
         self.dragged_cells = set()
         self.drag_company = company  # 드래그 중인 업체 저장
         self.drag_corp_name = corp_name  # 드래그 중인 법인명 저장
 
-        # 클릭된 셀 찾기
-        clicked_widget = event.widget
-
-        if clicked_widget:
-            # 현재 셀의 배경색 확인
-            current_bg = clicked_widget.cget("bg")
-            # DB에 저장된 업체 색상 사용 (없으면 기본값)
-            company_corp_key = (company, corp_name)
-            bg_color = self.company_corp_colors.get(company_corp_key, self.COMPANY_COLORS.get(company, "#d5f4e6"))
-
-            # 색상 토글
-            if current_bg == bg_color or current_bg == bg_color.lower():
-                clicked_widget.config(bg="white")
-                is_colored = False
-            else:
-                clicked_widget.config(bg=bg_color)
-                is_colored = True
+        self.toggle_special_cell(row, col)
 
-            # DB에 저장 (업체명, 법인명 포함) + 로그 기록
-            self.manager.save_special_time(company, corp_name, time_slot, is_colored, self.current_user)
+    def on_cell_drag_motion(self, row, col):
+        """셀 드래그 중 - 특수 행만 토글 가능"""
+        if not self.is_cell_dragging or (row, col) in self.dragged_cells:
+            return
 
-            # 드래그된 셀 추가
-            self.dragged_cells.add(id(clicked_widget))
+        # 기본 업무 행이면 아무것도 하지 않음
+        if not self.grid.is_special_cell(row, col):
+            return
 
-    def on_cell_drag_motion(self, event, time_slot, company, corp_name, row_num):
-        """셀 드래그 중 - 특수 행만 토글 가능"""
-        if not self.is_cell_dragging:
+        # 같은 업체+법인명의 특수 행인지 확인
+        company, corp_name, time_slot, _ = self.grid.cell_info[(row, col)]
+        if company != self.drag_company or corp_name != self.drag_corp_name:
             return
 
-        # 현재 마우스 위치의 위젯 찾기
-        widget_under_mouse = self.root.winfo_containing(
-            self.root.winfo_pointerx(),
-            self.root.winfo_pointery()
-        )
+        self.toggle_special_cell(row, col)
 
-        if widget_under_mouse and id(widget_under_mouse) not in self.dragged_cells:
-            # 해당 위젯의 time_slot과 특수 행 여부 찾기
-            widget_time_slot = None
-            widget_row_num = None
-            widget_company = None
-            widget_corp_name = None
-            is_special_row = False
-            for (row, col), value in self.grid_cells.items():
-                cell_widget = value[0]
-                if cell_widget == widget_under_mouse:
-                    widget_company = value[1]
-                    widget_corp_name = value[2]
-                    widget_time_slot = value[3]
-                    widget_row_num = row
-                    is_special_row = value[4] if len(value) >= 5 else False
-                    break
-
-            # 기본 업무 행이면 아무것도 하지 않음
-            if widget_row_num is not None:
-                if not is_special_row:
-                    return
+    def toggle_special_cell(self, row, col):
+        """특수 행 셀 색상 토글 + 쓰기 버퍼에 추가 (DB 저장은 드래그 종료 시 일괄 처리)"""
+        company, corp_name, time_slot, _ = self.grid.cell_info[(row, col)]
 
-                # 같은 업체+법인명의 특수 행인지 확인
-                if widget_company != self.drag_company or widget_corp_name != self.drag_corp_name:
-                    return
+        # DB에 저장된 업체 색상 사용 (없으면 기본값)
+        company_corp_key = (company, corp_name)
+        bg_color = self.company_corp_colors.get(company_corp_key, self.COMPANY_COLORS.get(company, "#d5f4e6"))
 
-                # 현재 위젯의 배경색 확인
-                try:
-                    current_bg = widget_under_mouse.cget("bg")
-                    # DB에 저장된 업체 색상 사용 (없으면 기본값)
-                    company_corp_key = (widget_company, widget_corp_name)
-                    bg_color = self.company_corp_colors.get(company_corp_key, self.COMPANY_COLORS.get(widget_company, "#d5f4e6"))
-
-                    # 색상 토글
-                    if current_bg == bg_color or current_bg == bg_color.lower():
-                        widget_under_mouse.config(bg="white")
-                        is_colored = False
-                    else:
-                        widget_under_mouse.config(bg=bg_color)
-                        is_colored = True
+        # 특수 시간 모델 기준으로 토글 후 셀 색상 반영
+        slot_idx = col - 2
+        was_colored = self.manager.is_special_slot(company_corp_key, slot_idx)
+        is_colored = not was_colored
+        self.manager.set_special_slot(company_corp_key, slot_idx, is_colored)
+        self.grid.set_cell_color(row, col, bg_color if is_colored else "white")
 
-                    # DB에 저장 (업체명, 법인명 포함) + 로그 기록
-                    if widget_time_slot and widget_company and widget_corp_name:
-                        self.manager.save_special_time(widget_company, widget_corp_name, widget_time_slot, is_colored, self.current_user)
+        # 쓰기 버퍼에 추가 (업체명, 법인명 포함) - 로그는 저장 시 기록
+        self.special_time_buffer.add(self.manager.current_date, company, corp_name, time_slot,
+                                     was_colored, is_colored)
 
-                    # 드래그된 셀 추가
-                    self.dragged_cells.add(id(widget_under_mouse))
-                except:
-                    pass
+        # 드래그된 셀 추가
+        self.dragged_cells.add((row, col))
 
-    def on_cell_drag_end(self, event):
+    @query_stats.ui_action("특수 시간 드래그 저장")
+    def on_cell_drag_end(self, event=None):
         """셀 드래그 종료 - 차이 시간 업데이트 및 상태 저장"""
         if self.is_cell_dragging and self.drag_company and self.drag_corp_name:
+            # 드래그 중 모아둔 토글을 한 번에 저장
+            self.special_time_buffer.flush()
+
             # 드래그한 업체+법인명의 추가 시간 업데이트
             self.update_extra_time_display(self.drag_company, self.drag_corp_name)
 
@@ -2183,39 +1937,29 @@ class TimeTableGUI:
         self.drag_company = None
         self.drag_corp_name = None
 
+    def on_special_time_save_failed(self, changes):
+        """특수 시간 저장 재시도 실패 - 알림 후 DB 상태로 다시 표시"""
+        messagebox.showerror(
+            "저장 실패",
+            f"특수 시간 {len(changes)}건을 저장하지 못했습니다.\n"
+            "네트워크 연결을 확인한 후 다시 시도해주세요.\n\n"
+            "화면을 DB에 저장된 상태로 다시 불러옵니다."
+        )
+        self.refresh_timetable()
+
     def show_reason_dialog(self, company, corp_name):
         """특수 시간 변동 사유 입력 다이얼로그 (추가 시간 0이면 삭제)"""
         # 현재 추가 시간 계산
-        default_tasks = self.manager.get_default_tasks()
-        company_tasks = {}
-        for display_order, task_info in default_tasks.items():
-            if task_info.get("company", "") == company and task_info.get("task", "") == corp_name:
-                time_slot = task_info.get("time_slot", "")
-                if time_slot:
-                    company_tasks[time_slot] = task_info
-
-        extra_time_text = self.calculate_extra_time(company, corp_name, company_tasks)
+        extra_minutes = self.calculate_extra_minutes(company, corp_name)
+        extra_time_text = format_extra_minutes(extra_minutes)
         work_date = self.date_entry.get_date().strftime("%Y-%m-%d")
 
         # 추가 시간이 0이면 변동 내역에서 삭제
-        if not extra_time_text or extra_time_text in ["0", "+0m", "-0m"]:
+        if extra_minutes == 0:
             self.manager.db.delete_special_time_reason(work_date, company, corp_name)
             self.refresh_reason_grid()
             return
 
-        # 추가 시간을 분으로 변환
-        extra_minutes = 0
-        if extra_time_text:
-            sign = 1 if extra_time_text.startswith("+") else -1
-            parts = extra_time_text[1:].split()
-            for part in parts:
-                if 'h' in part:
-                    hours = int(part.replace('h', ''))
-                    extra_minutes += sign * hours * 60
-                elif 'm' in part:
-                    minutes = int(part.replace('m', ''))
-                    extra_minutes += sign * minutes
-
         # 사유 입력 다이얼로그
         dialog = tk.Toplevel(self.root)
         dialog.title("변동 사유 입력")
@@ -2293,144 +2037,27 @@ class TimeTableGUI:
 
     def update_extra_time_display(self, company, corp_name):
         """특정 업체+법인명의 추가 시간 표시 업데이트 및 총합 업데이트"""
-        # 해당 업체+법인명의 특수 행을 찾아서 추가 시간 셀 업데이트
-        time_slots = self.manager.time_slots
-
-        # 기본 업무 템플릿에서 업체+법인명별 기본 업무 정보 가져오기
-        default_tasks = self.manager.get_default_tasks()
-        company_tasks = {}
-        for display_order, task_info in default_tasks.items():
-            if task_info.get("company", "") == company and task_info.get("task", "") == corp_name:
-                time_slot = task_info.get("time_slot", "")
-                if time_slot:
-                    company_tasks[time_slot] = task_info
-
         # 추가 시간 계산
-        extra_time_text = self.calculate_extra_time(company, corp_name, company_tasks)
-
-        # 추가 시간 셀 찾아서 업데이트 (특수 행의 마지막 컬럼)
-        for (row, col), value in self.grid_cells.items():
-            cell_company = value[1]
-            cell_corp_name = value[2]
-            is_special = value[4] if len(value) >= 5 else False
-
-            # 특수 행이고 해당 업체+법인명인 경우
-            if cell_company == company and cell_corp_name == corp_name and is_special:
-                # 해당 행의 마지막 컬럼 (추가 시간 셀) 찾기
-                extra_time_col = len(time_slots) + 2  # +2로 변경 (법인명 열 추가)
-
-                # Canvas frame의 모든 위젯 검색
-                for widget in self.canvas_frame.grid_slaves(row=row, column=extra_time_col):
-                    if isinstance(widget, tk.Label):
-                        widget.config(text=extra_time_text)
-                        break
-                break
+        extra_time_text = self.calculate_extra_time(company, corp_name)
+
+        # 추가 시간 셀 업데이트 (특수 행의 마지막 컬럼)
+        self.grid.set_extra_text(company, corp_name, extra_time_text)
 
         # 총 추가 시간 업데이트
         self.update_total_extra_time()
 
     def update_total_extra_time(self):
         """총 추가 시간 및 법인별 합계 레이블 업데이트"""
-        # 기본 업무 템플릿 로드
-        default_tasks = self.manager.get_default_tasks()
-
-        # 기본 업무를 (업체명, 법인명) 조합으로 그룹화
-        tasks_by_company_corp = {}
-        for display_order, task_info in default_tasks.items():
-            company = task_info.get("company", "")
-            corp_name = task_info.get("task", "")
-            time_slot = task_info.get("time_slot", "")
-            if company and time_slot:
-                key = (company, corp_name)
-                if key not in tasks_by_company_corp:
-                    tasks_by_company_corp[key] = {}
-                tasks_by_company_corp[key][time_slot] = task_info
-
-        # 법인별 추가 시간 합계 계산
-        corp_name_totals = {}
-        total_extra_minutes = 0
+        corp_name_totals, total_extra_minutes = self.calculate_extra_totals()
 
-        for company_corp, company_tasks in tasks_by_company_corp.items():
-            company, corp_name = company_corp
-            extra_time_text = self.calculate_extra_time(company, corp_name, company_tasks)
-
-            # 시간 문자열 파싱 (+2h 30m, -1h, +45m 등)
-            extra_minutes = 0
-            if extra_time_text:
-                sign = 1 if extra_time_text.startswith("+") else -1
-                parts = extra_time_text[1:].split()  # + 또는 - 제거
-
-                for part in parts:
-                    if 'h' in part:
-                        hours = int(part.replace('h', ''))
-                        extra_minutes += sign * hours * 60
-                    elif 'm' in part:
-                        minutes = int(part.replace('m', ''))
-                        extra_minutes += sign * minutes
+        # 법인별 합계 레이블 업데이트
+        for corp_name, corp_label in getattr(self, 'corp_total_labels', {}).items():
+            if corp_name in corp_name_totals:
+                corp_label.config(text=f"{corp_name}: {format_extra_minutes(corp_name_totals[corp_name])}")
 
-            # 법인별 합계 누적
-            if corp_name:
-                if corp_name not in corp_name_totals:
-                    corp_name_totals[corp_name] = 0
-                corp_name_totals[corp_name] += extra_minutes
-
-            total_extra_minutes += extra_minutes
-
-        # 법인별 합계 레이블 업데이트 (summary_frame에서 찾기)
-        if hasattr(self, 'summary_frame'):
-            for widget in self.summary_frame.winfo_children():
-                if isinstance(widget, tk.Label):
-                    text = widget.cget("text")
-                    # 법인별 합계 행 업데이트 (형식: "법인명: +2h 30m")
-                    if ":" in text and text != "총 추가 시간: 0" and not text.startswith("총 추가 시간:") and not text == "법인별 추가 시간 합계":
-                        parts = text.split(":", 1)
-                        if len(parts) == 2:
-                            label_corp_name = parts[0].strip()
-                            if label_corp_name in corp_name_totals:
-                                minutes = corp_name_totals[label_corp_name]
-                                if minutes != 0:
-                                    abs_minutes = abs(minutes)
-                                    hours = abs_minutes // 60
-                                    mins = abs_minutes % 60
-                                    sign_text = "+" if minutes > 0 else "-"
-
-                                    if hours > 0 and mins > 0:
-                                        time_text = f"{sign_text}{hours}h {mins}m"
-                                    elif hours > 0:
-                                        time_text = f"{sign_text}{hours}h"
-                                    elif mins > 0:
-                                        time_text = f"{sign_text}{mins}m"
-                                    else:
-                                        time_text = "0"
-                                else:
-                                    time_text = "0"
-
-                                widget.config(text=f"{label_corp_name}: {time_text}")
-
-        # 총합을 시간 형식으로 변환
-        if total_extra_minutes != 0:
-            abs_minutes = abs(total_extra_minutes)
-            total_hours = abs_minutes // 60
-            total_mins = abs_minutes % 60
-            sign_text = "+" if total_extra_minutes > 0 else "-"
-
-            if total_hours > 0 and total_mins > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_hours}h {total_mins}m"
-            elif total_hours > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_hours}h"
-            elif total_mins > 0:
-                total_text = f"총 추가 시간: {sign_text}{total_mins}m"
-            else:
-                total_text = "총 추가 시간: 0"
-        else:
-            total_text = "총 추가 시간: 0"
-
-        # 총합 레이블 찾아서 업데이트 (summary_frame에서 찾기)
-        if hasattr(self, 'summary_frame'):
-            for widget in self.summary_frame.winfo_children():
-                if isinstance(widget, tk.Label) and widget.cget("text").startswith("총 추가 시간:"):
-                    widget.config(text=total_text)
-                    break
+        # 총합 레이블 업데이트
+        if getattr(self, 'total_extra_label', None) is not None:
+            self.total_extra_label.config(text=f"총 추가 시간: {format_extra_minutes(total_extra_minutes)}")
 
     def export_to_excel(self):
         """Excel 파일로 내보내기"""
@@ -2859,33 +2486,17 @@ class TimeTableGUI:
             if not messagebox.askyesno("삽입 확인", f"순서 {new_display_order}번에 새 기본 업무를 삽입하시겠습니까?\n\n기존 {new_display_order}번 이상 항목들은 순서가 1씩 밀립니다."):
                 return
 
-            # 1. 기존 데이터에서 new_display_order 이상인 항목들의 순서를 +1씩 증가
-            default_tasks = self.manager.get_default_tasks()
-            tasks_to_update = []
-            for display_order_key, info in default_tasks.items():
-                existing_order = info.get("display_order", 999)
-                if existing_order >= new_display_order:
-                    tasks_to_update.append((display_order_key, info, existing_order))
-
-            # 순서를 역순으로 업데이트 (충돌 방지)
-            tasks_to_update.sort(key=lambda x: x[2], reverse=True)
-            for display_order_key, info, old_order in tasks_to_update:
-                self.manager.add_default_task(
-                    info.get("time_slot", ""),
-                    info.get("task", ""),
-                    info.get("description", ""),
-                    info.get("company", ""),
-                    info.get("end_time", ""),
-                    old_order + 1,
-                    info.get("color", "")  # 기존 색상 유지
-                )
-
-            # 2. 새 항목을 지정된 순서에 삽입 (색상 포함)
-            success = self.manager.add_default_task(time_slot, task_name, description, company, end_time, new_display_order, color)
-
-            # 3. 특수상황이 있으면 실제 업무 테이블에 저장
-            if special_note:
-                self.manager.add_task(time_slot, task_name, description, special_note, company, end_time)
+            # 순서 밀기 + 새 항목 삽입 + 특수상황 저장을 하나의 트랜잭션으로 (중간에 실패하면 모두 되돌림)
+            with self.manager.db.transaction() as tx:
+                # 1. 기존 new_display_order 이상 항목은 순서를 1씩 밀고 새 항목 삽입 (색상 포함)
+                success = self.manager.insert_default_task(new_display_order, time_slot, task_name, description,
+                                                           company, end_time, color)
+                if not success:
+                    tx.failed = True  # 순서 밀기/삽입 실패 - 특수상황도 저장하지 않음
+                elif special_note:
+                    # 2. 특수상황이 있으면 실제 업무 테이블에 저장
+                    self.manager.add_task(time_slot, task_name, description, special_note, company, end_time)
+            success = success and tx.ok
 
             if success:
                 refresh_default_list()
@@ -3008,6 +2619,9 @@ class TimeTableGUI:
         result_text.pack(fill=tk.BOTH, expand=True)
         result_scroll.config(command=result_text.yview)
 
+        query_seq = [0]  # 마지막 조회 번호 (이전 조회 결과 무시용)
+
+        @query_stats.ui_action("기간별 통계 조회")
         def calculate_period_summary():
             """선택된 기간의 법인별 추가 시간 집계"""
             start_date = start_date_entry.get_date()
@@ -3029,152 +2643,77 @@ class TimeTableGUI:
             result_text.insert(tk.END, f"기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')} (총 {total_days}일)\n", "header")
             result_text.insert(tk.END, f"{'='*60}\n\n", "header")
 
-            # 법인별 추가 시간 집계를 위한 딕셔너리
-            corp_totals = {}  # key: corp_name, value: total minutes
-
-            # 날짜별로 반복
-            current_date = start_date
-            date_count = 0
-
-            while current_date <= end_date:
-                # 해당 날짜로 manager의 현재 날짜 설정 (임시)
-                self.manager.set_current_date(current_date)
-
-                # 해당 날짜의 기본 업무 로드
-                default_tasks = self.manager.get_default_tasks()
-
-                # (company, corp_name)별로 그룹화
-                tasks_by_company_corp = {}
-                for display_order, task_info in default_tasks.items():
-                    company = task_info.get("company", "")
-                    corp_name = task_info.get("task", "")
-                    time_slot = task_info.get("time_slot", "")
-                    if company and time_slot:
-                        key = (company, corp_name)
-                        if key not in tasks_by_company_corp:
-                            tasks_by_company_corp[key] = {}
-                        tasks_by_company_corp[key][time_slot] = task_info
-
-                # 각 (company, corp_name)에 대해 해당 날짜의 추가 시간 계산
-                for company_corp, company_tasks in tasks_by_company_corp.items():
-                    company, corp_name = company_corp
-
-                    if not corp_name:
-                        continue
-
-                    # 해당 날짜의 특수 시간 조회 (manager의 current_date가 current_date로 설정됨)
-                    special_times = self.manager.get_special_times(company, corp_name)
-
-                    # 추가 시간 계산 (calculate_extra_time 메서드와 동일한 로직)
-                    # 1. 기본 업무 시간 계산
-                    basic_minutes = 0
-                    for time_slot, task_info in company_tasks.items():
-                        start_time = time_slot
-                        end_time = task_info.get("end_time", time_slot)
-
-                        try:
-                            start_parts = start_time.split(":")
-                            start_mins = int(start_parts[0]) * 60 + int(start_parts[1])
-
-                            end_parts = end_time.split(":")
-                            end_mins = int(end_parts[0]) * 60 + int(end_parts[1])
-
-                            # 시간 차이 (분) - 30분 단위이므로 +30
-                            duration = end_mins - start_mins + 30
-                            basic_minutes += duration
-                        except (ValueError, IndexError):
-                            continue
-
-                    # 2. 특수 시간 계산 (색칠된 셀 개수 × 30분)
-                    special_minutes = 0
-                    time_slots_list = self.manager.time_slots
-                    for time_slot in time_slots_list:
-                        if special_times.get(time_slot, False):
-                            special_minutes += 30
-
-                    # 3. 차이 계산
-                    extra_minutes = special_minutes - basic_minutes
-
-                    # 법인별 누적
-                    if corp_name not in corp_totals:
-                        corp_totals[corp_name] = 0
-                    corp_totals[corp_name] += extra_minutes
-
-                date_count += 1
-                current_date += timedelta(days=1)
-
-            # 조회 완료 후 원래 날짜로 복원
-            self.manager.set_current_date(self.date_entry.get_date())
-
-            # 결과 출력
-            if not corp_totals:
-                result_text.insert(tk.END, "해당 기간에 추가 시간 데이터가 없습니다.\n", "normal")
-            else:
-                result_text.insert(tk.END, f"총 {total_days}일 기간 동안의 법인별 추가 시간 집계:\n\n", "subheader")
+            # 기본 업무 템플릿 인덱스 (기간 전체에 동일하게 적용)
+            template = self.manager.get_template_index()
+
+            result_text.mark_set("loading_start", "end-1c")
+            result_text.mark_gravity("loading_start", tk.LEFT)
+            result_text.insert(tk.END, "조회 중...\n", "normal")
+            result_text.config(state=tk.DISABLED)
 
-                # 법인명 순으로 정렬하여 출력
-                for corp_name in sorted(corp_totals.keys()):
-                    minutes = corp_totals[corp_name]
+            query_seq[0] += 1
+            seq = query_seq[0]
 
-                    # 시간 포맷팅
-                    if minutes == 0:
-                        time_text = "0"
-                    else:
-                        sign = "+" if minutes > 0 else "-"
-                        abs_minutes = abs(minutes)
-                        hours = abs_minutes // 60
-                        mins = abs_minutes % 60
-
-                        if hours > 0 and mins > 0:
-                            time_text = f"{sign}{hours}h {mins}m"
-                        elif hours > 0:
-                            time_text = f"{sign}{hours}h"
+            def show_result(daily_extra):
+                # 조회 중 창을 닫았거나 다시 조회했으면 무시
+                if not summary_window.winfo_exists() or seq != query_seq[0]:
+                    return
+                result_text.config(state=tk.NORMAL)
+                result_text.delete("loading_start", "end-1c")  # "조회 중..." 제거
+
+                # 법인별 추가 시간 집계 (일별 집계 행 + 집계 없는 날은 -기본 시간)
+                corp_totals = self.manager.summarize_period(daily_extra, template, total_days)
+
+                # 결과 출력
+                if not corp_totals:
+                    result_text.insert(tk.END, "해당 기간에 추가 시간 데이터가 없습니다.\n", "normal")
+                else:
+                    result_text.insert(tk.END, f"총 {total_days}일 기간 동안의 법인별 추가 시간 집계:\n\n", "subheader")
+
+                    # 법인명 순으로 정렬하여 출력
+                    for corp_name in sorted(corp_totals.keys()):
+                        minutes = corp_totals[corp_name]
+
+                        # 시간 포맷팅
+                        time_text = format_extra_minutes(minutes)
+
+                        # 법인명과 추가 시간 출력
+                        result_text.insert(tk.END, f"  {corp_name:20s} : ", "normal")
+
+                        # 양수면 빨간색, 음수면 파란색
+                        if minutes > 0:
+                            result_text.insert(tk.END, f"{time_text}\n", "positive")
+                        elif minutes < 0:
+                            result_text.insert(tk.END, f"{time_text}\n", "negative")
                         else:
-                            time_text = f"{sign}{mins}m"
+                            result_text.insert(tk.END, f"{time_text}\n", "normal")
 
-                    # 법인명과 추가 시간 출력
-                    result_text.insert(tk.END, f"  {corp_name:20s} : ", "normal")
+                    # 전체 합계
+                    total_minutes = sum(corp_totals.values())
 
-                    # 양수면 빨간색, 음수면 파란색
-                    if minutes > 0:
-                        result_text.insert(tk.END, f"{time_text}\n", "positive")
-                    elif minutes < 0:
-                        result_text.insert(tk.END, f"{time_text}\n", "negative")
-                    else:
-                        result_text.insert(tk.END, f"{time_text}\n", "normal")
+                    result_text.insert(tk.END, f"\n{'-'*60}\n", "normal")
 
-                # 전체 합계
-                total_minutes = sum(corp_totals.values())
+                    # 전체 합계 포맷팅
+                    total_text = format_extra_minutes(total_minutes)
 
-                result_text.insert(tk.END, f"\n{'-'*60}\n", "normal")
+                    result_text.insert(tk.END, f"전체 합계: ", "subheader")
 
-                # 전체 합계 포맷팅
-                if total_minutes == 0:
-                    total_text = "0"
-                else:
-                    sign = "+" if total_minutes > 0 else "-"
-                    abs_minutes = abs(total_minutes)
-                    hours = abs_minutes // 60
-                    mins = abs_minutes % 60
-
-                    if hours > 0 and mins > 0:
-                        total_text = f"{sign}{hours}h {mins}m"
-                    elif hours > 0:
-                        total_text = f"{sign}{hours}h"
+                    if total_minutes > 0:
+                        result_text.insert(tk.END, f"{total_text}\n", "positive_bold")
+                    elif total_minutes < 0:
+                        result_text.insert(tk.END, f"{total_text}\n", "negative_bold")
                     else:
-                        total_text = f"{sign}{mins}m"
-
-                result_text.insert(tk.END, f"전체 합계: ", "subheader")
+                        result_text.insert(tk.END, f"{total_text}\n", "subheader")
 
-                if total_minutes > 0:
-                    result_text.insert(tk.END, f"{total_text}\n", "positive_bold")
-                elif total_minutes < 0:
-                    result_text.insert(tk.END, f"{total_text}\n", "negative_bold")
-                else:
-                    result_text.insert(tk.END, f"{total_text}\n", "subheader")
+                # 텍스트 편집 불가 설정
+                result_text.config(state=tk.DISABLED)
 
-            # 텍스트 편집 불가 설정
-            result_text.config(state=tk.DISABLED)
+            # 일별 추가 시간 집계 테이블에서 기간 조회 (작업 스레드)
+            self.db_worker.submit(
+                lambda db: db.get_daily_extra_by_period(start_date, end_date),
+                callback=show_result,
+                errback=lambda e: messagebox.showerror("조회 오류", f"기간 통계 조회 실패: {e}")
+            )
 
         # 조회 버튼 (둥근 모서리)
         btn_query = RoundedButton(
@@ -3204,6 +2743,8 @@ class TimeTableGUI:
     def logout(self):
         """로그아웃"""
         if messagebox.askyesno("로그아웃", "로그아웃 하시겠습니까?"):
+            self.special_time_buffer.flush()
+            self.db_worker.shutdown()
             self.manager.close()
             self.root.destroy()
             # 새 창으로 로그인 화면 표시
@@ -3214,6 +2755,8 @@ class TimeTableGUI:
     def exit_program(self):
         """프로그램 종료"""
         if messagebox.askyesno("종료", "프로그램을 종료하시겠습니까?"):
+            self.special_time_buffer.flush()
+            self.db_worker.shutdown()
             self.manager.close()
             self.root.destroy()
 
@@ -3269,7 +2812,7 @@ class TimeTableGUI:
                 return
 
             # 현재 비밀번호 확인
-            db = Database()
+            db = create_database()
             db.connect()
             user = db.authenticate_user(self.current_user['username'], current)
 
@@ -3393,9 +2936,15 @@ class TimeTableGUI:
         x_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
         x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # 스크롤이 끝에 가까워지면 다음 페이지 조회
+        def on_tree_scroll(first, last):
+            y_scrollbar.set(first, last)
+            if float(last) >= 0.95:
+                load_next_page()
+
         log_tree = ttk.Treeview(
             tree_frame, columns=columns, show="headings", height=20,
-            yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set
+            yscrollcommand=on_tree_scroll, xscrollcommand=x_scrollbar.set
         )
         log_tree.pack(fill=tk.BOTH, expand=True)
 
@@ -3418,24 +2967,44 @@ class TimeTableGUI:
                   bg="#95a5a6", fg="white", radius=6,
                   command=log_window.destroy).pack()
 
-        # === 조회 함수 ===
+        # === 조회 함수 (최신순, 스크롤 시 다음 페이지) ===
+        page_size = 200
+        # filters: 현재 검색 조건, before: 마지막 행의 (created_at, id), seq: 다시 조회 시 이전 응답 무시용
+        page_state = {"filters": {}, "before": None, "count": 0, "loading": False, "done": True, "seq": 0}
+
+        @query_stats.ui_action("변경 로그 조회")
         def search_logs():
             for item in log_tree.get_children():
                 log_tree.delete(item)
 
-            start_dt = start_date_entry.get_date() if use_date_filter.get() else None
-            end_dt = end_date_entry.get_date() if use_date_filter.get() else None
-            company = company_var.get() if company_var.get() != "전체" else None
-            username = user_var.get() if user_var.get() != "전체" else None
+            page_state.update(
+                filters={
+                    "start_date": start_date_entry.get_date() if use_date_filter.get() else None,
+                    "end_date": end_date_entry.get_date() if use_date_filter.get() else None,
+                    "company": company_var.get() if company_var.get() != "전체" else None,
+                    "username": user_var.get() if user_var.get() != "전체" else None,
+                },
+                before=None, count=0, loading=False, done=False, seq=page_state["seq"] + 1
+            )
+            result_label.config(text="조회 중...")
+            load_next_page()
+
+        @query_stats.ui_action("변경 로그 조회")
+        def load_next_page():
+            if page_state["loading"] or page_state["done"]:
+                return
+            page_state["loading"] = True
+            seq = page_state["seq"]
+            self.db_worker.get_change_logs_async(
+                callback=lambda logs: show_logs(logs, seq),
+                errback=lambda e: (messagebox.showerror("오류", f"로그 조회 실패: {e}"), show_logs([], seq)),
+                limit=page_size, before=page_state["before"], **page_state["filters"]
+            )
 
-            try:
-                logs = self.manager.get_change_logs(
-                    start_date=start_dt, end_date=end_dt,
-                    company=company, username=username
-                )
-            except Exception as e:
-                messagebox.showerror("오류", f"로그 조회 실패: {e}")
-                logs = []
+        def show_logs(logs, seq):
+            # 조회 중 창을 닫았거나 다시 조회했으면 무시
+            if not log_window.winfo_exists() or seq != page_state["seq"]:
+                return
 
             for log in logs:
                 log_tree.insert("", tk.END, values=(
@@ -3450,7 +3019,14 @@ class TimeTableGUI:
                     log.get('new_value', '')
                 ))
 
-            result_label.config(text=f"조회 결과: {len(logs)}건")
+            page_state["count"] += len(logs)
+            page_state["done"] = len(logs) < page_size
+            if logs:
+                page_state["before"] = (logs[-1]['created_at'], logs[-1]['id'])
+            page_state["loading"] = False
+
+            more_text = "" if page_state["done"] else " (스크롤하면 더 불러옵니다)"
+            result_label.config(text=f"조회 결과: {page_state['count']}건{more_text}")
 
         # 버튼에 명령 연결
         search_btn.config(command=search_logs)
@@ -3461,6 +3037,42 @@ class TimeTableGUI:
         # 업데이트 강제
         log_window.update_idletasks()
 
+    def show_query_stats(self):
+        """화면 작업별 쿼리 수/시간 통계 창 (관리자 전용, 관리 > 쿼리 계측이 켜져 있을 때 집계)"""
+        if not self.current_user or not self.current_user.get('is_admin'):
+            messagebox.showwarning("권한 없음", "관리자만 사용할 수 있습니다.")
+            return
+
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("쿼리 통계")
+        stats_window.geometry("800x400")
+        stats_window.transient(self.root)
+
+        stats_text = scrolledtext.ScrolledText(stats_window, font=("굴림체", 10), wrap=tk.NONE)
+        stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        def refresh_stats():
+            stats_text.config(state=tk.NORMAL)
+            stats_text.delete(1.0, tk.END)
+            if not query_stats.is_enabled():
+                stats_text.insert(tk.END, "쿼리 계측이 꺼져 있습니다. (관리 > 쿼리 계측)\n\n")
+            stats_text.insert(tk.END, query_stats.format_summary() or "집계된 쿼리가 없습니다.")
+            stats_text.insert(tk.END, f"\n\n느린 쿼리 ({query_stats.SLOW_QUERY_MS}ms 이상) 로그: "
+                                      f"{query_stats.get_slow_log_path()}")
+            stats_text.config(state=tk.DISABLED)
+
+        def reset_stats():
+            query_stats.reset()
+            refresh_stats()
+
+        btn_frame = tk.Frame(stats_window)
+        btn_frame.pack(pady=(0, 10))
+        tk.Button(btn_frame, text="새로고침", width=10, command=refresh_stats).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="초기화", width=10, command=reset_stats).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="닫기", width=10, command=stats_window.destroy).pack(side=tk.LEFT, padx=5)
+
+        refresh_stats()
+
     def show_user_management(self):
         """사용자 관리 창 (관리자 전용)"""
         if not self.current_user or not self.current_user.get('is_admin'):
@@ -3480,7 +3092,7 @@ class TimeTableGUI:
         user_window.geometry(f"+{x}+{y}")
 
         # 데이터베이스 연결
-        db = Database()
+        db = create_database()
         db.connect()
 
         # 사용자 목록 프레임
@@ -3711,6 +3323,10 @@ class TimeTableGUI:
 
     def on_closing(self):
         """프로그램 종료 시 호출"""
+        if self.replica_sync_id is not None:
+            self.root.after_cancel(self.replica_sync_id)
+        self.special_time_buffer.flush()
+        self.db_worker.shutdown()
         self.manager.close()
         self.root.destroy()
 
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 스키마 마이그레이션
+SchemaVersion 테이블에 적용된 버전을 기록하고, 아직 적용되지 않은 마이그레이션만 순서대로 실행
+
+- 마이그레이션마다 하나의 트랜잭션 (실패하면 그 버전은 적용되지 않음)
+- 모든 구문은 IF NOT EXISTS / COL_LENGTH 확인을 거치므로, 예전 update_*.py 스크립트로
+  일부 변경이 이미 반영된 DB에서도 처음부터 다시 실행해도 안전함
+- 새 DB: python migrations.py 한 번으로 최신 스키마
+"""
+import sys
+import io
+import hashlib
+
+# 기본 관리자 계정 (비밀번호: admin123)
+DEFAULT_ADMIN_PASSWORD_HASH = hashlib.sha256('admin123'.encode()).hexdigest()
+
+
+def backfill_daily_extra_time(db):
+    """기존 특수 시간으로 일별 추가 시간 집계 채우기 (rebuild_daily_extra_time.py와 같은 계산)
+
+    집계가 없는 날은 기간 통계에서 -기본 시간으로 계산되므로 v10 이후 바로 실행
+    """
+    from template_index import TemplateIndex, create_time_slots
+
+    if db.get_default_tasks_version() is None:
+        return False  # 템플릿 조회 실패 (빈 템플릿과 구분)
+    template = TemplateIndex(db.get_default_tasks(), create_time_slots())
+    return db.rebuild_daily_extra_time(template.base_minutes) >= 0
+
+
+# (버전, 설명, [SQL 구문 또는 (SQL, 파라미터)] 또는 함수) - 순서대로 적용, 이미 배포된 항목은 수정하지 말고 새 버전 추가
+MIGRATIONS = [
+    (1, "TimeTable 테이블 생성", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='TimeTable' AND xtype='U')
+        CREATE TABLE TimeTable (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            work_date DATE NOT NULL,
+            time_slot VARCHAR(10) NOT NULL,
+            task_name NVARCHAR(200),
+            description NVARCHAR(MAX),
+            created_at DATETIME DEFAULT GETDATE(),
+            updated_at DATETIME DEFAULT GETDATE(),
+            CONSTRAINT UQ_TimeTable_Date_Time UNIQUE(work_date, time_slot)
+        )
+        """,
+    ]),
+    (2, "TimeTable 특수상황/업체명/종료시간 컬럼 추가", [
+        "IF COL_LENGTH('TimeTable', 'special_note') IS NULL ALTER TABLE TimeTable ADD special_note NVARCHAR(MAX) NULL",
+        "IF COL_LENGTH('TimeTable', 'company') IS NULL ALTER TABLE TimeTable ADD company NVARCHAR(50) NULL",
+        "IF COL_LENGTH('TimeTable', 'end_time') IS NULL ALTER TABLE TimeTable ADD end_time VARCHAR(10) NULL",
+    ]),
+    (3, "DefaultTasks 테이블 생성 (기본 업무 템플릿)", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='DefaultTasks' AND xtype='U')
+        CREATE TABLE DefaultTasks (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            time_slot VARCHAR(10) NOT NULL,
+            task_name NVARCHAR(200),
+            description NVARCHAR(MAX),
+            is_active BIT DEFAULT 1,
+            created_at DATETIME DEFAULT GETDATE(),
+            updated_at DATETIME DEFAULT GETDATE()
+        )
+        """,
+    ]),
+    (4, "DefaultTasks 업체명/종료시간/표시 순서/색상 컬럼, UNIQUE 제약조건 제거", [
+        "IF COL_LENGTH('DefaultTasks', 'company') IS NULL ALTER TABLE DefaultTasks ADD company NVARCHAR(50) NULL",
+        "IF COL_LENGTH('DefaultTasks', 'end_time') IS NULL ALTER TABLE DefaultTasks ADD end_time VARCHAR(10) NULL",
+        "IF COL_LENGTH('DefaultTasks', 'display_order') IS NULL ALTER TABLE DefaultTasks ADD display_order INT NULL",
+        "IF COL_LENGTH('DefaultTasks', 'color') IS NULL ALTER TABLE DefaultTasks ADD color NVARCHAR(20) NULL",
+        # 같은 시간대에 여러 업체 업무가 있으므로 time_slot / display_order UNIQUE 제약조건은 두지 않음
+        """
+        DECLARE @sql NVARCHAR(MAX) = N'';
+        SELECT @sql += N'ALTER TABLE DefaultTasks DROP CONSTRAINT ' + QUOTENAME(name) + N';'
+        FROM sys.key_constraints
+        WHERE parent_object_id = OBJECT_ID('DefaultTasks') AND type = 'UQ';
+        EXEC sp_executesql @sql;
+        """,
+        # 표시 순서가 없는 기존 업무는 업체 순서 + 시간대 순으로 기존 최대값 뒤에 배치
+        """
+        WITH OrderedTasks AS (
+            SELECT display_order,
+                   ROW_NUMBER() OVER (ORDER BY
+                       CASE company
+                           WHEN N'롯데마트' THEN 1
+                           WHEN N'롯데슈퍼' THEN 2
+                           WHEN N'지에스' THEN 3
+                           WHEN N'이마트' THEN 4
+                           WHEN N'홈플러스' THEN 5
+                           WHEN N'코스트코' THEN 6
+                           ELSE 99
+                       END,
+                       time_slot
+                   ) AS row_num
+            FROM DefaultTasks
+            WHERE display_order IS NULL
+        )
+        UPDATE OrderedTasks
+        SET display_order = row_num + (SELECT ISNULL(MAX(display_order), 0) FROM DefaultTasks)
+        """,
+    ]),
+    (5, "SpecialTimes 테이블 생성 (업체명+법인명별 특수 시간)", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='SpecialTimes' AND xtype='U')
+        CREATE TABLE SpecialTimes (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            work_date DATE NOT NULL,
+            company NVARCHAR(50) NOT NULL,
+            corp_name NVARCHAR(50) NULL,
+            time_slot VARCHAR(10) NOT NULL,
+            is_colored BIT DEFAULT 0,
+            created_at DATETIME DEFAULT GETDATE(),
+            updated_at DATETIME DEFAULT GETDATE(),
+            CONSTRAINT UQ_SpecialTimes_Date_Company_Corp_Time UNIQUE(work_date, company, corp_name, time_slot)
+        )
+        """,
+    ]),
+    (6, "SpecialTimes 법인명 컬럼 추가 및 UNIQUE 제약조건 변경", [
+        "IF COL_LENGTH('SpecialTimes', 'corp_name') IS NULL ALTER TABLE SpecialTimes ADD corp_name NVARCHAR(50) NULL",
+        """
+        IF OBJECT_ID('UQ_SpecialTimes_Date_Company_Time', 'UQ') IS NOT NULL
+        ALTER TABLE SpecialTimes DROP CONSTRAINT UQ_SpecialTimes_Date_Company_Time
+        """,
+        """
+        IF OBJECT_ID('UQ_SpecialTimes_Date_Company_Corp_Time', 'UQ') IS NULL
+        ALTER TABLE SpecialTimes ADD CONSTRAINT UQ_SpecialTimes_Date_Company_Corp_Time
+        UNIQUE(work_date, company, corp_name, time_slot)
+        """,
+    ]),
+    (7, "Users 테이블 생성 및 기본 관리자 계정", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='Users' AND xtype='U')
+        CREATE TABLE Users (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            username NVARCHAR(50) NOT NULL,
+            password NVARCHAR(255) NOT NULL,
+            display_name NVARCHAR(100),
+            is_active BIT DEFAULT 1,
+            is_admin BIT DEFAULT 0,
+            created_at DATETIME DEFAULT GETDATE(),
+            last_login DATETIME,
+            CONSTRAINT UQ_Users_Username UNIQUE(username)
+        )
+        """,
+        ("""
+        IF NOT EXISTS (SELECT * FROM Users WHERE username = 'admin')
+        INSERT INTO Users (username, password, display_name, is_active, is_admin)
+        VALUES ('admin', ?, N'관리자', 1, 1)
+        """, (DEFAULT_ADMIN_PASSWORD_HASH,)),
+    ]),
+    (8, "ChangeLogs 테이블 생성 (변경 로그)", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='ChangeLogs' AND xtype='U')
+        CREATE TABLE ChangeLogs (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            log_type NVARCHAR(50) NOT NULL,
+            work_date DATE,
+            company NVARCHAR(100),
+            corp_name NVARCHAR(100),
+            time_slot VARCHAR(10),
+            action NVARCHAR(50),
+            old_value NVARCHAR(MAX),
+            new_value NVARCHAR(MAX),
+            user_id INT,
+            username NVARCHAR(50),
+            display_name NVARCHAR(100),
+            created_at DATETIME DEFAULT GETDATE(),
+            ip_address NVARCHAR(50)
+        )
+        """,
+    ]),
+    (9, "SpecialTimeReasons 테이블 생성 (특수 시간 변동 사유)", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='SpecialTimeReasons' AND xtype='U')
+        CREATE TABLE SpecialTimeReasons (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            work_date DATE NOT NULL,
+            company NVARCHAR(100) NOT NULL,
+            corp_name NVARCHAR(100) NOT NULL,
+            added_time INT DEFAULT 0,
+            reason NVARCHAR(500),
+            user_id INT,
+            username NVARCHAR(50),
+            created_at DATETIME DEFAULT GETDATE(),
+            updated_at DATETIME DEFAULT GETDATE()
+        )
+        """,
+    ]),
+    (10, "DailyExtraTime 테이블 생성 (일별 추가 시간 집계)", [
+        """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='DailyExtraTime' AND xtype='U')
+        CREATE TABLE DailyExtraTime (
+            work_date DATE NOT NULL,
+            company NVARCHAR(50) NOT NULL,
+            corp_name NVARCHAR(50) NOT NULL,
+            special_minutes INT NOT NULL DEFAULT 0,
+            base_minutes INT NOT NULL DEFAULT 0,
+            extra_minutes AS (special_minutes - base_minutes) PERSISTED,
+            updated_at DATETIME DEFAULT GETDATE(),
+            CONSTRAINT PK_DailyExtraTime PRIMARY KEY (work_date, company, corp_name)
+        )
+        """,
+    ]),
+    (11, "SpecialTimes UNIQUE 제약조건을 is_colored 포함 UNIQUE 인덱스로 교체", [
+        # 같은 키의 B-트리를 둘 유지하지 않도록 제약조건은 제거 (MERGE 중복 방지는 인덱스가 담당)
+        """
+        IF NOT EXISTS (SELECT * FROM sys.indexes
+                       WHERE name = 'UX_SpecialTimes_date_company_corp_slot' AND object_id = OBJECT_ID('SpecialTimes'))
+        CREATE UNIQUE INDEX UX_SpecialTimes_date_company_corp_slot
+        ON SpecialTimes (work_date, company, corp_name, time_slot) INCLUDE (is_colored)
+        """,
+        """
+        IF OBJECT_ID('UQ_SpecialTimes_Date_Company_Corp_Time', 'UQ') IS NOT NULL
+        ALTER TABLE SpecialTimes DROP CONSTRAINT UQ_SpecialTimes_Date_Company_Corp_Time
+        """,
+    ]),
+    # 함수 단계: step(db) 성공 후 버전 기록 (실패하면 다음 실행 때 다시 시도)
+    (12, "DailyExtraTime 집계 채우기 (기존 특수 시간)", backfill_daily_extra_time),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate(db, log=print):
+    """아직 적용되지 않은 마이그레이션을 순서대로 적용
+
+    반환: 모두 성공하면 True (중간에 실패하면 그 이후 버전은 적용하지 않음)
+    """
+    current_version = db.get_schema_version()
+    if current_version is None:
+        log("[FAIL] 스키마 버전 확인 실패")
+        return False
+
+    for version, description, statements in MIGRATIONS:
+        if version <= current_version:
+            continue
+        if callable(statements):
+            applied = statements(db) and db.apply_migration(version, description, [])
+        else:
+            applied = db.apply_migration(version, description, statements)
+        if not applied:
+            log(f"[FAIL] v{version} {description}")
+            return False
+        log(f"[OK] v{version} {description}")
+    return True
+
+
+def install_indexes(db, log=print):
+    """없는 인덱스 보고 후 생성 (database.INDEX_DEFINITIONS)"""
+    missing = db.get_missing_indexes()
+    if not missing:
+        log("[OK] 필요한 인덱스가 모두 있습니다.")
+        return
+    log(f"없는 인덱스 {len(missing)}개: {', '.join(missing)}")
+    created, failed = db.ensure_indexes()
+    for name in created:
+        log(f"[OK] {name} 생성 완료")
+    for name, error in failed:
+        log(f"[FAIL] {name} 생성 실패: {error}")
+
+
+def ensure_schema(db):
+    """프로그램 시작 시 스키마 확인 - 버전 조회 1회 (최신이 아니면 마이그레이션) + 없는 인덱스 생성"""
+    current_version = db.get_schema_version()
+    if current_version is None or current_version < LATEST_VERSION:
+        if not migrate(db):
+            return False
+    db.ensure_indexes()
+    return True
+
+
+if __name__ == "__main__":
+    # UTF-8 인코딩 설정
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    from database import Database
+
+    print("=" * 60)
+    print("데이터베이스 스키마 마이그레이션")
+    print("=" * 60)
+
+    db = Database()
+    if not db.connect():
+        print("[FAIL] 데이터베이스 연결 실패!")
+        sys.exit(1)
+
+    try:
+        print(f"\n현재 버전: v{db.get_schema_version()} / 최신 버전: v{LATEST_VERSION}\n")
+        success = migrate(db)
+        if success:
+            print()
+            install_indexes(db)
+    finally:
+        db.disconnect()
+
+    print("\n" + "=" * 60)
+    print("마이그레이션 완료!" if success else "마이그레이션 실패 - 위 오류를 확인해주세요.")
+    print("=" * 60)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,253 @@
+"""
+쿼리 계측
+DB 커서의 execute / executemany마다 SQL, 파라미터 형태, 실행 시간, 행 수를 기록하고
+화면 작업(날짜 이동, 드래그 저장 등)별로 쿼리 수와 시간을 집계
+
+- 기본은 꺼져 있음 (관리 > 쿼리 계측에서 켜고 끔, 꺼져 있으면 시간 측정도 하지 않음)
+- SLOW_QUERY_MS 이상 걸린 쿼리는 update_log.txt와 같은 폴더의 slow_query_log.txt에 기록 (크기 기준 교체)
+- 작업 스레드(DBWorker)의 쿼리와 결과 콜백은 작업을 제출한 화면 작업으로 집계
+"""
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+# 느린 쿼리 기준 (ms)
+SLOW_QUERY_MS = 500
+
+# 느린 쿼리 로그 파일 크기 / 보관 개수 (slow_query_log.txt.1 ~ .3)
+SLOW_LOG_MAX_BYTES = 1024 * 1024
+SLOW_LOG_BACKUPS = 3
+
+# 로그에 남기는 SQL 최대 길이
+SQL_PREVIEW_CHARS = 300
+
+# 화면 작업 밖에서 실행된 쿼리 (시작 시 연결, 예약된 자동 저장 등)
+NO_ACTION = "(기타)"
+
+_enabled = False
+_lock = threading.Lock()
+_local = threading.local()  # 현재 스레드의 화면 작업 이름
+_actions = {}  # 작업 이름 -> 집계
+_slow_logger = None
+
+
+def get_slow_log_path():
+    """느린 쿼리 로그 파일 (update_log.txt와 같은 폴더)"""
+    if getattr(sys, 'frozen', False):
+        log_dir = os.path.dirname(sys.executable)
+    else:
+        log_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(log_dir, "slow_query_log.txt")
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled):
+    """계측 켜기/끄기 (켤 때 이전 집계는 초기화)"""
+    global _enabled
+    if enabled and not _enabled:
+        reset()
+    _enabled = bool(enabled)
+
+
+def reset():
+    with _lock:
+        _actions.clear()
+
+
+def current_action():
+    """현재 스레드의 화면 작업 이름 (없으면 None)"""
+    return getattr(_local, "action", None)
+
+
+def _stats(name):
+    stats = _actions.get(name)
+    if stats is None:
+        stats = _actions[name] = {"runs": 0, "queries": 0, "query_ms": 0.0, "rows": 0,
+                                  "ui_ms": 0.0, "slow": 0}
+    return stats
+
+
+@contextmanager
+def action(name, resume=False):
+    """화면 작업 범위 - 안에서 실행한 쿼리를 name으로 집계
+
+    이미 다른 작업 안이면 바깥 작업으로 집계 (날짜 이동 안의 새로고침 등)
+    resume=True: 작업 스레드 / 결과 콜백에서 이어서 실행 (실행 횟수에 포함하지 않음)
+    화면 스레드에서 걸린 시간은 ui_ms (작업 스레드는 제외)
+    """
+    if not _enabled or name is None or current_action() is not None:
+        yield
+        return
+
+    _local.action = name
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.action = None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with _lock:
+            stats = _stats(name)
+            if not resume:
+                stats["runs"] += 1
+            if threading.current_thread() is threading.main_thread():
+                stats["ui_ms"] += elapsed_ms
+
+
+def ui_action(name):
+    """화면 작업 메서드 데코레이터 - @query_stats.ui_action("날짜 이동")"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with action(name):
+                return method(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def describe_params(params, many=False):
+    """파라미터 형태 (값은 기록하지 않음 - 비밀번호 해시 등)"""
+    if many:
+        rows = params if isinstance(params, (list, tuple)) else list(params)
+        first = rows[0] if rows else ()
+        return f"{len(rows)}행 x {len(first) if isinstance(first, (list, tuple)) else 1}"
+    if not params:
+        return "없음"
+    if len(params) == 1 and isinstance(params[0], (list, tuple)):
+        params = params[0]
+    return ", ".join(type(value).__name__ for value in params)
+
+
+def record(sql, params_shape, duration_ms, rowcount):
+    """쿼리 1회 기록 - 현재 화면 작업에 집계, 느리면 로그"""
+    name = current_action() or NO_ACTION
+    slow = duration_ms >= SLOW_QUERY_MS
+    with _lock:
+        stats = _stats(name)
+        stats["queries"] += 1
+        stats["query_ms"] += duration_ms
+        if rowcount and rowcount > 0:
+            stats["rows"] += rowcount
+        if slow:
+            stats["slow"] += 1
+    if slow:
+        _log_slow_query(name, sql, params_shape, duration_ms, rowcount)
+
+
+def add_rows(count):
+    """조회 결과 행 수 (fetch 시점)"""
+    if not count:
+        return
+    with _lock:
+        _stats(current_action() or NO_ACTION)["rows"] += count
+
+
+def _log_slow_query(name, sql, params_shape, duration_ms, rowcount):
+    global _slow_logger
+    try:
+        if _slow_logger is None:
+            logger = logging.getLogger("timetable.slow_query")
+            logger.propagate = False
+            handler = RotatingFileHandler(get_slow_log_path(), maxBytes=SLOW_LOG_MAX_BYTES,
+                                          backupCount=SLOW_LOG_BACKUPS, encoding='utf-8', delay=True)
+            handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            _slow_logger = logger
+        text = " ".join(sql.split())
+        if len(text) > SQL_PREVIEW_CHARS:
+            text = text[:SQL_PREVIEW_CHARS] + "..."
+        _slow_logger.info(f"{duration_ms:.0f}ms | {name} | 행 {rowcount} | 파라미터 {params_shape} | {text}")
+    except Exception as e:
+        print(f"느린 쿼리 로그 기록 오류: {e}")
+
+
+def summary():
+    """[(작업 이름, 집계), ...] - 쿼리 시간이 긴 순"""
+    with _lock:
+        items = [(name, dict(stats)) for name, stats in _actions.items()]
+    return sorted(items, key=lambda item: item[1]["query_ms"], reverse=True)
+
+
+def format_summary():
+    """집계 표시 문자열 (작업별 한 줄)"""
+    lines = []
+    for name, stats in summary():
+        runs = stats["runs"]
+        per_run = f" (회당 {stats['queries'] / runs:.1f}개)" if runs else ""
+        line = (f"{name}: {runs}회, 쿼리 {stats['queries']}개{per_run}, "
+                f"DB {stats['query_ms'] / 1000:.2f}s, 화면 {stats['ui_ms'] / 1000:.2f}s, 행 {stats['rows']}")
+        if stats["slow"]:
+            line += f", 느린 쿼리 {stats['slow']}개"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class InstrumentedCursor:
+    """계측 커서 - 계측이 켜져 있을 때만 execute / executemany / fetch를 기록 (나머지는 원래 커서)"""
+
+    def __init__(self, cursor):
+        object.__setattr__(self, "_cursor", cursor)
+
+    def execute(self, sql, *params):
+        if not _enabled:
+            return self._cursor.execute(sql, *params)
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(sql, *params)
+        finally:
+            record(sql, describe_params(params), (time.perf_counter() - started) * 1000,
+                   self._rowcount())
+
+    def executemany(self, sql, seq_of_params):
+        if not _enabled:
+            return self._cursor.executemany(sql, seq_of_params)
+        if not isinstance(seq_of_params, (list, tuple)):
+            seq_of_params = list(seq_of_params)
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(sql, seq_of_params)
+        finally:
+            record(sql, describe_params(seq_of_params, many=True), (time.perf_counter() - started) * 1000,
+                   self._rowcount())
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if _enabled and row is not None:
+            add_rows(1)
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if _enabled:
+            add_rows(len(rows))
+        return rows
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        if _enabled:
+            add_rows(len(rows))
+        return rows
+
+    def _rowcount(self):
+        try:
+            return self._cursor.rowcount
+        except Exception:
+            return -1
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cursor, name, value)  # fast_executemany 등 드라이버 옵션
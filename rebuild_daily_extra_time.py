@@ -0,0 +1,55 @@
+"""
+일별 추가 시간 집계 (DailyExtraTime) 재생성
+기존 특수 시간 데이터로 집계 테이블을 채움 (처음 도입 시에는 마이그레이션 v12가 자동 실행, 집계가 어긋났을 때 실행)
+
+사용법: python rebuild_daily_extra_time.py [시작일 YYYY-MM-DD] [종료일 YYYY-MM-DD]
+"""
+
+import sys
+sys.path.append('.')
+
+from datetime import datetime
+from timetable_manager import TimeTableManager
+
+
+def rebuild_daily_extra_time(start_date=None, end_date=None):
+    """SpecialTimes에서 일별 추가 시간 집계 재생성"""
+
+    print("일별 추가 시간 집계 재생성")
+    print("=" * 50)
+
+    try:
+        # 연결 + DailyExtraTime 테이블 생성 포함
+        manager = TimeTableManager()
+    except Exception as e:
+        print(f"[ERROR] 데이터베이스 연결 실패: {e}")
+        return
+
+    try:
+        # 1. 기본 업무 템플릿에서 업체+법인명별 기본 시간 계산
+        print("\n[1단계] 기본 업무 템플릿 기본 시간 계산...")
+        template = manager.get_template_index()
+        print(f"[OK] {len(template.corps)}개 업체+법인명")
+
+        # 2. 집계 재생성
+        period = f"{start_date or '처음'} ~ {end_date or '끝'}"
+        print(f"\n[2단계] 집계 재생성 중... ({period})")
+        inserted = manager.db.rebuild_daily_extra_time(template.base_minutes, start_date, end_date)
+        if inserted < 0:
+            print("[ERROR] 집계 재생성 실패")
+            return
+        print(f"[OK] {inserted}개 행 생성 완료!")
+
+    finally:
+        manager.close()
+
+    print("\n" + "=" * 50)
+    print("일별 추가 시간 집계 재생성 완료!")
+
+
+if __name__ == "__main__":
+    try:
+        dates = [datetime.strptime(arg, "%Y-%m-%d").date() for arg in sys.argv[1:3]]
+        rebuild_daily_extra_time(*dates)
+    except Exception as e:
+        print(f"오류: {e}")
@@ -5,6 +5,7 @@
 import sys
 import io
 from database import Database
+from migrations import migrate, install_indexes, LATEST_VERSION
 
 # UTF-8 인코딩 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -31,17 +32,19 @@ def setup_database():
         print("  - password: 비밀번호")
         return False
 
-    # 2. 테이블 생성
-    print("\n[2단계] TimeTable 테이블 생성 중...")
-    if db.create_table():
-        print("[OK] 테이블 생성 성공!")
-    else:
-        print("[FAIL] 테이블 생성 실패!")
+    # 2. 스키마 마이그레이션
+    print(f"\n[2단계] 스키마 마이그레이션 중... (현재 v{db.get_schema_version()} / 최신 v{LATEST_VERSION})")
+    if not migrate(db):
+        print("[FAIL] 마이그레이션 실패!")
         db.disconnect()
         return False
 
-    # 3. 테이블 확인
-    print("\n[3단계] 테이블 구조 확인 중...")
+    # 3. 인덱스 확인 및 생성
+    print("\n[3단계] 인덱스 확인 중...")
+    install_indexes(db)
+
+    # 4. 테이블 확인
+    print("\n[4단계] 테이블 구조 확인 중...")
     try:
         query = """
         SELECT
@@ -71,8 +74,8 @@ def setup_database():
     except Exception as e:
         print(f"[FAIL] 테이블 확인 중 오류: {e}")
 
-    # 4. 연결 종료
-    print("\n[4단계] 데이터베이스 연결 종료...")
+    # 5. 연결 종료
+    print("\n[5단계] 데이터베이스 연결 종료...")
     db.disconnect()
     print("[OK] 연결 종료 완료!")
 
@@ -0,0 +1,138 @@
+"""
+특수 시간 쓰기 버퍼 (write-behind)
+셀 토글은 화면에 즉시 반영하고, DB 저장은 모아두었다가 한 번의 트랜잭션으로 처리
+"""
+from timetable_manager import build_special_time_batch
+
+# 마지막 토글 후 자동 저장까지 대기 시간 (ms)
+IDLE_FLUSH_MS = 1500
+# 저장 실패 시 재시도 간격 (ms) 및 최대 횟수
+RETRY_DELAYS_MS = (1000, 3000, 10000)
+
+
+class SpecialTimeWriteBuffer:
+    """특수 시간 토글 모음
+
+    같은 (날짜, 업체명, 법인명, 시간대)를 여러 번 토글하면 마지막 값만 저장하고,
+    처음 상태로 되돌아온 셀은 저장하지 않음
+    """
+
+    def __init__(self, root, manager, get_user, on_error=None, worker=None):
+        self.root = root
+        self.manager = manager
+        self.worker = worker  # DBWorker가 있으면 작업 스레드에서 저장
+        self.get_user = get_user  # 로그에 기록할 사용자 정보 반환 함수
+        self.on_error = on_error  # 재시도 후에도 저장 실패 시 호출: on_error(changes)
+
+        # (work_date, company, corp_name, time_slot) -> [이전 값, 새 값]
+        self.pending = {}
+        self.after_id = None
+        self.retry_count = 0
+
+    def add(self, work_date, company, corp_name, time_slot, old_value, new_value):
+        """토글 1건 추가 후 자동 저장 예약"""
+        key = (work_date, company, corp_name, time_slot)
+        if key in self.pending:
+            # 처음 상태는 유지하고 마지막 값만 갱신
+            self.pending[key][1] = new_value
+        else:
+            self.pending[key] = [old_value, new_value]
+        self.manager.invalidate_day(work_date)  # 날짜 이동 캐시는 저장 전부터 무효
+        self._schedule(IDLE_FLUSH_MS)
+
+    def has_pending(self):
+        return bool(self.pending)
+
+    def flush(self):
+        """모아둔 변경 저장 요청 (실패 시 재시도 예약) - 작업 스레드에 넘기고 기다리지 않음
+
+        작업 스레드는 제출 순서대로 실행하므로 이어서 제출한 조회는 저장 후에 실행됨
+        """
+        self._cancel()
+        if not self.pending:
+            return
+
+        batch = self.pending
+        self.pending = {}
+
+        # 처음 상태로 되돌아온 셀 제외, 날짜별로 묶기
+        by_date = {}
+        for (work_date, company, corp_name, time_slot), (old_value, new_value) in batch.items():
+            if old_value != new_value:
+                by_date.setdefault(work_date, []).append((company, corp_name, time_slot, old_value, new_value))
+        if not by_date:
+            return
+
+        user_info = self.get_user()
+        batches = []
+        for work_date, changes in by_date.items():
+            self.manager.invalidate_day(work_date)  # 저장 전에 시작된 조회 결과는 캐시에 넣지 않음
+            items, logs = build_special_time_batch(changes, user_info)
+            base_minutes = self.manager.base_minutes_for({(company, corp_name) for company, corp_name, *_ in changes})
+            batches.append((work_date, changes, items, logs, base_minutes))
+
+        if self.worker is None:
+            self._on_saved(_save_batches(self.manager.db, batches))
+            return
+
+        self.worker.submit(_save_batches, batches, callback=self._on_saved,
+                           errback=lambda e: self._on_saved(_all_changes(batches)))
+
+    def _on_saved(self, failed):
+        """저장 결과 처리 - 실패한 변경은 다시 버퍼에 넣고 재시도"""
+        if not failed:
+            self.retry_count = 0
+            return
+
+        if self.retry_count >= len(RETRY_DELAYS_MS):
+            # 재시도 포기 - 실패한 셀만 화면에 알리고 버림 (저장 시도 후 토글된 셀은 계속 저장)
+            changes = []
+            for key, (old_value, new_value) in failed.items():
+                if key in self.pending:
+                    self.pending[key][0] = old_value
+                else:
+                    changes.append(key + (new_value,))
+            self.retry_count = 0
+            if self.pending:
+                self._schedule(IDLE_FLUSH_MS)
+            if changes and self.on_error:
+                self.on_error(changes)
+            return
+
+        # 그 사이 새로 토글된 셀은 최신 값 유지
+        for key, (old_value, new_value) in failed.items():
+            if key in self.pending:
+                self.pending[key][0] = old_value
+            else:
+                self.pending[key] = [old_value, new_value]
+
+        self._schedule(RETRY_DELAYS_MS[self.retry_count])
+        self.retry_count += 1
+
+    def _schedule(self, delay_ms):
+        self._cancel()
+        self.after_id = self.root.after(delay_ms, self.flush)
+
+    def _cancel(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+
+def _save_batches(db, batches):
+    """날짜별 일괄 저장 - 실패한 변경을 {(날짜, 업체명, 법인명, 시간대): [이전 값, 새 값]}로 반환"""
+    failed = {}
+    for batch in batches:
+        work_date, changes, items, logs, base_minutes = batch
+        outcomes = db.save_special_times_bulk(work_date, items, logs, base_minutes)
+        if "failed" in outcomes:
+            failed.update(_all_changes([batch]))
+    return failed
+
+
+def _all_changes(batches):
+    changes_by_key = {}
+    for work_date, changes, *_ in batches:
+        for company, corp_name, time_slot, old_value, new_value in changes:
+            changes_by_key[(work_date, company, corp_name, time_slot)] = [old_value, new_value]
+    return changes_by_key
@@ -0,0 +1,1136 @@
+"""
+SQLite 데이터베이스 백엔드
+Database(MSSQL)와 같은 메서드/반환 형식 - SQL Server 없이 테스트, 벤치마크, 로컬 복제본에 사용
+
+- MERGE → INSERT ... ON CONFLICT DO UPDATE, GETDATE() → 로컬 시각 (밀리초), TOP → LIMIT
+- 스키마는 connect()에서 최신 버전으로 생성 (migrations.py의 T-SQL은 실행하지 않음)
+- 인스턴스마다 연결 1개 - connect()를 호출한 스레드에서만 사용 (작업 스레드는 자기 인스턴스 사용)
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from db_backend import DatabaseBackend, TransactionScope, TransactionConnection, changed_logs, day_start
+from migrations import MIGRATIONS, DEFAULT_ADMIN_PASSWORD_HASH
+import query_stats
+
+# GETDATE()와 같은 로컬 시각 (DATETIME 컬럼 형식: YYYY-MM-DD HH:MM:SS.fff)
+NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+# DATE / DATETIME으로 선언된 컬럼은 조회 시 date/datetime으로 변환 (detect_types로 연결한 경우만 적용)
+CONVERTERS = {
+    "DATE": lambda value: date.fromisoformat(value.decode()[:10]),
+    "DATETIME": lambda value: datetime.fromisoformat(value.decode()),
+}
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS TimeTable (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_date DATE NOT NULL,
+        time_slot TEXT NOT NULL,
+        task_name TEXT,
+        description TEXT,
+        special_note TEXT,
+        company TEXT,
+        end_time TEXT,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        updated_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        UNIQUE (work_date, time_slot)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS DefaultTasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        time_slot TEXT NOT NULL,
+        task_name TEXT,
+        description TEXT,
+        is_active INTEGER DEFAULT 1,
+        company TEXT,
+        end_time TEXT,
+        display_order INTEGER,
+        color TEXT,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        updated_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'))
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS SpecialTimes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_date DATE NOT NULL,
+        company TEXT NOT NULL,
+        corp_name TEXT NOT NULL DEFAULT '',
+        time_slot TEXT NOT NULL,
+        is_colored INTEGER DEFAULT 0,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        updated_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        UNIQUE (work_date, company, corp_name, time_slot)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        password TEXT NOT NULL,
+        display_name TEXT,
+        is_active INTEGER DEFAULT 1,
+        is_admin INTEGER DEFAULT 0,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        last_login DATETIME
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ChangeLogs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        log_type TEXT NOT NULL,
+        work_date DATE,
+        company TEXT,
+        corp_name TEXT,
+        time_slot TEXT,
+        action TEXT,
+        old_value TEXT,
+        new_value TEXT,
+        user_id INTEGER,
+        username TEXT,
+        display_name TEXT,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        ip_address TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS SpecialTimeReasons (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_date DATE NOT NULL,
+        company TEXT NOT NULL,
+        corp_name TEXT NOT NULL,
+        added_time INTEGER DEFAULT 0,
+        reason TEXT,
+        user_id INTEGER,
+        username TEXT,
+        created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        updated_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        UNIQUE (work_date, company, corp_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS DailyExtraTime (
+        work_date DATE NOT NULL,
+        company TEXT NOT NULL,
+        corp_name TEXT NOT NULL,
+        special_minutes INTEGER NOT NULL DEFAULT 0,
+        base_minutes INTEGER NOT NULL DEFAULT 0,
+        updated_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')),
+        PRIMARY KEY (work_date, company, corp_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS SchemaVersion (
+        version INTEGER PRIMARY KEY,
+        description TEXT,
+        applied_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'))
+    )
+    """,
+    # database.INDEX_DEFINITIONS와 같은 용도 (UNIQUE 키는 테이블 정의에 포함)
+    "CREATE INDEX IF NOT EXISTS IX_ChangeLogs_created_at ON ChangeLogs (created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS IX_ChangeLogs_company_created_at ON ChangeLogs (company, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS IX_ChangeLogs_username_created_at ON ChangeLogs (username, created_at DESC, id DESC)",
+]
+
+
+def get_default_sqlite_path():
+    """sqlite 백엔드 기본 DB 파일 (실행 파일 또는 소스 폴더의 data/timetable.db)"""
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, 'data', 'timetable.db')
+
+
+def _adapt(value):
+    """date/datetime 매개변수 → 문자열 (DATETIME 컬럼 형식과 같게)"""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ', timespec='milliseconds')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _adapt_params(params):
+    if isinstance(params, dict):
+        return {name: _adapt(value) for name, value in params.items()}
+    return [_adapt(value) for value in params]
+
+
+class _DateCursor(sqlite3.Cursor):
+    """매개변수의 date/datetime을 문자열로 바꿔 실행하는 커서
+
+    sqlite3.register_adapter는 프로세스의 모든 연결에 적용되므로 이 백엔드의 연결에서만 변환
+    """
+
+    def execute(self, sql, params=()):
+        return super().execute(sql, _adapt_params(params))
+
+    def executemany(self, sql, seq_of_params):
+        return super().executemany(sql, (_adapt_params(params) for params in seq_of_params))
+
+
+def _install_converters():
+    """DATE / DATETIME 변환 함수 등록 (sqlite3에는 연결별 등록이 없어 connect()에서 등록)"""
+    for type_name, converter in CONVERTERS.items():
+        sqlite3.register_converter(type_name, converter)
+
+
+_row_types = {}
+
+
+def _row_factory(cursor, values):
+    """pyodbc 행처럼 row.컬럼명으로 접근 (tuple(row)도 가능)"""
+    names = tuple(column[0] for column in cursor.description)
+    row_type = _row_types.get(names)
+    if row_type is None:
+        row_type = _row_types[names] = namedtuple("Row", names, rename=True)
+    return row_type(*values)
+
+
+class SQLiteDatabase(DatabaseBackend):
+    """SQLite 데이터베이스 (Database와 같은 메서드 - 각 메서드의 의미는 database.py 참고)"""
+
+    backend = 'sqlite'
+    SCHEMA = SCHEMA
+    DEFAULT_ADMIN = True  # 새 DB에 migrations.py와 같은 기본 관리자 계정 생성
+    UPDATED_AT = NOW  # 수정한 행의 updated_at (SQL 식)
+
+    def __init__(self, path=None):
+        self.path = path or get_default_sqlite_path()
+        self._connection = None
+        self._cursor = None
+        self._scopes = []
+
+    @property
+    def connection(self):
+        """transaction() 안에서는 commit을 미루는 연결"""
+        if self._scopes:
+            return TransactionConnection(self._connection, self._scopes)
+        return self._connection
+
+    @property
+    def cursor(self):
+        return self._cursor
+
+    def connect(self):
+        """데이터베이스 연결 (파일이 없으면 최신 스키마로 생성)"""
+        try:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            _install_converters()
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+            self._connection.row_factory = _row_factory
+            self._cursor = query_stats.InstrumentedCursor(self._connection.cursor(_DateCursor))
+            if self.path != ':memory:':
+                # 화면 스레드와 작업 스레드가 각자 연결을 쓰므로 읽기/쓰기가 서로 막지 않도록
+                self._cursor.execute("PRAGMA journal_mode=WAL")
+            for statement in self.SCHEMA:
+                self._cursor.execute(statement)
+            # 스키마가 최신 정의이므로 모든 마이그레이션 버전을 적용된 것으로 기록
+            self._cursor.executemany(
+                "INSERT OR IGNORE INTO SchemaVersion (version, description) VALUES (?, ?)",
+                [(version, description) for version, description, _ in MIGRATIONS])
+            if self.DEFAULT_ADMIN:
+                self._cursor.execute("""
+                INSERT OR IGNORE INTO Users (username, password, display_name, is_active, is_admin)
+                VALUES ('admin', ?, '관리자', 1, 1)
+                """, (DEFAULT_ADMIN_PASSWORD_HASH,))
+            self._connection.commit()
+            return True
+        except Exception as e:
+            print(f"데이터베이스 연결 오류: {e}")
+            self._connection = None
+            return False
+
+    def disconnect(self):
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+            self._cursor = None
+
+    def is_connected(self):
+        return self._connection is not None
+
+    def pool_stats(self):
+        return {}  # 연결 풀 없음 (인스턴스마다 연결 1개)
+
+    @contextmanager
+    def transaction(self):
+        """Database.transaction()과 같은 사용법 (BEGIN / SAVEPOINT)"""
+        scope = TransactionScope(f"sp{len(self._scopes)}" if self._scopes else None)
+        if scope.savepoint:
+            self._cursor.execute(f"SAVEPOINT {scope.savepoint}")
+        elif not self._connection.in_transaction:
+            self._cursor.execute("BEGIN")
+        self._scopes.append(scope)
+        try:
+            yield scope
+        except Exception:
+            scope.failed = True
+            raise
+        finally:
+            self._scopes.pop()
+            try:
+                if scope.savepoint:
+                    if scope.failed:
+                        self._cursor.execute(f"ROLLBACK TO {scope.savepoint}")
+                    self._cursor.execute(f"RELEASE {scope.savepoint}")
+                elif scope.failed:
+                    self._connection.rollback()
+                else:
+                    self._connection.commit()
+            except Exception as e:
+                print(f"트랜잭션 종료 오류: {e}")
+                scope.failed = True
+                if self._scopes:
+                    self._scopes[-1].failed = True
+            scope.ok = not scope.failed
+
+    # === 업무 (TimeTable) ===
+
+    def insert_or_update_task(self, work_date, time_slot, task_name, description, special_note='', company='', end_time=''):
+        """업무 추가 또는 수정 (특수상황, 업체명, 종료시간 포함)"""
+        try:
+            self.cursor.execute(f"""
+            INSERT INTO TimeTable (work_date, time_slot, task_name, description, special_note, company, end_time)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (work_date, time_slot) DO UPDATE SET
+                task_name = excluded.task_name, description = excluded.description,
+                special_note = excluded.special_note, company = excluded.company,
+                end_time = excluded.end_time, updated_at = {self.UPDATED_AT}
+            """, (work_date, time_slot, task_name, description, special_note, company, end_time))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"업무 저장 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def delete_task(self, work_date, time_slot):
+        """업무 삭제"""
+        try:
+            self.cursor.execute("DELETE FROM TimeTable WHERE work_date = ? AND time_slot = ?", (work_date, time_slot))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"업무 삭제 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def get_tasks_by_date(self, work_date):
+        """특정 날짜의 모든 업무 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT time_slot, task_name, description, special_note, company, end_time
+            FROM TimeTable
+            WHERE work_date = ?
+            ORDER BY time_slot
+            """, (work_date,))
+            tasks = {}
+            for row in self.cursor.fetchall():
+                tasks[row.time_slot] = {
+                    'task': row.task_name,
+                    'description': row.description or '',
+                    'special_note': row.special_note or '',
+                    'company': row.company or '',
+                    'end_time': row.end_time or ''
+                }
+            return tasks
+        except Exception as e:
+            print(f"업무 조회 오류: {e}")
+            return {}
+
+    def get_task(self, work_date, time_slot):
+        """특정 날짜의 특정 시간 업무 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT task_name, description, special_note, company, end_time
+            FROM TimeTable
+            WHERE work_date = ? AND time_slot = ?
+            """, (work_date, time_slot))
+            row = self.cursor.fetchone()
+            if row:
+                return {
+                    'task': row.task_name,
+                    'description': row.description or '',
+                    'special_note': row.special_note or '',
+                    'company': row.company or '',
+                    'end_time': row.end_time or ''
+                }
+            return None
+        except Exception as e:
+            print(f"업무 조회 오류: {e}")
+            return None
+
+    def get_all_dates(self):
+        """업무가 등록된 모든 날짜 조회"""
+        try:
+            self.cursor.execute('SELECT DISTINCT work_date AS "work_date [DATE]" FROM TimeTable ORDER BY work_date DESC')
+            return [row.work_date for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"날짜 조회 오류: {e}")
+            return []
+
+    def copy_tasks_to_date(self, source_date, target_date):
+        """특정 날짜의 업무를 다른 날짜로 복사 (대상 날짜에 없는 시간대만)"""
+        try:
+            self.cursor.execute("""
+            INSERT OR IGNORE INTO TimeTable (work_date, time_slot, task_name, description)
+            SELECT ?, time_slot, task_name, description
+            FROM TimeTable
+            WHERE work_date = ?
+            """, (target_date, source_date))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"업무 복사 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 기본 업무 템플릿 ===
+
+    def get_default_tasks(self):
+        """기본 업무 템플릿 전체 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT time_slot, task_name, description, is_active, company, end_time, display_order, color
+            FROM DefaultTasks
+            WHERE is_active = 1
+            ORDER BY display_order, time_slot
+            """)
+            tasks = {}
+            for row in self.cursor.fetchall():
+                display_order = row.display_order if row.display_order else 999
+                tasks[display_order] = {
+                    'time_slot': row.time_slot,
+                    'task': row.task_name,
+                    'description': row.description or '',
+                    'company': row.company or '',
+                    'end_time': row.end_time or '',
+                    'display_order': display_order,
+                    'color': row.color or ''
+                }
+            return tasks
+        except Exception as e:
+            print(f"기본 업무 조회 오류: {e}")
+            return {}
+
+    def get_default_tasks_version(self):
+        """변경 확인용 토큰 (행 수, 최종 수정 시각, 행 구성 합계)
+
+        CHECKSUM_AGG 대신 - 모든 수정이 updated_at을 갱신하므로 수정/삭제/추가 모두 토큰이 바뀜
+        """
+        try:
+            self.cursor.execute("""
+            SELECT COUNT(*) AS cnt, MAX(updated_at) AS last_updated, TOTAL(id * display_order) AS checksum
+            FROM DefaultTasks
+            WHERE is_active = 1
+            """)
+            row = self.cursor.fetchone()
+            return (row.cnt, row.last_updated, row.checksum)
+        except Exception as e:
+            print(f"기본 업무 변경 확인 오류: {e}")
+            return None
+
+    def insert_or_update_default_task(self, time_slot, task_name, description, company='', end_time='', display_order=None, color=''):
+        """기본 업무 템플릿 추가 또는 수정 (표시 순서가 같은 항목이 있으면 수정)"""
+        try:
+            if display_order is None:
+                self.cursor.execute("SELECT IFNULL(MAX(display_order), 0) + 1 AS next_order FROM DefaultTasks")
+                display_order = self.cursor.fetchone().next_order
+
+            self.cursor.execute(f"""
+            UPDATE DefaultTasks
+            SET time_slot = ?, task_name = ?, description = ?, company = ?, end_time = ?, color = ?,
+                is_active = 1, updated_at = {self.UPDATED_AT}
+            WHERE display_order = ?
+            """, (time_slot, task_name, description, company, end_time, color, display_order))
+            if self.cursor.rowcount == 0:
+                self.cursor.execute("""
+                INSERT INTO DefaultTasks (display_order, time_slot, task_name, description, company, end_time, color, is_active)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                """, (display_order, time_slot, task_name, description, company, end_time, color))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"기본 업무 저장 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def shift_display_order(self, from_order, delta=1):
+        """from_order 이상인 기본 업무의 표시 순서를 delta만큼 이동 (UPDATE 1회, 실패 시 -1)"""
+        try:
+            self.cursor.execute(f"""
+            UPDATE DefaultTasks
+            SET display_order = display_order + ?, updated_at = {self.UPDATED_AT}
+            WHERE display_order >= ?
+            """, (delta, from_order))
+            shifted = self.cursor.rowcount
+            self.connection.commit()
+            return shifted
+        except Exception as e:
+            print(f"기본 업무 표시 순서 이동 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    def insert_default_task_at(self, display_order, time_slot, task_name, description, company='', end_time='', color=''):
+        """기본 업무 템플릿을 지정한 표시 순서에 삽입 (기존 항목은 1씩 뒤로 밀림)
+
+        순서 이동 UPDATE 1회 + 삽입 1회를 하나의 트랜잭션으로 처리 (항목 수와 무관)
+        """
+        with self.transaction() as tx:
+            if self.shift_display_order(display_order, 1) < 0:
+                tx.failed = True  # 순서 이동 실패 - 삽입하지 않고 되돌림
+            else:
+                self.insert_or_update_default_task(time_slot, task_name, description, company, end_time,
+                                                   display_order, color)
+        return tx.ok
+
+    def delete_default_task(self, display_order):
+        """기본 업무 템플릿 삭제 (표시순서 기준)"""
+        try:
+            self.cursor.execute("DELETE FROM DefaultTasks WHERE display_order = ?", (display_order,))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"기본 업무 삭제 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def apply_default_tasks_to_date(self, target_date):
+        """기본 업무 템플릿을 특정 날짜에 적용 (대상 날짜에 없는 시간대만)"""
+        try:
+            self.cursor.execute("""
+            INSERT OR IGNORE INTO TimeTable (work_date, time_slot, task_name, description, company, end_time)
+            SELECT ?, time_slot, task_name, description, company, end_time
+            FROM DefaultTasks
+            WHERE is_active = 1
+            ORDER BY display_order
+            """, (target_date,))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"기본 업무 적용 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def update_display_order(self, time_slot, display_order):
+        """기본 업무 템플릿의 표시 순서 업데이트"""
+        try:
+            self.cursor.execute(f"""
+            UPDATE DefaultTasks SET display_order = ?, updated_at = {self.UPDATED_AT} WHERE time_slot = ?
+            """, (display_order, time_slot))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"표시 순서 업데이트 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 특수 시간 ===
+
+    def save_special_time(self, work_date, company, corp_name, time_slot, is_colored, base_minutes=None):
+        """특수 시간 저장 또는 업데이트 (base_minutes가 있으면 일별 추가 시간 집계도 갱신)"""
+        try:
+            self.cursor.execute(f"""
+            INSERT INTO SpecialTimes (work_date, company, corp_name, time_slot, is_colored)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (work_date, company, corp_name, time_slot) DO UPDATE SET
+                is_colored = excluded.is_colored, updated_at = {self.UPDATED_AT}
+            """, (work_date, company, corp_name or '', time_slot, 1 if is_colored else 0))
+            if base_minutes is not None:
+                self._update_daily_extra_time(work_date, {(company, corp_name): base_minutes})
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"특수 시간 저장 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def save_special_times_bulk(self, work_date, changes, logs=None, base_minutes=None):
+        """특수 시간 여러 건 저장 + 변경 로그를 하나의 트랜잭션으로 처리 (결과 형식은 Database와 같음)"""
+        if not changes:
+            return []
+
+        last_row = {}
+        for row_no, (company, corp_name, time_slot, is_colored) in enumerate(changes):
+            last_row[(company, corp_name, time_slot)] = row_no
+        outcomes = ["duplicate"] * len(changes)
+
+        try:
+            for row_no in sorted(last_row.values()):
+                company, corp_name, time_slot, is_colored = changes[row_no]
+                key = (work_date, company, corp_name or '', time_slot)
+                self.cursor.execute("""
+                SELECT is_colored FROM SpecialTimes
+                WHERE work_date = ? AND company = ? AND corp_name = ? AND time_slot = ?
+                """, key)
+                row = self.cursor.fetchone()
+                if row is None:
+                    self.cursor.execute("""
+                    INSERT INTO SpecialTimes (work_date, company, corp_name, time_slot, is_colored)
+                    VALUES (?, ?, ?, ?, ?)
+                    """, key + (1 if is_colored else 0,))
+                    outcomes[row_no] = "inserted"
+                elif bool(row.is_colored) != bool(is_colored):
+                    self.cursor.execute(f"""
+                    UPDATE SpecialTimes SET is_colored = ?, updated_at = {self.UPDATED_AT}
+                    WHERE work_date = ? AND company = ? AND corp_name = ? AND time_slot = ?
+                    """, (1 if is_colored else 0,) + key)
+                    outcomes[row_no] = "updated"
+                else:
+                    outcomes[row_no] = "unchanged"
+
+            logs = changed_logs(changes, outcomes, logs)
+            if logs:
+                self.cursor.executemany("""
+                INSERT INTO ChangeLogs (log_type, work_date, company, corp_name, time_slot,
+                                       action, old_value, new_value, user_id, username, display_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(log[0], work_date) + tuple(log[1:]) for log in logs])
+
+            if base_minutes:
+                self._update_daily_extra_time(work_date, base_minutes)
+
+            self.connection.commit()
+            return outcomes
+        except Exception as e:
+            print(f"특수 시간 일괄 저장 오류: {e}")
+            self.connection.rollback()
+            return ["failed"] * len(changes)
+
+    def materialize_special_times(self, work_date, slots, base_minutes=None):
+        """기본 특수 시간 일괄 생성 (행이 없는 것만 ON으로 INSERT) - 추가된 행 수 (실패 시 -1)"""
+        if not slots:
+            return 0
+        try:
+            before = self._connection.total_changes
+            self.cursor.executemany("""
+            INSERT OR IGNORE INTO SpecialTimes (work_date, company, corp_name, time_slot, is_colored)
+            VALUES (?, ?, ?, ?, 1)
+            """, [(work_date, company, corp_name or '', time_slot)
+                  for company, corp_name, time_slot in dict.fromkeys(slots)])
+            inserted = self._connection.total_changes - before
+            if base_minutes:
+                self._update_daily_extra_time(work_date, base_minutes)
+            self.connection.commit()
+            return inserted
+        except Exception as e:
+            print(f"기본 특수 시간 일괄 생성 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    def get_special_times(self, work_date, company, corp_name):
+        """특정 날짜의 특정 업체+법인명 특수 시간 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT time_slot, is_colored
+            FROM SpecialTimes
+            WHERE work_date = ? AND company = ? AND corp_name = ?
+            ORDER BY time_slot
+            """, (work_date, company, corp_name or ''))
+            return {row.time_slot: True for row in self.cursor.fetchall() if row.is_colored}
+        except Exception as e:
+            print(f"특수 시간 조회 오류: {e}")
+            return {}
+
+    def get_special_times_for_date(self, work_date):
+        """{(company, corp_name): {time_slot: is_colored}}"""
+        try:
+            self.cursor.execute("""
+            SELECT company, corp_name, time_slot, is_colored
+            FROM SpecialTimes
+            WHERE work_date = ?
+            """, (work_date,))
+            day_special_times = {}
+            for row in self.cursor.fetchall():
+                day_special_times.setdefault((row.company, row.corp_name), {})[row.time_slot] = bool(row.is_colored)
+            return day_special_times
+        except Exception as e:
+            print(f"일자별 특수 시간 조회 오류: {e}")
+            return {}
+
+    def get_day_version(self, work_date):
+        """날짜별 변경 확인용 토큰 (업무/특수 시간의 행 수, 최종 수정 시각)"""
+        try:
+            self.cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM TimeTable WHERE work_date = ?) AS task_count,
+                (SELECT MAX(updated_at) FROM TimeTable WHERE work_date = ?) AS task_updated,
+                (SELECT COUNT(*) FROM SpecialTimes WHERE work_date = ?) AS special_count,
+                (SELECT MAX(updated_at) FROM SpecialTimes WHERE work_date = ?) AS special_updated
+            """, (work_date,) * 4)
+            row = self.cursor.fetchone()
+            return (row.task_count, row.task_updated, row.special_count, row.special_updated)
+        except Exception as e:
+            print(f"날짜별 변경 확인 오류: {e}")
+            return None
+
+    def delete_special_times_by_date(self, work_date, company, corp_name):
+        """특정 날짜의 특정 업체+법인명 특수 시간 삭제"""
+        try:
+            self.cursor.execute("DELETE FROM SpecialTimes WHERE work_date = ? AND company = ? AND corp_name = ?",
+                                (work_date, company, corp_name or ''))
+            self.cursor.execute("DELETE FROM DailyExtraTime WHERE work_date = ? AND company = ? AND corp_name = ?",
+                                (work_date, company, corp_name or ''))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"특수 시간 삭제 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 사용자 ===
+
+    def authenticate_user(self, username, password):
+        """사용자 인증"""
+        try:
+            password_hash = hashlib.sha256(password.encode()).hexdigest()
+            self.cursor.execute("""
+            SELECT id, username, display_name, is_admin
+            FROM Users
+            WHERE username = ? AND password = ? AND is_active = 1
+            """, (username, password_hash))
+            row = self.cursor.fetchone()
+            if row:
+                self.cursor.execute(f"UPDATE Users SET last_login = {NOW} WHERE id = ?", (row.id,))
+                self.connection.commit()
+                return {
+                    'id': row.id,
+                    'username': row.username,
+                    'display_name': row.display_name or row.username,
+                    'is_admin': bool(row.is_admin)
+                }
+            return None
+        except Exception as e:
+            print(f"사용자 인증 오류: {e}")
+            return None
+
+    def get_user_by_username(self, username):
+        """사용자명으로 사용자 정보 조회 (자동 로그인용 - 비밀번호 확인 없음)"""
+        try:
+            self.cursor.execute("""
+            SELECT id, username, display_name, is_admin
+            FROM Users
+            WHERE username = ? AND is_active = 1
+            """, (username,))
+            row = self.cursor.fetchone()
+            if row:
+                self.cursor.execute(f"UPDATE Users SET last_login = {NOW} WHERE id = ?", (row.id,))
+                self.connection.commit()
+                return {
+                    'id': row.id,
+                    'username': row.username,
+                    'display_name': row.display_name or row.username,
+                    'is_admin': bool(row.is_admin)
+                }
+            return None
+        except Exception as e:
+            print(f"사용자 조회 오류: {e}")
+            return None
+
+    def get_all_users(self):
+        """모든 사용자 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT id, username, display_name, is_active, is_admin, created_at, last_login
+            FROM Users
+            ORDER BY username
+            """)
+            return [{
+                'id': row.id,
+                'username': row.username,
+                'display_name': row.display_name or '',
+                'is_active': bool(row.is_active),
+                'is_admin': bool(row.is_admin),
+                'created_at': row.created_at,
+                'last_login': row.last_login
+            } for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"사용자 조회 오류: {e}")
+            return []
+
+    def add_user(self, username, password, display_name='', is_admin=False):
+        """사용자 추가"""
+        try:
+            password_hash = hashlib.sha256(password.encode()).hexdigest()
+            self.cursor.execute("""
+            INSERT INTO Users (username, password, display_name, is_active, is_admin)
+            VALUES (?, ?, ?, 1, ?)
+            """, (username, password_hash, display_name, 1 if is_admin else 0))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"사용자 추가 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def update_user(self, user_id, display_name=None, is_active=None, is_admin=None):
+        """사용자 정보 수정"""
+        try:
+            updates = []
+            params = []
+            if display_name is not None:
+                updates.append("display_name = ?")
+                params.append(display_name)
+            if is_active is not None:
+                updates.append("is_active = ?")
+                params.append(1 if is_active else 0)
+            if is_admin is not None:
+                updates.append("is_admin = ?")
+                params.append(1 if is_admin else 0)
+            if not updates:
+                return True
+
+            params.append(user_id)
+            self.cursor.execute(f"UPDATE Users SET {', '.join(updates)} WHERE id = ?", params)
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"사용자 수정 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def change_password(self, user_id, new_password):
+        """비밀번호 변경"""
+        try:
+            password_hash = hashlib.sha256(new_password.encode()).hexdigest()
+            self.cursor.execute("UPDATE Users SET password = ? WHERE id = ?", (password_hash, user_id))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"비밀번호 변경 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def delete_user(self, user_id):
+        """사용자 삭제 (admin 제외)"""
+        try:
+            self.cursor.execute("DELETE FROM Users WHERE id = ? AND username != 'admin'", (user_id,))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"사용자 삭제 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 변경 로그 ===
+
+    def add_change_log(self, log_type, work_date, company, corp_name, time_slot, action,
+                       old_value, new_value, user_id, username, display_name):
+        """변경 로그 추가"""
+        try:
+            self.cursor.execute("""
+            INSERT INTO ChangeLogs (log_type, work_date, company, corp_name, time_slot,
+                                   action, old_value, new_value, user_id, username, display_name)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (log_type, work_date, company, corp_name, time_slot,
+                  action, old_value, new_value, user_id, username, display_name))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"변경 로그 추가 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def get_change_logs(self, start_date=None, end_date=None, log_type=None,
+                        company=None, username=None, limit=500, before=None):
+        """변경 로그 조회 (최신순, before: 이전 페이지 마지막 행의 (created_at, id))"""
+        try:
+            conditions = []
+            params = []
+            if start_date:
+                conditions.append("created_at >= ?")
+                params.append(day_start(start_date))
+            if end_date:
+                conditions.append("created_at < ?")
+                params.append(day_start(end_date) + timedelta(days=1))
+            if log_type:
+                conditions.append("log_type = ?")
+                params.append(log_type)
+            if company:
+                conditions.append("company = ?")
+                params.append(company)
+            if username:
+                conditions.append("username = ?")
+                params.append(username)
+            if before:
+                before_created_at, before_id = before
+                conditions.append("(created_at < ? OR (created_at = ? AND id < ?))")
+                params.extend([before_created_at, before_created_at, before_id])
+
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            self.cursor.execute(f"""
+            SELECT id, log_type, work_date, company, corp_name, time_slot,
+                   action, old_value, new_value, user_id, username, display_name, created_at
+            FROM ChangeLogs
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT {int(limit)}
+            """, params)
+            return [{
+                'id': row.id,
+                'log_type': row.log_type,
+                'work_date': row.work_date,
+                'company': row.company or '',
+                'corp_name': row.corp_name or '',
+                'time_slot': row.time_slot or '',
+                'action': row.action,
+                'old_value': row.old_value or '',
+                'new_value': row.new_value or '',
+                'user_id': row.user_id,
+                'username': row.username,
+                'display_name': row.display_name or row.username,
+                'created_at': row.created_at
+            } for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"변경 로그 조회 오류: {e}")
+            return []
+
+    def get_logs_by_date_range(self, start_date, end_date, limit=1000):
+        """날짜 범위로 로그 조회"""
+        return self.get_change_logs(start_date=start_date, end_date=end_date, limit=limit)
+
+    def get_logs_by_user(self, username, limit=500):
+        """사용자별 로그 조회"""
+        return self.get_change_logs(username=username, limit=limit)
+
+    def delete_old_logs(self, days_to_keep=90):
+        """오래된 로그 삭제 - 삭제된 행 수"""
+        try:
+            cutoff = datetime.now() - timedelta(days=int(days_to_keep))
+            self.cursor.execute("DELETE FROM ChangeLogs WHERE created_at < ?", (cutoff,))
+            deleted_count = self.cursor.rowcount
+            self.connection.commit()
+            return deleted_count
+        except Exception as e:
+            print(f"로그 삭제 오류: {e}")
+            self.connection.rollback()
+            return 0
+
+    # === 특수 시간 변동 사유 ===
+
+    def save_special_time_reason(self, work_date, company, corp_name, added_time, reason, user_id=None, username=None):
+        """특수 시간 변동 사유 저장 또는 업데이트"""
+        try:
+            self.cursor.execute(f"""
+            INSERT INTO SpecialTimeReasons (work_date, company, corp_name, added_time, reason, user_id, username)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (work_date, company, corp_name) DO UPDATE SET
+                added_time = excluded.added_time, reason = excluded.reason, user_id = excluded.user_id,
+                username = excluded.username, updated_at = {self.UPDATED_AT}
+            """, (work_date, company, corp_name, added_time, reason, user_id, username))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"특수 시간 변동 사유 저장 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    def get_special_time_reason(self, work_date, company, corp_name):
+        """특정 업체+법인의 특수 시간 변동 사유 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT added_time, reason, username, updated_at
+            FROM SpecialTimeReasons
+            WHERE work_date = ? AND company = ? AND corp_name = ?
+            """, (work_date, company, corp_name))
+            row = self.cursor.fetchone()
+            if row:
+                return {
+                    'added_time': row.added_time,
+                    'reason': row.reason or '',
+                    'username': row.username or '',
+                    'updated_at': row.updated_at
+                }
+            return None
+        except Exception as e:
+            print(f"특수 시간 변동 사유 조회 오류: {e}")
+            return None
+
+    def get_all_special_time_reasons(self, work_date):
+        """특정 날짜의 모든 특수 시간 변동 사유 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT company, corp_name, added_time, reason, username, updated_at
+            FROM SpecialTimeReasons
+            WHERE work_date = ? AND added_time != 0
+            ORDER BY company, corp_name
+            """, (work_date,))
+            return [{
+                'company': row.company,
+                'corp_name': row.corp_name,
+                'added_time': row.added_time,
+                'reason': row.reason or '',
+                'username': row.username or '',
+                'updated_at': row.updated_at
+            } for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"특수 시간 변동 사유 전체 조회 오류: {e}")
+            return []
+
+    def get_special_time_reasons_by_period(self, start_date, end_date):
+        """기간별 특수 시간 변동 사유 조회"""
+        try:
+            self.cursor.execute("""
+            SELECT work_date, company, corp_name, added_time, reason, username, updated_at
+            FROM SpecialTimeReasons
+            WHERE work_date BETWEEN ? AND ? AND added_time != 0
+            ORDER BY work_date, company, corp_name
+            """, (start_date, end_date))
+            return [{
+                'work_date': row.work_date,
+                'company': row.company,
+                'corp_name': row.corp_name,
+                'added_time': row.added_time,
+                'reason': row.reason or '',
+                'username': row.username or '',
+                'updated_at': row.updated_at
+            } for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"기간별 특수 시간 변동 사유 조회 오류: {e}")
+            return []
+
+    def delete_special_time_reason(self, work_date, company, corp_name):
+        """특수 시간 변동 사유 삭제"""
+        try:
+            self.cursor.execute("DELETE FROM SpecialTimeReasons WHERE work_date = ? AND company = ? AND corp_name = ?",
+                                (work_date, company, corp_name))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            print(f"특수 시간 변동 사유 삭제 오류: {e}")
+            self.connection.rollback()
+            return False
+
+    # === 로컬 복제본 동기화 ===
+
+    def get_rows_changed_since(self, table, columns, since=None, from_date=None):
+        """from_date 이후 작업일 중 updated_at이 since 이후인 행 (실패 시 None)"""
+        try:
+            query = f"SELECT {', '.join(columns)} FROM {table} WHERE work_date >= ?"
+            params = [from_date]
+            if since is not None:
+                query += " AND updated_at >= ?"
+                params.append(since)
+            self.cursor.execute(query, params)
+            return [tuple(row) for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"{table} 변경분 조회 오류: {e}")
+            return None
+
+    def get_special_time_stamps(self, work_date):
+        """{(company, corp_name, time_slot): updated_at} (실패 시 None)"""
+        try:
+            self.cursor.execute("""
+            SELECT company, corp_name, time_slot, updated_at FROM SpecialTimes WHERE work_date = ?
+            """, (work_date,))
+            return {(row.company, row.corp_name, row.time_slot): row.updated_at for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"특수 시간 수정 시각 조회 오류: {e}")
+            return None
+
+    # === 일별 추가 시간 집계 (DailyExtraTime) ===
+
+    def _update_daily_extra_time(self, work_date, base_minutes):
+        """일별 추가 시간 집계 갱신 (SpecialTimes에서 다시 계산, 커밋은 호출 측에서)"""
+        self.cursor.executemany(f"""
+        INSERT INTO DailyExtraTime (work_date, company, corp_name, special_minutes, base_minutes)
+        SELECT ?, ?, ?,
+               (SELECT COUNT(*) FROM SpecialTimes
+                WHERE work_date = ? AND company = ? AND corp_name = ? AND is_colored = 1) * 30,
+               ?
+        WHERE 1
+        ON CONFLICT (work_date, company, corp_name) DO UPDATE SET
+            special_minutes = excluded.special_minutes, base_minutes = excluded.base_minutes,
+            updated_at = {self.UPDATED_AT}
+        """, [(work_date, company, corp_name or '', work_date, company, corp_name or '', minutes)
+              for (company, corp_name), minutes in base_minutes.items()])
+
+    def get_daily_extra_by_period(self, start_date, end_date):
+        """{(work_date, company, corp_name): extra_minutes}"""
+        try:
+            self.cursor.execute("""
+            SELECT work_date, company, corp_name, special_minutes - base_minutes AS extra_minutes
+            FROM DailyExtraTime
+            WHERE work_date >= ? AND work_date <= ?
+            """, (start_date, end_date))
+            return {(row.work_date, row.company, row.corp_name): row.extra_minutes
+                    for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"일별 추가 시간 집계 조회 오류: {e}")
+            return {}
+
+    def rebuild_daily_extra_time(self, base_minutes, start_date=None, end_date=None):
+        """일별 추가 시간 집계 재생성 - 생성된 행 수 (실패 시 -1)"""
+        try:
+            conditions = []
+            params = []
+            if start_date:
+                conditions.append("work_date >= ?")
+                params.append(start_date)
+            if end_date:
+                conditions.append("work_date <= ?")
+                params.append(end_date)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            self.cursor.execute(f"DELETE FROM DailyExtraTime {where_clause}", params)
+
+            base_rows = list(base_minutes.items()) or [(("", ""), 0)]
+            values = ", ".join(["(?, ?, ?)"] * len(base_rows))
+            base_params = []
+            for (company, corp_name), minutes in base_rows:
+                base_params.extend((company, corp_name or '', minutes))
+
+            s_where_clause = where_clause.replace("work_date", "s.work_date")
+            before = self._connection.total_changes
+            self.cursor.execute(f"""
+            WITH b(company, corp_name, base_minutes) AS (VALUES {values})
+            INSERT INTO DailyExtraTime (work_date, company, corp_name, special_minutes, base_minutes)
+            SELECT s.work_date, s.company, s.corp_name,
+                   SUM(CASE WHEN s.is_colored = 1 THEN 30 ELSE 0 END),
+                   IFNULL(MAX(b.base_minutes), 0)
+            FROM SpecialTimes s
+            LEFT JOIN b ON b.company = s.company AND b.corp_name = s.corp_name
+            {s_where_clause}
+            GROUP BY s.work_date, s.company, s.corp_name
+            """, base_params + params)
+            inserted = self._connection.total_changes - before
+            self.connection.commit()
+            return inserted
+        except Exception as e:
+            print(f"일별 추가 시간 집계 재생성 오류: {e}")
+            self.connection.rollback()
+            return -1
+
+    # === 스키마 / 인덱스 ===
+
+    def get_schema_version(self):
+        """적용된 스키마 버전 (connect()에서 최신으로 생성하므로 항상 최신)"""
+        try:
+            self.cursor.execute("SELECT IFNULL(MAX(version), 0) AS version FROM SchemaVersion")
+            return self.cursor.fetchone().version
+        except Exception as e:
+            print(f"스키마 버전 조회 오류: {e}")
+            return None
+
+    def apply_migration(self, version, description, statements):
+        """migrations.py는 T-SQL이므로 실행하지 않음 (스키마는 connect()의 SCHEMA로 생성)"""
+        print(f"SQLite 백엔드는 마이그레이션을 적용하지 않습니다 (v{version}) - SCHEMA를 수정하세요")
+        return False
+
+    def get_missing_indexes(self):
+        return []  # 인덱스는 SCHEMA에 포함
+
+    def ensure_indexes(self):
+        return [], []
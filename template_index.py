@@ -0,0 +1,150 @@
+"""
+기본 업무 템플릿 인덱스
+DefaultTasks를 한 번만 분석해서 (업체명, 법인명)별 시간 범위/기본 시간을 미리 계산해 둠
+"""
+import hashlib
+
+
+def template_fingerprint(default_tasks):
+    """기본 업무 템플릿 지문 (템플릿 구성이 바뀌었는지 비교용)"""
+    items = sorted((order, sorted(info.items())) for order, info in default_tasks.items())
+    return hashlib.sha1(repr(items).encode('utf-8')).hexdigest()
+
+
+def parse_minutes(time_text):
+    """HH:MM 문자열 → 분 (형식이 잘못되면 None)"""
+    try:
+        parts = time_text.split(":")
+        return int(parts[0]) * 60 + int(parts[1])
+    except (ValueError, IndexError, AttributeError):
+        return None
+
+
+def format_extra_minutes(minutes, zero_text="0"):
+    """추가 시간(분) → 표시 문자열 (+2h 30m, -1h, +45m 등)"""
+    if minutes == 0:
+        return zero_text
+    sign = "+" if minutes > 0 else "-"
+    hours, mins = divmod(abs(minutes), 60)
+    if hours > 0 and mins > 0:
+        return f"{sign}{hours}h {mins}m"
+    elif hours > 0:
+        return f"{sign}{hours}h"
+    return f"{sign}{mins}m"
+
+
+def create_time_slots():
+    """08:30 ~ 24:00까지 30분 단위 시간 슬롯 생성"""
+    time_slots = []
+    # 8시 30분부터 시작
+    time_slots.append("08:30")
+    for hour in range(9, 25):  # 9시부터 24시(자정)까지
+        time_slots.append(f"{hour:02d}:00")
+        if hour < 24:  # 24:30은 제외
+            time_slots.append(f"{hour:02d}:30")
+    return time_slots
+
+
+def count_slots(mask):
+    """비트마스크의 시간대 개수"""
+    return bin(mask).count("1")
+
+
+class TemplateIndex:
+    """기본 업무 템플릿 컴파일 결과
+
+    - slot_index: 시간대 → 열 번호
+    - corps: (업체명, 법인명) 목록 (최소 display_order 순)
+    - tasks: (업체명, 법인명) → {시작 시간대: task_info}
+    - intervals: (업체명, 법인명) → 정렬된 [(시작 인덱스, 종료 인덱스), ...]
+    - coverage: (업체명, 법인명) → 기본 업무 시간대 비트마스크 (bit i = time_slots[i])
+    - base_minutes: (업체명, 법인명) → 기본 업무 시간 합계 (분)
+    - colors: (업체명, 법인명) → DB에 저장된 색상 (없으면 빈 문자열)
+    """
+
+    def __init__(self, default_tasks, time_slots):
+        self.time_slots = list(time_slots)
+        self.slot_index = {slot: idx for idx, slot in enumerate(self.time_slots)}
+        self.fingerprint = template_fingerprint(default_tasks)
+
+        self.tasks = {}
+        self.colors = {}
+        display_orders = {}
+
+        for display_order, task_info in default_tasks.items():
+            company = task_info.get("company", "")
+            corp_name = task_info.get("task", "")  # task_name이 법인명
+            time_slot = task_info.get("time_slot", "")
+            color = task_info.get("color", "")
+            if not (company and time_slot):
+                continue
+
+            key = (company, corp_name)
+            if key not in self.tasks:
+                self.tasks[key] = {}
+                display_orders[key] = display_order
+                self.colors[key] = color
+            else:
+                # 해당 조합의 최소 display_order 유지, 색상은 더 작은 display_order 우선
+                if display_order < display_orders[key]:
+                    display_orders[key] = display_order
+                if color and display_order <= display_orders[key]:
+                    self.colors[key] = color
+            self.tasks[key][time_slot] = task_info
+
+        self.corps = sorted(self.tasks, key=lambda c: display_orders.get(c, 999))
+
+        self.intervals = {}
+        self.coverage = {}
+        self.base_minutes = {}
+        for key, corp_tasks in self.tasks.items():
+            intervals = []
+            base_minutes = 0
+            for start_slot, task_info in corp_tasks.items():
+                end_slot = task_info.get("end_time", start_slot)
+
+                # 기본 시간: 종료 - 시작 + 30분 (30분 단위)
+                start_minutes = parse_minutes(start_slot)
+                end_minutes = parse_minutes(end_slot)
+                if start_minutes is not None and end_minutes is not None:
+                    base_minutes += end_minutes - start_minutes + 30
+
+                # 화면 색칠 범위: 시작/종료가 모두 시간대 목록에 있을 때만
+                start_idx = self.slot_index.get(start_slot)
+                end_idx = self.slot_index.get(end_slot)
+                if start_idx is not None and end_idx is not None and start_idx <= end_idx:
+                    intervals.append((start_idx, end_idx))
+
+            intervals.sort()
+            mask = 0
+            for start_idx, end_idx in intervals:
+                mask |= ((1 << (end_idx - start_idx + 1)) - 1) << start_idx
+            self.intervals[key] = intervals
+            self.coverage[key] = mask
+            self.base_minutes[key] = base_minutes
+
+    def covers(self, key, slot_idx):
+        """(업체명, 법인명)의 기본 업무가 해당 시간대를 포함하는지"""
+        return bool(self.coverage.get(key, 0) >> slot_idx & 1)
+
+    def covered_slots(self, key):
+        """기본 업무 시간대 목록 (time_slots 순서)"""
+        mask = self.coverage.get(key, 0)
+        return [slot for idx, slot in enumerate(self.time_slots) if mask >> idx & 1]
+
+    def row_colors(self, key, color, empty="white"):
+        """기본 업무 행 셀 색상 목록 (time_slots 순서)"""
+        return self.mask_colors(self.coverage.get(key, 0), color, empty)
+
+    def mask_colors(self, mask, color, empty="white"):
+        """비트마스크 → 셀 색상 목록 (time_slots 순서)"""
+        return [color if mask >> idx & 1 else empty for idx in range(len(self.time_slots))]
+
+    def slots_to_mask(self, special_times):
+        """{시간대: 여부} → 비트마스크"""
+        mask = 0
+        for time_slot, is_colored in special_times.items():
+            idx = self.slot_index.get(time_slot)
+            if is_colored and idx is not None:
+                mask |= 1 << idx
+        return mask
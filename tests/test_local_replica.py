@@ -0,0 +1,66 @@
+"""
+로컬 복제본 대기열 반영 테스트 (서버 대신 SQLite 백엔드 사용)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from local_replica import LocalReplica, push_outbox
+from sqlite_database import SQLiteDatabase
+
+WORK_DATE = date(2026, 10, 1)
+COMPANY = "롯데마트"
+CORP_NAME = "법인01"
+
+
+class PushOutboxTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="timetable_test_")
+        self.server = SQLiteDatabase(os.path.join(self.work_dir, 'server.db'))
+        self.replica = LocalReplica(os.path.join(self.work_dir, 'replica.db'))
+        self.assertTrue(self.server.connect())
+        self.assertTrue(self.replica.connect())
+
+    def tearDown(self):
+        self.server.disconnect()
+        self.replica.disconnect()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def reconnect(self):
+        """재연결 - 대기열 반영 후 정리, 충돌 목록 반환"""
+        done, conflicts, finished = push_outbox(self.server, self.replica.get_outbox())
+        self.assertTrue(finished)
+        self.replica.finish_push(done, conflicts)
+        self.assertEqual(self.replica.count_outbox(), 0)
+        return conflicts
+
+    def test_seed_then_toggle_offline(self):
+        # 오프라인: 기본 특수 시간 2칸 생성 후 09:00 끄기
+        slots = [(COMPANY, CORP_NAME, "09:00"), (COMPANY, CORP_NAME, "09:30")]
+        self.assertEqual(self.replica.materialize_special_times(WORK_DATE, slots), 2)
+        self.assertEqual(self.replica.save_special_times_bulk(WORK_DATE, [(COMPANY, CORP_NAME, "09:00", False)]),
+                         ["updated"])
+
+        self.assertEqual(self.reconnect(), [])
+        self.assertEqual(self.server.get_special_times_for_date(WORK_DATE),
+                         {(COMPANY, CORP_NAME): {"09:00": False, "09:30": True}})
+
+    def test_toggle_conflicts_with_server_row(self):
+        # 오프라인 동안 다른 PC가 같은 칸을 만들고 수정 - 오프라인 변경은 충돌로 남기고 덮어쓰지 않음
+        self.assertTrue(self.server.save_special_time(WORK_DATE, COMPANY, CORP_NAME, "09:00", True))
+        self.assertEqual(self.replica.materialize_special_times(WORK_DATE, [(COMPANY, CORP_NAME, "09:00")]), 1)
+        self.replica.save_special_times_bulk(WORK_DATE, [(COMPANY, CORP_NAME, "09:00", False)])
+
+        conflicts = self.reconnect()
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(self.server.get_special_times(WORK_DATE, COMPANY, CORP_NAME), {"09:00": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,305 @@
+"""
+타임테이블 그리드 Canvas 렌더러
+셀마다 Tk 위젯을 만드는 대신 하나의 Canvas 위에 사각형/텍스트 아이템으로 그리드를 그림
+"""
+# 점심시간 슬롯 (빗금 패턴 표시)
+LUNCH_SLOTS = ("12:30", "13:00")
+
+# 색상 정의
+HEADER_BG = "#2c3e50"
+HIGHLIGHT_HEADER_BG = "#f39c12"
+LUNCH_HEADER_BG = "#8B4513"
+SPECIAL_LABEL_BG = "#f0f0f0"
+EXTRA_TIME_BG = "#FFF9C4"
+EXTRA_TIME_FG = "#E65100"
+SEPARATOR_BG = "#e0e0e0"
+CELL_OUTLINE = "#a0a0a0"
+STRIPE_COLOR = "#cccccc"
+STRIPE_SPACING = 8
+
+GRID_TAG = "grid"
+
+
+class TimeTableGrid:
+    """Canvas 기반 타임테이블 그리드
+
+    행/열 번호는 기존 위젯 그리드와 동일하게 사용:
+    - 행 0: 헤더, 업체별로 기본업무 행 / 특수 행 / 구분선 순서
+    - 열 0: 업체명, 열 1: 법인명, 열 2~: 시간대, 마지막 열: 추가 시간
+    """
+
+    def __init__(self, canvas, time_slots):
+        self.canvas = canvas
+        self.time_slots = time_slots
+        self.extra_col = len(time_slots) + 2
+
+        self.col_edges = []  # 각 열의 왼쪽 x 좌표 + 마지막 오른쪽 x 좌표
+        self.row_tops = []  # 각 행의 위쪽 y 좌표 (헤더 포함)
+        self.row_bottoms = []
+        self.row_kinds = []  # "header" / "base" / "special" / "separator"
+
+        # 좌표 → 셀 계산용 (시간 열은 너비가 같고, 행은 업체마다 같은 높이로 반복되므로 나눗셈으로 계산)
+        self.time_x0 = 0
+        self.time_col_width = 1
+        self.header_height = 0
+        self.row_height = 1
+        self.group_height = 1  # 기본업무 행 + 특수 행 + 구분선
+
+        self.cells = {}  # (row, col) -> 사각형 아이템 id
+        self.cell_info = {}  # (row, col) -> (company, corp_name, time_slot, is_special)
+        self.cell_colors = {}  # (row, col) -> 현재 배경색
+        self.header_items = {}  # time_slot -> 헤더 사각형 아이템 id
+        self.header_colors = {}  # time_slot -> 원래 헤더 색상
+        self.extra_items = {}  # 특수 행 번호 -> 추가 시간 텍스트 아이템 id
+        self.special_rows = {}  # (company, corp_name) -> 특수 행 번호
+        self.base_rows = []  # [(기본업무 행 번호, 하이라이트 색상), ...]
+        self.base_colors = {}  # (row, col) -> 기본업무 행 셀의 원래 색상 (하이라이트 해제 시 복원)
+        self.highlight_range = None  # 하이라이트 중인 시간 열 범위 (시작 인덱스, 끝 인덱스)
+
+    # === 그리기 ===
+
+    def build(self, row_specs, col_label_width, corp_name_width, time_col_width,
+              extra_time_width, header_height, row_height):
+        """그리드 전체 그리기
+
+        row_specs: [{"company", "corp_name", "color", "base_colors", "special_colors"}, ...]
+        base_colors / special_colors 는 time_slots 순서의 셀 배경색 목록
+        """
+        self.canvas.delete(GRID_TAG)
+
+        self.cells = {}
+        self.cell_info = {}
+        self.cell_colors = {}
+        self.header_items = {}
+        self.header_colors = {}
+        self.extra_items = {}
+        self.special_rows = {}
+        self.base_rows = []
+        self.base_colors = {}
+        self.highlight_range = None
+        self.row_tops = []
+        self.row_bottoms = []
+        self.row_kinds = []
+
+        # 열 경계 계산
+        widths = [col_label_width, corp_name_width] + [time_col_width] * len(self.time_slots) + [extra_time_width]
+        self.col_edges = [0]
+        for width in widths:
+            self.col_edges.append(self.col_edges[-1] + width)
+        total_width = self.col_edges[-1]
+        self.time_x0 = self.col_edges[2]
+        self.time_col_width = time_col_width
+
+        # 헤더 행
+        y = 0
+        self._add_row("header", y, header_height)
+        self._draw_label(0, 0, "업체/시간", HEADER_BG, fg="white", font=("굴림체", 11, "bold"))
+        self._draw_label(0, 1, "법인명", HEADER_BG, fg="white", font=("굴림체", 11, "bold"))
+
+        for col_idx, time_slot in enumerate(self.time_slots):
+            # 점심시간(12:30~13:00) 헤더는 다른 색상으로 표시
+            is_lunch_time = time_slot in LUNCH_SLOTS
+            header_bg = LUNCH_HEADER_BG if is_lunch_time else HEADER_BG
+            header_text = f"🍴{time_slot}" if is_lunch_time else time_slot
+            rect = self._draw_label(0, col_idx + 2, header_text, header_bg, fg="white",
+                                    font=("굴림체", 10, "bold"))
+            self.header_items[time_slot] = rect
+            self.header_colors[time_slot] = header_bg
+
+        self._draw_label(0, self.extra_col, "추가 시간", HEADER_BG, fg="white", font=("굴림체", 10, "bold"))
+        y += header_height
+
+        # 업체+법인명별 행 (기본업무 행 + 특수 행 + 구분선)
+        separator_height = max(5, int(row_height * 0.3))  # 행 높이의 30%
+        self.header_height = header_height
+        self.row_height = row_height
+        self.group_height = row_height * 2 + separator_height
+        for spec in row_specs:
+            company = spec["company"]
+            corp_name = spec["corp_name"]
+            bg_color = spec["color"]
+
+            # 기본업무 행
+            row_num = self._add_row("base", y, row_height)
+            self._draw_label(row_num, 0, company, bg_color, font=("굴림체", 11, "bold"))
+            self._draw_label(row_num, 1, corp_name, bg_color, font=("굴림체", 10))
+            for col_idx, time_slot in enumerate(self.time_slots):
+                self._draw_cell(row_num, col_idx + 2, spec["base_colors"][col_idx],
+                                company, corp_name, time_slot, False)
+                self.base_colors[(row_num, col_idx + 2)] = spec["base_colors"][col_idx]
+            self.base_rows.append((row_num, bg_color))
+            self._draw_label(row_num, self.extra_col, "", "white")
+            y += row_height
+
+            # 특수 행
+            row_num = self._add_row("special", y, row_height)
+            self._draw_label(row_num, 0, f"{company} 특수", SPECIAL_LABEL_BG, font=("굴림체", 10))
+            self._draw_label(row_num, 1, corp_name, SPECIAL_LABEL_BG, font=("굴림체", 10))
+            for col_idx, time_slot in enumerate(self.time_slots):
+                self._draw_cell(row_num, col_idx + 2, spec["special_colors"][col_idx],
+                                company, corp_name, time_slot, True)
+            self._draw_label(row_num, self.extra_col, "", EXTRA_TIME_BG)
+            self.extra_items[row_num] = self._draw_text(row_num, self.extra_col, "", fg=EXTRA_TIME_FG,
+                                                        font=("굴림체", 10, "bold"))
+            self.special_rows[(company, corp_name)] = row_num
+            y += row_height
+
+            # 한 줄 띄우기
+            self._add_row("separator", y, separator_height)
+            self.canvas.create_rectangle(0, y, total_width, y + separator_height,
+                                         fill=SEPARATOR_BG, outline="", tags=GRID_TAG)
+            y += separator_height
+
+        self.canvas.configure(scrollregion=(0, 0, total_width, y))
+
+    def _add_row(self, kind, y, height):
+        """행 좌표 등록 후 행 번호 반환"""
+        self.row_tops.append(y)
+        self.row_bottoms.append(y + height)
+        self.row_kinds.append(kind)
+        return len(self.row_tops) - 1
+
+    def _cell_bounds(self, row, col):
+        return (self.col_edges[col], self.row_tops[row],
+                self.col_edges[col + 1], self.row_bottoms[row])
+
+    def _draw_label(self, row, col, text, bg, fg="black", font=("굴림체", 10)):
+        """배경 사각형 + 가운데 텍스트 (기존 Label 대체)"""
+        x0, y0, x1, y1 = self._cell_bounds(row, col)
+        rect = self.canvas.create_rectangle(x0, y0, x1, y1, fill=bg, outline=CELL_OUTLINE, tags=GRID_TAG)
+        if text:
+            self._draw_text(row, col, text, fg=fg, font=font)
+        return rect
+
+    def _draw_text(self, row, col, text, fg="black", font=("굴림체", 10)):
+        x0, y0, x1, y1 = self._cell_bounds(row, col)
+        return self.canvas.create_text((x0 + x1) // 2, (y0 + y1) // 2, text=text, fill=fg,
+                                       font=font, tags=GRID_TAG)
+
+    def _draw_cell(self, row, col, color, company, corp_name, time_slot, is_special):
+        """시간대 셀 그리기 (점심시간은 빗금 패턴)"""
+        x0, y0, x1, y1 = self._cell_bounds(row, col)
+        rect = self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline=CELL_OUTLINE, tags=GRID_TAG)
+        if time_slot in LUNCH_SLOTS:
+            self._draw_stripes(x0, y0, x1 - x0, y1 - y0)
+
+        self.cells[(row, col)] = rect
+        self.cell_info[(row, col)] = (company, corp_name, time_slot, is_special)
+        self.cell_colors[(row, col)] = color
+
+    def _draw_stripes(self, x0, y0, width, height):
+        """점심시간 빗금 (왼쪽 위 → 오른쪽 아래 대각선, 셀 영역으로 잘라서 그림)"""
+        for i in range(-height, width, STRIPE_SPACING):
+            # 셀 좌표계에서 (i, 0) → (i + height, height) 직선을 셀 사각형으로 자르기
+            start_x, start_y = i, 0
+            if start_x < 0:
+                start_x, start_y = 0, -i
+            end_x, end_y = i + height, height
+            if end_x > width:
+                end_x, end_y = width, width - i
+            if start_y >= end_y:
+                continue
+            self.canvas.create_line(x0 + start_x, y0 + start_y, x0 + end_x, y0 + end_y,
+                                    fill=STRIPE_COLOR, width=1, tags=GRID_TAG)
+
+    # === 갱신 ===
+
+    def cell_color(self, row, col):
+        """셀의 현재 배경색"""
+        return self.cell_colors.get((row, col))
+
+    def set_cell_color(self, row, col, color):
+        """셀 배경색 변경 (같은 색이면 Canvas 호출 생략)"""
+        if self.cell_colors.get((row, col)) == color:
+            return
+        self.cell_colors[(row, col)] = color
+        self.canvas.itemconfigure(self.cells[(row, col)], fill=color)
+
+    def update_special_row(self, company, corp_name, colors):
+        """특수 행 셀 색상 일괄 갱신 (레이아웃 재사용 시 날짜 변경용)"""
+        row = self.special_rows.get((company, corp_name))
+        if row is None:
+            return
+        for col_idx, color in enumerate(colors):
+            self.set_cell_color(row, col_idx + 2, color)
+
+    def set_header_color(self, time_slot, color=None):
+        """시간 헤더 배경색 변경 (color가 없으면 원래 색상으로 복원)"""
+        if time_slot in self.header_items:
+            self.canvas.itemconfigure(self.header_items[time_slot], fill=color or self.header_colors[time_slot])
+
+    def highlight_columns(self, start_idx, end_idx):
+        """시간 범위 하이라이트 (헤더 + 기본업무 행) - 이전 범위와 달라진 열만 다시 칠함
+
+        start_idx / end_idx: time_slots 인덱스 (start_idx <= end_idx)
+        """
+        new_cols = set(range(start_idx, end_idx + 1))
+        old_cols = set(range(self.highlight_range[0], self.highlight_range[1] + 1)) if self.highlight_range else set()
+        self.highlight_range = (start_idx, end_idx)
+        self._repaint_columns(new_cols - old_cols, True)
+        self._repaint_columns(old_cols - new_cols, False)
+
+    def clear_highlight(self):
+        """시간 범위 하이라이트 해제 (하이라이트된 열만 원래 색상으로)"""
+        if self.highlight_range is None:
+            return
+        start_idx, end_idx = self.highlight_range
+        self.highlight_range = None
+        self._repaint_columns(range(start_idx, end_idx + 1), False)
+
+    def _repaint_columns(self, slot_indexes, highlighted):
+        for idx in slot_indexes:
+            time_slot = self.time_slots[idx]
+            self.set_header_color(time_slot, HIGHLIGHT_HEADER_BG if highlighted else None)
+            col = idx + 2
+            for row, color in self.base_rows:
+                self.set_cell_color(row, col, color if highlighted else self.base_colors[(row, col)])
+
+    def set_extra_text(self, company, corp_name, text):
+        """특수 행의 추가 시간 텍스트 변경"""
+        row = self.special_rows.get((company, corp_name))
+        if row is not None:
+            self.canvas.itemconfigure(self.extra_items[row], text=text)
+
+    # === 좌표 → 셀 변환 ===
+
+    def locate(self, x, y):
+        """Canvas 좌표 → (행, 열), 그리드 밖이면 None (그리드 크기와 무관하게 O(1))"""
+        if not self.row_tops or x < 0 or y < 0:
+            return None
+        if x >= self.col_edges[-1] or y >= self.row_bottoms[-1]:
+            return None
+        return self._row_at_y(y), self._col_at_x(x)
+
+    def _col_at_x(self, x):
+        """x 좌표의 열 번호 (업체명/법인명 열, 같은 너비의 시간 열, 추가 시간 열)"""
+        if x < self.time_x0:
+            return 0 if x < self.col_edges[1] else 1
+        col = 2 + int((x - self.time_x0) // self.time_col_width)
+        return min(col, self.extra_col)
+
+    def _row_at_y(self, y):
+        """y 좌표의 행 번호 (헤더 다음 업체마다 기본업무 행 / 특수 행 / 구분선 반복)"""
+        if y < self.header_height:
+            return 0
+        group, offset = divmod(int(y - self.header_height), self.group_height)
+        return 1 + group * 3 + min(offset // self.row_height, 2)
+
+    def locate_event(self, event):
+        """이벤트 위치(위젯 좌표, 스크롤 반영) → (행, 열)"""
+        return self.locate(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+
+    def time_slot_at_x(self, x):
+        """Canvas x 좌표의 시간대 (시간 열 밖이면 가장 가까운 시간대)"""
+        if not self.col_edges:
+            return None
+        col = self._col_at_x(x) if x >= 0 else 0
+        col = max(2, min(col, self.extra_col - 1))
+        return self.time_slots[col - 2]
+
+    def is_header(self, row, col):
+        return row == 0 and 2 <= col < self.extra_col
+
+    def is_special_cell(self, row, col):
+        info = self.cell_info.get((row, col))
+        return bool(info and info[3])
@@ -1,42 +1,166 @@
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime, date
 import pandas as pd
 from typing import Dict, List, Optional
-from database import Database
+from database import create_database
+from local_replica import LocalReplica
+from template_index import TemplateIndex, count_slots, create_time_slots
+from migrations import ensure_schema
+
+
+def build_special_time_batch(changes: List, user_info: dict = None):
+    """특수 시간 일괄 저장용 (저장 항목, 로그 항목) 구성
+
+    changes: [(업체명, 법인명, 시간대, 이전 여부, 새 여부), ...]
+    """
+    items = []
+    logs = []
+    for company, corp_name, time_slot, old_colored, is_colored in changes:
+        items.append((company, corp_name, time_slot, is_colored))
+        if old_colored != is_colored and user_info:
+            logs.append((
+                "특수시간", company, corp_name, time_slot,
+                "색상 ON" if is_colored else "색상 OFF",
+                "ON" if old_colored else "OFF",
+                "ON" if is_colored else "OFF",
+                user_info.get('id'), user_info.get('username'), user_info.get('display_name')
+            ))
+    return items, logs
+
+
+def seed_default_special_times(db, work_date, slots: List, base_minutes: Dict, user_info: dict = None) -> bool:
+    """기본 특수 시간 일괄 생성 + 요약 로그 1건 기록 (하나의 트랜잭션, 작업 스레드에서도 사용)
+
+    slots: [(업체명, 법인명, 시간대), ...] - 기본 업무 시간 범위의 셀
+    """
+    with db.transaction() as tx:
+        inserted = db.materialize_special_times(work_date, slots, base_minutes)
+
+        if inserted > 0 and user_info:
+            corp_count = len({(company, corp_name) for company, corp_name, _ in slots})
+            db.add_change_log(
+                log_type="특수시간",
+                work_date=work_date,
+                company=None,
+                corp_name=None,
+                time_slot=None,
+                action="기본값 초기화",
+                old_value="OFF",
+                new_value=f"ON {inserted}개 시간대 ({corp_count}개 업체+법인)",
+                user_id=user_info.get('id'),
+                username=user_info.get('username'),
+                display_name=user_info.get('display_name')
+            )
+    return tx.ok
 
 
 class TimeTableManager:
     """견우물류 업무 타임테이블 관리 클래스 (DB 연동)"""
 
+    # 기본 업무 템플릿 캐시를 서버와 다시 확인하기까지의 시간 (초)
+    DEFAULT_TASKS_TTL = 30
+
+    # 날짜 이동 캐시에 보관할 날짜 수 (가장 오래 안 본 날짜부터 제거)
+    DAY_CACHE_SIZE = 7
+
     def __init__(self):
-        self.db = Database()
+        self.db = create_database()
         self.current_date = date.today()
         self.time_slots = self.create_time_slots()
         self.timetable = {}
 
-        # 데이터베이스 연결 및 테이블 생성
+        # 기본 업무 템플릿 캐시 (변경 확인 토큰이 같으면 다시 조회하지 않음)
+        self._default_tasks = None
+        self._default_tasks_version = None
+        self._default_tasks_checked_at = 0.0
+        self._template_index = None
+        self._template_index_source = None  # 인덱스를 만든 캐시 객체 (바뀌면 다시 생성)
+
+        # 현재 날짜의 특수 시간 모델: (업체명, 법인명) -> 비트마스크 (bit i = time_slots[i])
+        self.special_masks = {}
+
+        # 날짜 이동 캐시: 날짜 -> (변경 확인 토큰, 업무, 특수 시간)
+        self._day_cache = OrderedDict()
+        self._day_generations = {}  # 날짜별 로컬 변경 횟수 (조회 도중 바뀐 결과는 캐시에 넣지 않음)
+
+        # 로컬 복제본 (온라인: 조회 결과 보관, 오프라인: self.db 대신 사용)
+        self.replica = LocalReplica()
+        self.offline = False
+
+        # 데이터베이스 연결 및 스키마 확인 (최신 버전이 아니면 마이그레이션, 없는 인덱스 생성)
         if self.db.connect():
-            self.db.create_table()
-            self.db.create_change_log_table()  # 변경 로그 테이블 생성
-            self.db.create_special_time_reasons_table()  # 특수 시간 변동 사유 테이블 생성
+            ensure_schema(self.db)
+            self.replica.connect()
+        elif self.replica.connect() and self.replica.has_data():
+            # 서버에 연결할 수 없으면 로컬 복제본으로 시작 (조회 + 특수 시간 저장 대기)
+            self.db = self.replica
+            self.offline = True
         else:
             raise Exception("데이터베이스 연결 실패")
 
+    def go_online(self) -> bool:
+        """서버 재연결 후 온라인 모드로 전환 (대기열 반영은 호출 측에서 먼저)"""
+        db = create_database()
+        if not db.connect():
+            return False
+        ensure_schema(db)
+        self.db = db
+        self.offline = False
+        self.invalidate_default_tasks()
+        self._day_cache.clear()
+        return True
+
     def create_time_slots(self) -> List[str]:
         """08:30 ~ 24:00까지 30분 단위 시간 슬롯 생성"""
-        time_slots = []
-        # 8시 30분부터 시작
-        time_slots.append("08:30")
-        for hour in range(9, 25):  # 9시부터 24시(자정)까지
-            time_slots.append(f"{hour:02d}:00")
-            if hour < 24:  # 24:30은 제외
-                time_slots.append(f"{hour:02d}:30")
-        return time_slots
-
-    def set_current_date(self, work_date: date):
-        """작업 날짜 설정"""
+        return create_time_slots()
+
+    def set_current_date(self, work_date: date, tasks: Dict = None):
+        """작업 날짜 설정 (tasks: 이미 조회한 업무가 있으면 다시 조회하지 않음)"""
         self.current_date = work_date
-        self.load_data_by_date(work_date)
+        if tasks is None:
+            self.load_data_by_date(work_date)
+        else:
+            self.timetable = tasks
+
+    # === 날짜 이동 캐시 ===
+
+    def get_cached_day(self, work_date: date):
+        """캐시된 날짜 스냅샷 (토큰, 업무, 특수 시간) - 없으면 None
+
+        업무는 add_task/remove_task가 수정하므로 복사본을 반환
+        """
+        snapshot = self._day_cache.get(work_date)
+        if snapshot is None:
+            return None
+        self._day_cache.move_to_end(work_date)
+        token, tasks, day_special_times = snapshot
+        return token, dict(tasks), day_special_times
+
+    def has_cached_day(self, work_date: date) -> bool:
+        return work_date in self._day_cache
+
+    def day_generation(self, work_date: date) -> int:
+        """조회 시작 전에 받아 두었다가 cache_day에 넘김"""
+        return self._day_generations.get(work_date, 0)
+
+    def cache_day(self, work_date: date, token, tasks: Dict, day_special_times: Dict, generation: int = None):
+        """날짜 스냅샷 저장 (조회 도중 로컬 변경이 있었거나 토큰이 없으면 저장하지 않음)"""
+        if token is None:
+            return
+        if generation is not None and generation != self.day_generation(work_date):
+            return
+        self._day_cache[work_date] = (token, dict(tasks), day_special_times)
+        self._day_cache.move_to_end(work_date)
+        while len(self._day_cache) > self.DAY_CACHE_SIZE:
+            self._day_cache.popitem(last=False)
+
+    def invalidate_day(self, work_date: date = None):
+        """날짜 스냅샷 삭제 (로컬에서 저장할 때마다 호출, work_date가 없으면 현재 날짜)"""
+        work_date = work_date or self.current_date
+        self._day_cache.pop(work_date, None)
+        self._day_generations[work_date] = self.day_generation(work_date) + 1
 
     def load_data_by_date(self, work_date: date):
         """특정 날짜의 데이터 불러오기"""
@@ -47,6 +171,7 @@ class TimeTableManager:
         if time_slot not in self.time_slots:
             return False
 
+        self.invalidate_day()
         success = self.db.insert_or_update_task(
             self.current_date,
             time_slot,
@@ -70,6 +195,7 @@ class TimeTableManager:
 
     def remove_task(self, time_slot: str) -> bool:
         """특정 시간대의 업무 삭제"""
+        self.invalidate_day()
         success = self.db.delete_task(self.current_date, time_slot)
 
         if success and time_slot in self.timetable:
@@ -91,6 +217,7 @@ class TimeTableManager:
 
     def copy_tasks_to_date(self, source_date: date, target_date: date) -> bool:
         """특정 날짜의 업무를 다른 날짜로 복사"""
+        self.invalidate_day(target_date)
         return self.db.copy_tasks_to_date(source_date, target_date)
 
     def export_to_excel(self, filename=None):
@@ -134,21 +261,80 @@ class TimeTableManager:
     # === 기본 업무 템플릿 관련 메서드 ===
 
     def get_default_tasks(self) -> Dict:
-        """기본 업무 템플릿 조회"""
-        return self.db.get_default_tasks()
+        """기본 업무 템플릿 조회 (캐시)
+
+        TTL 안에서는 DB 조회 없이 캐시를 반환하고, TTL이 지나면 변경 확인 토큰만 조회해서
+        달라졌을 때만 전체를 다시 불러옴
+        """
+        now = time.monotonic()
+        if self._default_tasks is not None:
+            if now - self._default_tasks_checked_at < self.DEFAULT_TASKS_TTL:
+                return self._copy_default_tasks()
+            version = self.db.get_default_tasks_version()
+            if version is not None and version == self._default_tasks_version:
+                self._default_tasks_checked_at = now
+                return self._copy_default_tasks()
+
+        # 토큰을 먼저 조회 (조회 사이에 변경되면 다음 확인 때 다시 불러오도록)
+        version = self.db.get_default_tasks_version()
+        tasks = self.db.get_default_tasks()
+        if version is not None:
+            if not self.offline and self.replica.connection:
+                self.replica.store_default_tasks(tasks, version)
+            self._default_tasks = tasks
+            self._default_tasks_version = version
+            self._default_tasks_checked_at = now
+            return self._copy_default_tasks()
+        return tasks
+
+    def get_template_index(self) -> TemplateIndex:
+        """기본 업무 템플릿 인덱스 (템플릿이 바뀔 때만 다시 생성)"""
+        default_tasks = self.get_default_tasks()
+        if self._default_tasks is None:
+            # 캐시를 사용할 수 없으면 매번 생성
+            return TemplateIndex(default_tasks, self.time_slots)
+        if self._template_index is None or self._template_index_source is not self._default_tasks:
+            self._template_index = TemplateIndex(default_tasks, self.time_slots)
+            self._template_index_source = self._default_tasks
+        return self._template_index
+
+    def base_minutes_for(self, keys) -> Dict:
+        """(업체명, 법인명)별 기본 업무 시간(분) - 일별 추가 시간 집계 갱신용"""
+        template = self._template_index or self.get_template_index()
+        return {key: template.base_minutes.get(key, 0) for key in keys}
+
+    def _copy_default_tasks(self) -> Dict:
+        # 호출 측에서 수정해도 캐시가 바뀌지 않도록 복사본 반환
+        return {order: dict(info) for order, info in self._default_tasks.items()}
+
+    def invalidate_default_tasks(self):
+        """기본 업무 템플릿 캐시 무효화"""
+        self._default_tasks = None
+        self._default_tasks_version = None
 
     def add_default_task(self, time_slot: str, task_name: str, description: str = "", company: str = "", end_time: str = "", display_order: int = None, color: str = "") -> bool:
         """기본 업무 템플릿 추가 (업체명, 종료시간, 표시순서, 색상 포함)"""
         if time_slot not in self.time_slots:
             return False
+        self.invalidate_default_tasks()
         return self.db.insert_or_update_default_task(time_slot, task_name, description, company, end_time, display_order, color)
 
+    def insert_default_task(self, display_order: int, time_slot: str, task_name: str, description: str = "",
+                            company: str = "", end_time: str = "", color: str = "") -> bool:
+        """기본 업무 템플릿을 지정한 표시 순서에 삽입 (이후 항목은 순서가 1씩 밀림)"""
+        if time_slot not in self.time_slots:
+            return False
+        self.invalidate_default_tasks()
+        return self.db.insert_default_task_at(display_order, time_slot, task_name, description, company, end_time, color)
+
     def remove_default_task(self, display_order: int) -> bool:
         """기본 업무 템플릿 삭제 (표시순서 기준)"""
+        self.invalidate_default_tasks()
         return self.db.delete_default_task(display_order)
 
     def apply_default_tasks(self) -> bool:
         """현재 날짜에 기본 업무 적용"""
+        self.invalidate_day()
         success = self.db.apply_default_tasks_to_date(self.current_date)
         if success:
             # 데이터 다시 불러오기
@@ -157,51 +343,136 @@ class TimeTableManager:
 
     def save_special_time(self, company: str, corp_name: str, time_slot: str, is_colored: bool,
                           user_info: dict = None) -> bool:
-        """특수 시간 저장 (업체명, 법인명 조합) + 로그 기록"""
-        # 이전 상태 조회
-        old_value = "OFF"
-        special_times = self.db.get_special_times(self.current_date, company, corp_name)
-        if special_times.get(time_slot, False):
-            old_value = "ON"
-
-        new_value = "ON" if is_colored else "OFF"
-
-        # 상태가 변경된 경우에만 로그 기록
-        if old_value != new_value and user_info:
-            action = "색상 ON" if is_colored else "색상 OFF"
-            self.db.add_change_log(
-                log_type="특수시간",
-                work_date=self.current_date,
-                company=company,
-                corp_name=corp_name,
-                time_slot=time_slot,
-                action=action,
-                old_value=old_value,
-                new_value=new_value,
-                user_id=user_info.get('id'),
-                username=user_info.get('username'),
-                display_name=user_info.get('display_name')
-            )
-
-        return self.db.save_special_time(self.current_date, company, corp_name, time_slot, is_colored)
+        """특수 시간 저장 (업체명, 법인명 조합) + 로그 기록 (하나의 트랜잭션)"""
+        base_minutes = self.base_minutes_for([(company, corp_name)])[(company, corp_name)]
+        self.invalidate_day()
+        with self.db.transaction() as tx:
+            # 이전 상태 조회
+            old_value = "OFF"
+            special_times = self.db.get_special_times(self.current_date, company, corp_name)
+            if special_times.get(time_slot, False):
+                old_value = "ON"
+
+            new_value = "ON" if is_colored else "OFF"
+
+            # 상태가 변경된 경우에만 로그 기록
+            if old_value != new_value and user_info:
+                action = "색상 ON" if is_colored else "색상 OFF"
+                self.db.add_change_log(
+                    log_type="특수시간",
+                    work_date=self.current_date,
+                    company=company,
+                    corp_name=corp_name,
+                    time_slot=time_slot,
+                    action=action,
+                    old_value=old_value,
+                    new_value=new_value,
+                    user_id=user_info.get('id'),
+                    username=user_info.get('username'),
+                    display_name=user_info.get('display_name')
+                )
+
+            self.db.save_special_time(self.current_date, company, corp_name, time_slot, is_colored, base_minutes)
+        return tx.ok
+
+    def save_special_times_batch(self, work_date, changes: List, user_info: dict = None) -> bool:
+        """특수 시간 여러 건 저장 (쓰기 버퍼용) + 변경된 셀마다 로그 기록
+
+        changes: [(업체명, 법인명, 시간대, 이전 여부, 새 여부), ...]
+        """
+        items, logs = build_special_time_batch(changes, user_info)
+        if not items:
+            return True
+        base_minutes = self.base_minutes_for({(company, corp_name) for company, corp_name, *_ in changes})
+        self.invalidate_day(work_date)
+        outcomes = self.db.save_special_times_bulk(work_date, items, logs, base_minutes)
+        return "failed" not in outcomes
+
+    def materialize_default_special_times(self, slots: List, user_info: dict = None) -> bool:
+        """현재 날짜의 기본 특수 시간 일괄 생성 + 요약 로그 1건 기록 (하나의 트랜잭션)
+
+        slots: [(업체명, 법인명, 시간대), ...] - 기본 업무 시간 범위의 셀
+        """
+        self.invalidate_day()
+        return seed_default_special_times(self.db, self.current_date, slots, self.base_minutes_for_slots(slots),
+                                          user_info)
+
+    def base_minutes_for_slots(self, slots: List) -> Dict:
+        """[(업체명, 법인명, 시간대), ...]에 포함된 (업체명, 법인명)별 기본 업무 시간(분)"""
+        return self.base_minutes_for({(company, corp_name) for company, corp_name, _ in slots})
 
     def get_special_times(self, company: str, corp_name: str) -> Dict:
         """특수 시간 조회 (업체명, 법인명 조합)"""
         return self.db.get_special_times(self.current_date, company, corp_name)
 
+    def get_day_special_times(self) -> Dict:
+        """현재 날짜의 전체 특수 시간 조회 (1회 조회) - {(업체명, 법인명): {시간대: 여부}}"""
+        return self.db.get_special_times_for_date(self.current_date)
+
+    def load_special_masks(self, day_special_times: Dict, template: TemplateIndex):
+        """현재 날짜의 특수 시간 모델 구성 (DB 데이터가 없는 업체+법인명은 기본 업무 시간으로)"""
+        masks = {}
+        for key in template.corps:
+            special_times = day_special_times.get(key)
+            if special_times is None:
+                masks[key] = template.coverage[key]
+            else:
+                masks[key] = template.slots_to_mask(special_times)
+        self.special_masks = masks
+
+    def is_special_slot(self, key, slot_idx: int) -> bool:
+        """특수 시간 모델에서 해당 시간대가 켜져 있는지"""
+        return bool(self.special_masks.get(key, 0) >> slot_idx & 1)
+
+    def set_special_slot(self, key, slot_idx: int, is_colored: bool):
+        """특수 시간 모델 갱신 (DB 저장은 별도)"""
+        if is_colored:
+            self.special_masks[key] = self.special_masks.get(key, 0) | (1 << slot_idx)
+        else:
+            self.special_masks[key] = self.special_masks.get(key, 0) & ~(1 << slot_idx)
+
+    def get_extra_minutes(self, key, template: TemplateIndex) -> int:
+        """추가 시간(분) = 특수 시간 - 기본 업무 시간"""
+        return count_slots(self.special_masks.get(key, 0)) * 30 - template.base_minutes.get(key, 0)
+
+    @staticmethod
+    def summarize_period(daily_extra: Dict, template: TemplateIndex, total_days: int) -> Dict:
+        """기간 법인별 추가 시간 합계 (분) - 법인명이 없는 업체는 제외
+
+        daily_extra: get_daily_extra_by_period() 결과 (일별 집계 행)
+        집계 행이 없는 날은 특수 시간 0 (추가 시간 = -기본 시간)으로 계산
+        """
+        extra_sums = {}  # (업체명, 법인명) -> (집계된 날 추가 시간 합계, 집계된 날 수)
+        for (work_date, company, corp_name), extra_minutes in daily_extra.items():
+            total, days = extra_sums.get((company, corp_name), (0, 0))
+            extra_sums[(company, corp_name)] = (total + extra_minutes, days + 1)
+
+        corp_totals = {}
+        for key in template.corps:
+            corp_name = key[1]
+            if not corp_name:
+                continue
+            total, days = extra_sums.get(key, (0, 0))
+            extra_minutes = total - template.base_minutes[key] * (total_days - days)
+            corp_totals[corp_name] = corp_totals.get(corp_name, 0) + extra_minutes
+        return corp_totals
+
     def delete_special_times(self, company: str, corp_name: str) -> bool:
         """특수 시간 삭제 (업체명, 법인명 조합)"""
+        self.invalidate_day()
         return self.db.delete_special_times_by_date(self.current_date, company, corp_name)
 
     def update_display_order(self, time_slot: str, display_order: int) -> bool:
         """기본 업무 템플릿의 표시 순서 업데이트"""
+        self.invalidate_default_tasks()
         return self.db.update_display_order(time_slot, display_order)
 
     def get_change_logs(self, start_date=None, end_date=None, log_type=None,
-                        company=None, username=None, limit=500):
-        """변경 로그 조회"""
-        return self.db.get_change_logs(start_date, end_date, log_type, company, username, limit)
+                        company=None, username=None, limit=500, before=None):
+        """변경 로그 조회 (before: 이전 페이지 마지막 행의 (created_at, id))"""
+        return self.db.get_change_logs(start_date, end_date, log_type, company, username, limit, before)
 
     def close(self):
         """데이터베이스 연결 종료"""
         self.db.disconnect()
+        self.replica.disconnect()